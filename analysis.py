@@ -0,0 +1,85 @@
+"""
+Exact win probabilities for MultiRoundBattle matchups.
+
+Every attack is deterministic except the rogue crit (a 3-in-10 chance of
+double damage), so instead of sampling thousands of battles we can push
+the probability of every (health1, health2) state forward one round at a
+time. The answer is exact (up to float rounding) and is cached per stat
+tuple, so asking about the same matchup again is just a dictionary lookup.
+"""
+
+from collections import namedtuple
+from functools import lru_cache
+
+from batch_combat import attack_rule
+
+MatchupOdds = namedtuple("MatchupOdds", "win tie loss")
+
+
+def _hit(health, damage, crit_chance):
+    """
+    Return the possible (health after the hit, probability) outcomes of one attack.
+    crit_chance is out of 10, like Rogue.attack's randint(1, 10) <= 3 roll.
+    """
+    if crit_chance == 0:
+        return ((max(0, health - damage), 1.0),)
+    crit = crit_chance / 10
+    return ((max(0, health - damage), 1.0 - crit),
+            (max(0, health - 2 * damage), crit))
+
+
+@lru_cache(maxsize=None)
+def outcome_odds(health1, damage1, crit1, health2, damage2, crit2, max_rounds=100):
+    """
+    Exact MatchupOdds for char1 in a MultiRoundBattle described by stats.
+
+    damage is the attack damage before crits and crit is the crit chance
+    out of 10. Each round char1 attacks first and char2 answers if it is
+    still standing; after max_rounds the healthier side wins.
+    """
+    win = loss = 0.0
+    states = {(health1, health2): 1.0}
+    for _ in range(max_rounds):
+        next_states = {}
+        for (h1, h2), probability in states.items():
+            for new_h2, p1 in _hit(h2, damage1, crit1):
+                if new_h2 == 0:
+                    win += probability * p1
+                    continue
+                for new_h1, p2 in _hit(h1, damage2, crit2):
+                    p = probability * p1 * p2
+                    if new_h1 == 0:
+                        loss += p
+                    else:
+                        key = (new_h1, new_h2)
+                        next_states[key] = next_states.get(key, 0.0) + p
+        states = next_states
+        if not states:
+            break
+
+    # Whatever is left hit the round cap and is decided by remaining health.
+    tie = 0.0
+    for (h1, h2), probability in states.items():
+        if h1 > h2:
+            win += probability
+        elif h2 > h1:
+            loss += probability
+        else:
+            tie += probability
+    return MatchupOdds(win, tie, loss)
+
+
+def attack_stats(character):
+    """Return the (damage, crit chance) a character's attack() uses"""
+    return character.attack_damage, attack_rule(type(character))[2]
+
+
+def matchup_odds(character1, character2, max_rounds=100):
+    """
+    Exact MatchupOdds for character1 in MultiRoundBattle(character1, character2).
+    The characters themselves are not changed.
+    """
+    damage1, crit1 = attack_stats(character1)
+    damage2, crit2 = attack_stats(character2)
+    return outcome_odds(character1.health, damage1, crit1,
+                        character2.health, damage2, crit2, max_rounds)
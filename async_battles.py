@@ -0,0 +1,133 @@
+"""
+Asyncio battle scheduler.
+
+Runs many MultiRoundBattle fights as coroutines on one event loop. Each
+fight yields to the loop after every round, so thousands of fights (and
+whatever network I/O the service is doing) interleave without a thread per
+fight. A semaphore caps how many fights are active at once, and per-round
+events are streamed to any number of async subscribers (as well as to the
+battle's own sink, if it has one).
+"""
+
+import asyncio
+from array import array
+from itertools import count
+
+from battle_engine import BattleReport
+
+
+def _both(first, second):
+    """Return an emit that sends every event to first and then second"""
+    def emit(event):
+        first(event)
+        second(event)
+    return emit
+
+
+class Subscription:
+    """
+    Async iterator over (battle id, event) pairs from a BattleScheduler.
+    Iteration ends when the scheduler is closed.
+    """
+
+    def __init__(self, maxsize):
+        self.queue = asyncio.Queue(maxsize)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        item = await self.queue.get()
+        if item is None:
+            raise StopAsyncIteration
+        return item
+
+
+class BattleScheduler:
+    """
+    Runs battles as coroutines with a limit on how many are active at once.
+
+    Subscriber queues are bounded (queue_size), so a slow consumer slows the
+    battles down instead of letting events pile up in memory.
+    """
+
+    def __init__(self, max_active=1000, queue_size=1000):
+        self.max_active = max_active
+        self.queue_size = queue_size
+        self._slots = asyncio.Semaphore(max_active)
+        self._subscribers = []
+        self._ids = count(1)
+        self._tasks = set()
+
+    def subscribe(self):
+        """Return a Subscription that receives every event from now on"""
+        subscription = Subscription(self.queue_size)
+        self._subscribers.append(subscription)
+        return subscription
+
+    async def _publish(self, battle_id, events):
+        for subscription in self._subscribers:
+            for event in events:
+                await subscription.queue.put((battle_id, event))
+        events.clear()
+
+    async def fight(self, battle, battle_id=None):
+        """
+        Run a MultiRoundBattle to the end, yielding after every round.
+        Waits for a free slot first. Returns the BattleReport.
+        """
+        async with self._slots:
+            return await self._fight(battle, battle_id)
+
+    async def start(self, battle, battle_id=None):
+        """
+        Wait for a free slot, then start the battle as a background task.
+
+        Because this waits *before* creating the task, a producer looping
+        over start() is held back whenever max_active fights are running.
+        Returns the task; its result is the BattleReport.
+        """
+        await self._slots.acquire()
+        task = asyncio.ensure_future(self._fight_and_release(battle, battle_id))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def _fight_and_release(self, battle, battle_id):
+        try:
+            return await self._fight(battle, battle_id)
+        finally:
+            self._slots.release()
+
+    async def _fight(self, battle, battle_id):
+        if battle_id is None:
+            battle_id = next(self._ids)
+        events = []
+        emit = events.append if self._subscribers else None
+        if battle.sink is not None:
+            emit = _both(battle.sink.emit, emit) if emit is not None else battle.sink.emit
+        damage1 = array("i")
+        damage2 = array("i")
+
+        rounds = 0
+        for rounds in battle.play_rounds(emit, damage1, damage2):
+            if events:
+                await self._publish(battle_id, events)
+            # Let other fights (and I/O) run before the next round.
+            await asyncio.sleep(0)
+        winner = battle.report_result(emit)
+        if events:
+            await self._publish(battle_id, events)
+        return BattleReport(rounds, winner, damage1, damage2)
+
+    async def run_all(self, battles):
+        """Run every battle, at most max_active at a time. Returns the reports in order"""
+        tasks = [await self.start(battle) for battle in battles]
+        return await asyncio.gather(*tasks)
+
+    async def close(self):
+        """Wait for running battles to finish, then end every subscription"""
+        if self._tasks:
+            await asyncio.gather(*self._tasks)
+        for subscription in self._subscribers:
+            await subscription.queue.put(None)
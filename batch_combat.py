@@ -0,0 +1,143 @@
+"""
+Batch attack resolution.
+
+resolve_attacks() works out a whole list of attacker -> target hits in one
+pass instead of calling attacker.attack(target) (and printing) once per
+pair. The damage rules below mirror the attack() methods in
+project2_starter, so a batch gives exactly the same health totals as
+running the per-object attacks one after another.
+"""
+
+import random
+
+from project2_starter import Character, Warrior, Mage, Rogue
+
+# (stat used, flat bonus, crit chance out of 10) for each class's attack().
+# A crit doubles the damage, just like Rogue.attack. The stat and bonus give
+# the weapon-less damage (base_attack_damage), which is what the roster path
+# needs; real objects use their precomputed attack_damage, weapon included.
+ATTACK_RULES = {
+    Character: ("strength", 0, 0),
+    Warrior: ("strength", 5, 0),
+    Mage: ("magic", 0, 0),
+    Rogue: ("strength", 0, 3),
+}
+
+_rule_cache = {}
+
+_take_damage = Character.take_damage
+
+
+def attack_rule(cls):
+    """
+    Return the (stat, bonus, crit chance) rule for a Character class.
+
+    Subclasses (like roster views) share their parent's rule as long as
+    they don't override attack(); a class with its own attack() can't be
+    batched because we'd have no idea what it does.
+    """
+    rule = _rule_cache.get(cls)
+    if rule is None:
+        for base in cls.__mro__:
+            if base in ATTACK_RULES:
+                if cls.attack is not base.attack:
+                    raise TypeError(f"{cls.__name__} overrides attack(), so it has no batch rule")
+                rule = ATTACK_RULES[base]
+                break
+        else:
+            raise TypeError(f"{cls.__name__} is not a Character class")
+        _rule_cache[cls] = rule
+    return rule
+
+
+def attack_damages(attackers, rng=random):
+    """
+    Work out the damage each attacker's attack() would deal, without applying it.
+    Crit rolls are taken from rng in attacker order (one per rogue).
+    """
+    rules = [attack_rule(type(attacker)) for attacker in attackers]
+    damages = [attacker.attack_damage for attacker in attackers]
+    critters = [i for i, rule in enumerate(rules) if rule[2]]
+    for i, roll in zip(critters, _d10_rolls(rng, len(critters))):
+        if roll <= rules[i][2]:
+            damages[i] *= 2
+    return damages
+
+
+def _d10_rolls(rng, count):
+    """Take `count` d10 rolls, in one block if the rng supports it (rng.BlockRNG)"""
+    if hasattr(rng, "rolls"):
+        return rng.rolls(count)
+    return [rng.randint(1, 10) for _ in range(count)]
+
+
+def apply_damages(targets, damages):
+    """
+    Apply a list of damages to their targets with take_damage's clamp-at-zero rule.
+
+    Hits on the same target are added up first and applied once; since
+    damage is never negative this gives the same health as applying them
+    one at a time. That shortcut only holds for Character.take_damage:
+    targets whose class overrides take_damage (armour, shields, ...) get
+    every hit through their own take_damage, one at a time and in order.
+    """
+    totals = {}
+    for target, damage in zip(targets, damages):
+        if type(target).take_damage is not _take_damage:
+            target.take_damage(damage)
+            continue
+        key = id(target)
+        if key in totals:
+            totals[key][1] += damage
+        else:
+            totals[key] = [target, damage]
+    for target, total in totals.values():
+        target.health = max(0, target.health - total)
+
+
+def resolve_attacks(attackers, targets, rng=random):
+    """
+    Resolve attackers[i].attack(targets[i]) for every pair, silently.
+    Returns the list of damages dealt.
+    """
+    if len(attackers) != len(targets):
+        raise ValueError("attackers and targets must be the same length")
+    damages = attack_damages(attackers, rng)
+    apply_damages(targets, damages)
+    return damages
+
+
+def resolve_roster_attacks(roster, attacker_indices, target_indices, rng=random):
+    """
+    Same as resolve_attacks(), but for characters stored in a CharacterRoster.
+
+    Works straight on the roster's columns using indexes, so no view
+    objects are created at all. Returns the list of damages dealt.
+    """
+    if len(attacker_indices) != len(target_indices):
+        raise ValueError("attacker_indices and target_indices must be the same length")
+    columns = roster._columns
+    kind_rules = [attack_rule(cls) for cls in roster._classes]
+    kinds = roster._kinds
+
+    rules = [kind_rules[kinds[i]] for i in attacker_indices]
+    damages = [columns[stat][i] + bonus
+               for i, (stat, bonus, crit) in zip(attacker_indices, rules)]
+    critters = [n for n, rule in enumerate(rules) if rule[2]]
+    for n, roll in zip(critters, _d10_rolls(rng, len(critters))):
+        if roll <= rules[n][2]:
+            damages[n] *= 2
+
+    # Classes that override take_damage get each hit through a view, as in
+    # apply_damages(); everyone else is summed and clamped on the column.
+    custom = [cls.take_damage is not _take_damage for cls in roster._classes]
+    totals = {}
+    for i, damage in zip(target_indices, damages):
+        if custom[kinds[i]]:
+            roster[i].take_damage(damage)
+        else:
+            totals[i] = totals.get(i, 0) + damage
+    health = columns["health"]
+    for i, total in totals.items():
+        health[i] = max(0, health[i] - total)
+    return damages
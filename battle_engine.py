@@ -0,0 +1,213 @@
+"""
+Headless battle engine.
+
+HeadlessBattle runs the same sequence as SimpleBattle.fight, but instead
+of printing it sends small event records to a sink. With no sink nothing
+is built or formatted at all; PrintSink turns the events back into text
+for when someone actually wants to read the fight.
+"""
+
+import random
+from array import array
+from collections import namedtuple
+
+from project2_starter import SimpleBattle, Player, player_stats_line, stats_line
+from batch_combat import attack_rule
+
+# One record type per thing that happens in a battle.
+StatsEvent = namedtuple("StatsEvent", "phase name health strength magic character_class level experience")
+AttackEvent = namedtuple("AttackEvent", "round attacker target damage critical")
+DamageEvent = namedtuple("DamageEvent", "round target damage health")
+ResultEvent = namedtuple("ResultEvent", "winner loser tie")
+
+# Summary of a multi-round battle. damage1/damage2 are arrays holding the
+# damage char1/char2 dealt in each round (index 0 is round 1).
+BattleReport = namedtuple("BattleReport", "rounds winner damage1 damage2")
+
+
+def stats_event(phase, character):
+    """Build a StatsEvent snapshot of a character ("start" or "end" phase)"""
+    if isinstance(character, Player):
+        return StatsEvent(phase, character.name, character.health, character.strength,
+                          character.magic, character.character_class,
+                          character.level, character.experience)
+    return StatsEvent(phase, character.name, character.health, character.strength,
+                      character.magic, None, None, None)
+
+
+class ListSink:
+    """
+    Sink that keeps every event in a list.
+    """
+
+    def __init__(self):
+        self.events = []
+
+    def emit(self, event):
+        self.events.append(event)
+
+
+class PrintSink:
+    """
+    Sink that prints events as text, one line per event.
+
+    Stats come out exactly as display_stats prints them. Attacks are one
+    "Round N: ..." line each, followed by the damage taken, and the result
+    is announced like SimpleBattle does. SimpleBattle's headers and the
+    class-specific attack messages are not reproduced.
+    """
+
+    def __init__(self, write=print):
+        self.write = write
+
+    def emit(self, event):
+        write = self.write
+        if type(event) is StatsEvent:
+            write(stats_line(event.name, event.health, event.strength, event.magic))
+            if event.character_class is not None:
+                write(player_stats_line(event.character_class, event.level, event.experience))
+        elif type(event) is AttackEvent:
+            crit = " (critical hit!)" if event.critical else ""
+            write(f"Round {event.round}: {event.attacker} attacks {event.target} for {event.damage} damage{crit}")
+        elif type(event) is DamageEvent:
+            write(f"  {event.target} takes {event.damage} damage, health now {event.health}")
+        elif type(event) is ResultEvent:
+            if event.tie:
+                write("🤝 It's a tie!")
+            else:
+                write(f"🏆 {event.winner} wins!")
+
+
+def strike(attacker, target, round_number, emit, rng):
+    """
+    Resolve one silent attack: roll damage with the attacker's rule, apply
+    it with take_damage, and emit the events if there is a sink.
+    Returns the health the target actually lost.
+    """
+    crit_chance = attack_rule(type(attacker))[2]
+    damage = attacker.attack_damage
+    critical = bool(crit_chance) and rng.randint(1, 10) <= crit_chance
+    if critical:
+        damage *= 2
+    before = target.health
+    target.take_damage(damage)
+    lost = before - target.health
+    if emit is not None:
+        emit(AttackEvent(round_number, attacker.name, target.name, damage, critical))
+        emit(DamageEvent(round_number, target.name, lost, target.health))
+    return lost
+
+
+class HeadlessBattle(SimpleBattle):
+    """
+    SimpleBattle that reports through events instead of print().
+    """
+
+    def __init__(self, character1, character2, sink=None, rng=random):
+        super().__init__(character1, character2)
+        self.sink = sink
+        self.rng = rng
+
+    def fight(self):
+        """
+        Run one round exactly like SimpleBattle.fight.
+        Returns the winning character, or None for a tie.
+        """
+        char1, char2 = self.char1, self.char2
+        emit = self.sink.emit if self.sink is not None else None
+
+        if emit is not None:
+            emit(stats_event("start", char1))
+            emit(stats_event("start", char2))
+
+        strike(char1, char2, 1, emit, self.rng)
+        if char2.health > 0:
+            strike(char2, char1, 1, emit, self.rng)
+
+        if emit is not None:
+            emit(stats_event("end", char1))
+            emit(stats_event("end", char2))
+        return self.report_result(emit)
+
+    def report_result(self, emit):
+        """Decide the winner by remaining health (like SimpleBattle) and emit it"""
+        char1, char2 = self.char1, self.char2
+        if char1.health > char2.health:
+            winner, loser = char1, char2
+        elif char2.health > char1.health:
+            winner, loser = char2, char1
+        else:
+            winner = loser = None
+        if emit is not None:
+            if winner is None:
+                emit(ResultEvent(None, None, True))
+            else:
+                emit(ResultEvent(winner.name, loser.name, False))
+        return winner
+
+
+class MultiRoundBattle(HeadlessBattle):
+    """
+    HeadlessBattle that keeps fighting round after round.
+
+    Each round char1 attacks, then char2 answers if still standing. The
+    fight stops the moment either side reaches 0 health, or after
+    max_rounds, in which case the healthier side wins as in SimpleBattle.
+    """
+
+    def __init__(self, character1, character2, sink=None, rng=random, max_rounds=100):
+        super().__init__(character1, character2, sink, rng)
+        self.max_rounds = max_rounds
+
+    def play_round(self, round_number, emit, damage1, damage2):
+        """
+        Play one round, appending each side's damage to damage1/damage2.
+        Returns True once someone is down to 0 health.
+        """
+        char1, char2, rng = self.char1, self.char2, self.rng
+        damage1.append(strike(char1, char2, round_number, emit, rng))
+        if char2.health <= 0:
+            damage2.append(0)
+            return True
+        damage2.append(strike(char2, char1, round_number, emit, rng))
+        return char1.health <= 0
+
+    def play_rounds(self, emit, damage1, damage2, first_round=1):
+        """
+        The fight loop behind run(), as a generator: emits the start stats,
+        plays rounds from first_round on, yielding each round number after
+        the round is played, and emits the end stats once the fight is over.
+        Code that has to do something between rounds (yield to an event
+        loop, record a checkpoint) drives it; run() just exhausts it.
+        """
+        char1, char2 = self.char1, self.char2
+        if emit is not None:
+            emit(stats_event("start", char1))
+            emit(stats_event("start", char2))
+
+        rounds = first_round - 1
+        # Resuming after the deciding round must not play another one.
+        decided = first_round > 1 and (char1.health <= 0 or char2.health <= 0)
+        play_round = self.play_round
+        while not decided and rounds < self.max_rounds:
+            rounds += 1
+            decided = play_round(rounds, emit, damage1, damage2)
+            yield rounds
+
+        if emit is not None:
+            emit(stats_event("end", char1))
+            emit(stats_event("end", char2))
+
+    def run(self):
+        """Fight until someone falls or the round cap is hit. Returns a BattleReport"""
+        emit = self.sink.emit if self.sink is not None else None
+        damage1 = array("i")
+        damage2 = array("i")
+        rounds = 0
+        for rounds in self.play_rounds(emit, damage1, damage2):
+            pass
+        return BattleReport(rounds, self.report_result(emit), damage1, damage2)
+
+    def fight(self):
+        """Run the whole battle and return the winner (None for a tie)"""
+        return self.run().winner
@@ -0,0 +1,160 @@
+"""
+Streaming battle logs.
+
+BattleLogWriter is a sink (see battle_engine) that appends every event to a
+log file as one line of JSON (newline-delimited JSON). Lines are collected
+in memory and written in one bulk write whenever the buffer fills up, so
+logging a fight costs a list append per event rather than a system call.
+
+read_log() is a generator that reads a log back one line at a time and
+turns each line into the original event namedtuple, optionally filtering
+by battle, event type or any other condition. Memory use stays the same
+whether the log is a kilobyte or many gigabytes, and the events can be fed
+straight into another sink (for example PrintSink) to replay a fight.
+
+Each line is a JSON array: [battle id, event type, *event fields], e.g.
+
+    [7,"attack",3,"Marcus","Aria",20,false]
+"""
+
+import json
+
+from battle_engine import AttackEvent, DamageEvent, ResultEvent, StatsEvent
+
+# Event type names used in the log, and the namedtuple for each.
+EVENT_TYPES = {
+    "stats": StatsEvent,
+    "attack": AttackEvent,
+    "damage": DamageEvent,
+    "result": ResultEvent,
+}
+_TYPE_NAMES = {event_type: name for name, event_type in EVENT_TYPES.items()}
+
+# Default number of characters buffered before a bulk write.
+BUFFER_SIZE = 1 << 16
+
+_encode = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+
+
+class _BattleSink:
+    """
+    Sink that logs every event under one battle id.
+    """
+
+    __slots__ = ("writer", "battle_id")
+
+    def __init__(self, writer, battle_id):
+        self.writer = writer
+        self.battle_id = battle_id
+
+    def emit(self, event):
+        self.writer.write(self.battle_id, event)
+
+
+class BattleLogWriter:
+    """
+    Appends events to a newline-delimited JSON log.
+
+    `file` is a path (opened for appending) or an open text file. Use the
+    writer itself as the sink for a single battle, or for_battle(battle_id)
+    to log several battles into one file. Call close() (or use a `with`
+    block) so the last buffered lines are written.
+    """
+
+    def __init__(self, file, battle_id=0, buffer_size=BUFFER_SIZE):
+        if hasattr(file, "write"):
+            self._file = file
+            self._owns_file = False
+        else:
+            self._file = open(file, "a", encoding="utf-8")
+            self._owns_file = True
+        self.battle_id = battle_id
+        self.buffer_size = buffer_size
+        self._lines = []
+        self._buffered = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def for_battle(self, battle_id):
+        """Return a sink that logs into this file under battle_id"""
+        return _BattleSink(self, battle_id)
+
+    def emit(self, event):
+        """Sink method: log an event under this writer's battle_id"""
+        self.write(self.battle_id, event)
+
+    def write(self, battle_id, event):
+        """Buffer one event, writing the buffer out once it is full"""
+        line = _encode([battle_id, _TYPE_NAMES[type(event)], *event]) + "\n"
+        self._lines.append(line)
+        self._buffered += len(line)
+        if self._buffered >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        """Write every buffered line to the file in one call"""
+        if self._lines:
+            self._file.write("".join(self._lines))
+            self._lines = []
+            self._buffered = 0
+        self._file.flush()
+
+    def close(self):
+        """Flush, and close the file if the writer opened it"""
+        self.flush()
+        if self._owns_file:
+            self._file.close()
+
+
+def _lines(file):
+    if hasattr(file, "read"):
+        yield from file
+    else:
+        with open(file, encoding="utf-8") as f:
+            yield from f
+
+
+def read_log(file, battles=None, types=None, where=None):
+    """
+    Yield (battle id, event) pairs from a log, one line at a time.
+
+    `file` is a path or an open text file (so gzip.open(path, "rt") works
+    too). Only events from the battle ids in `battles`, of the namedtuple
+    types in `types`, and for which where(battle_id, event) is true are
+    yielded; each filter is skipped when it is None. Blank lines are ignored.
+    """
+    if battles is not None:
+        battles = set(battles)
+    if types is not None:
+        type_names = {_TYPE_NAMES[event_type] for event_type in types}
+    loads = json.loads
+    for line in _lines(file):
+        if not line.strip():
+            continue
+        battle_id, type_name, *fields = loads(line)
+        if battles is not None and battle_id not in battles:
+            continue
+        if types is not None and type_name not in type_names:
+            continue
+        event = EVENT_TYPES[type_name](*fields)
+        if where is not None and not where(battle_id, event):
+            continue
+        yield battle_id, event
+
+
+def replay(file, sink, battle_id=None):
+    """
+    Send the events of one battle (or every battle, if battle_id is None)
+    from a log to a sink, for example PrintSink() to print the fight again.
+    Returns the number of events replayed.
+    """
+    battles = None if battle_id is None else (battle_id,)
+    count = 0
+    for _, event in read_log(file, battles):
+        sink.emit(event)
+        count += 1
+    return count
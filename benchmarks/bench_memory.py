@@ -0,0 +1,142 @@
+"""
+Memory and construction benchmark for the character classes.
+
+Compares the __slots__-based classes in project2_starter against
+dict-backed copies of the same classes (how they were written before
+slots were added). Run from the repository root with:
+
+    python -m benchmarks.bench_memory
+"""
+
+import gc
+import timeit
+import tracemalloc
+
+from project2_starter import Warrior, Mage, Rogue, Weapon
+
+
+# ----------------------------------------------------------------------------
+# Dict-backed versions of the classes, used as the "before" measurement
+# ----------------------------------------------------------------------------
+
+class DictCharacter:
+    def __init__(self, name, health, strength, magic):
+        self.name = name
+        self.health = health
+        self.strength = strength
+        self.magic = magic
+
+
+# Same per-instance state as Player: the weapon and the precomputed damage
+# (worked out through the same kind of method calls).
+class DictPlayer(DictCharacter):
+    def __init__(self, name, character_class, health, strength, magic):
+        super().__init__(name, health, strength, magic)
+        self.character_class = character_class
+        self.level = 1
+        self.experience = 0
+        self.weapon = None
+        self.refresh_damage()
+
+    def base_attack_damage(self):
+        return self.strength
+
+    def base_special_damage(self):
+        return self.base_attack_damage()
+
+    def _compute_damage(self):
+        bonus = self.weapon.damage_bonus if self.weapon is not None else 0
+        return (self.base_attack_damage() + bonus,
+                self.base_special_damage() + bonus)
+
+    def refresh_damage(self):
+        self.attack_damage, self.special_damage = self._compute_damage()
+
+
+class DictWarrior(DictPlayer):
+    def __init__(self, name):
+        super().__init__(name, "Warrior", 120, 15, 5)
+
+    def base_attack_damage(self):
+        return self.strength + 5
+
+    def base_special_damage(self):
+        return self.strength * 2
+
+
+class DictMage(DictPlayer):
+    def __init__(self, name):
+        super().__init__(name, "Mage", 80, 8, 20)
+
+    def base_attack_damage(self):
+        return self.magic
+
+    def base_special_damage(self):
+        return self.magic + 10
+
+
+class DictRogue(DictPlayer):
+    def __init__(self, name):
+        super().__init__(name, "Rogue", 90, 12, 10)
+
+    def base_special_damage(self):
+        return self.strength * 2
+
+    def _compute_damage(self):
+        attack_damage = super()._compute_damage()[0]
+        return (attack_damage, attack_damage * 2)
+
+
+class DictWeapon:
+    def __init__(self, name, damage_bonus):
+        self.name = name
+        self.damage_bonus = damage_bonus
+
+
+PAIRS = [
+    ("Warrior", DictWarrior, Warrior, ()),
+    ("Mage", DictMage, Mage, ()),
+    ("Rogue", DictRogue, Rogue, ()),
+    ("Weapon", DictWeapon, Weapon, (10,)),
+]
+
+
+def bytes_per_instance(cls, extra_args, count=20000):
+    """Measure the average memory allocated per instance (not counting the names)"""
+    names = [f"Unit{i}" for i in range(count)]
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [cls(name, *extra_args) for name in names]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # The list holding the instances is not part of the per-object cost.
+    list_bytes = instances.__sizeof__()
+    return (after - before - list_bytes) / count
+
+
+def constructions_per_second(cls, extra_args, number=100000):
+    """Measure how many instances can be created per second"""
+    seconds = min(timeit.repeat(lambda: cls("Unit", *extra_args), number=number, repeat=3))
+    return number / seconds
+
+
+def run():
+    """Measure every class; returns a list of result dicts"""
+    results = []
+    for label, before_cls, after_cls, extra_args in PAIRS:
+        results.append({
+            "class": label,
+            "bytes_before": bytes_per_instance(before_cls, extra_args),
+            "bytes_after": bytes_per_instance(after_cls, extra_args),
+            "per_second_before": constructions_per_second(before_cls, extra_args),
+            "per_second_after": constructions_per_second(after_cls, extra_args),
+        })
+    return results
+
+
+if __name__ == "__main__":
+    print(f"{'Class':<10}{'bytes (dict)':>14}{'bytes (slots)':>15}{'new/s (dict)':>15}{'new/s (slots)':>15}")
+    for row in run():
+        print(f"{row['class']:<10}{row['bytes_before']:>14.1f}{row['bytes_after']:>15.1f}"
+              f"{row['per_second_before']:>15,.0f}{row['per_second_after']:>15,.0f}")
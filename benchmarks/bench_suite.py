@@ -0,0 +1,181 @@
+"""
+Benchmark suite for the hot paths in project2_starter.
+
+Measures operations per second for constructing characters and weapons,
+attacks and special abilities, take_damage, display_stats and a full
+SimpleBattle.fight. Results can be saved as JSON and compared against a
+stored baseline to catch performance regressions. Run from the repository
+root, for example:
+
+    python -m benchmarks.bench_suite --save bench.json
+    python -m benchmarks.bench_suite --baseline bench.json --tolerance 0.15
+
+Printing is sent to os.devnull unless --show-output is given, so the
+numbers measure the Python work rather than the terminal.
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import sys
+import timeit
+
+from project2_starter import Character, SimpleBattle, Warrior, Mage, Rogue, Weapon
+
+
+def _target():
+    # Enough health that the clamp never kicks in during a measurement.
+    return Character("Target", 10 ** 12, 0, 0)
+
+
+def _bench_attack(cls):
+    def setup():
+        attacker, target = cls("Attacker"), _target()
+        return lambda: attacker.attack(target)
+    return setup
+
+
+def _bench_special(cls, ability):
+    def setup():
+        attacker, target = cls("Attacker"), _target()
+        method = getattr(attacker, ability)
+        return lambda: method(target)
+    return setup
+
+
+def _bench_take_damage():
+    target = _target()
+    return lambda: target.take_damage(7)
+
+
+def _bench_display_stats():
+    warrior = Warrior("Display")
+    return warrior.display_stats
+
+
+def _bench_stats_text_changed():
+    # Health changes every call, so the cached text is rebuilt every time.
+    warrior = Warrior("Display")
+
+    def redraw():
+        warrior.health -= 1
+        return warrior.stats_text()
+    return redraw
+
+
+def _bench_battle():
+    return lambda: SimpleBattle(Warrior("W"), Mage("M")).fight()
+
+
+# name -> setup function returning the zero-argument callable to time
+BENCHMARKS = {
+    "construct.Warrior": lambda: lambda: Warrior("W"),
+    "construct.Mage": lambda: lambda: Mage("M"),
+    "construct.Rogue": lambda: lambda: Rogue("R"),
+    "construct.Weapon": lambda: lambda: Weapon("Iron Sword", 10),
+    "attack.Warrior": _bench_attack(Warrior),
+    "attack.Mage": _bench_attack(Mage),
+    "attack.Rogue": _bench_attack(Rogue),
+    "special.power_strike": _bench_special(Warrior, "power_strike"),
+    "special.fireball": _bench_special(Mage, "fireball"),
+    "special.sneak_attack": _bench_special(Rogue, "sneak_attack"),
+    "take_damage": _bench_take_damage,
+    "display_stats": _bench_display_stats,
+    "stats_text.cached": lambda: Warrior("Display").stats_text,
+    "stats_text.changed": _bench_stats_text_changed,
+    "battle.SimpleBattle.fight": _bench_battle,
+}
+
+
+def measure(func, min_time=0.2, repeat=3):
+    """Return the best operations-per-second for func over `repeat` runs"""
+    timer = timeit.Timer(func)
+    # Calibrate: grow the loop count until one run takes a measurable time,
+    # then scale it so each timed run lasts about min_time seconds.
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time / 10:
+            break
+        number *= 10
+    number = max(1, int(number * min_time / elapsed))
+    best = min(timer.repeat(repeat=repeat, number=number))
+    return number / best
+
+
+def run(names=None, silence=True, min_time=0.2, repeat=3):
+    """
+    Run the selected benchmarks (all of them by default).
+    Returns a report dict that can be saved as JSON.
+    """
+    names = list(BENCHMARKS) if names is None else names
+    results = {}
+    with contextlib.ExitStack() as stack:
+        if silence:
+            devnull = stack.enter_context(open(os.devnull, "w"))
+            stack.enter_context(contextlib.redirect_stdout(devnull))
+        for name in names:
+            results[name] = measure(BENCHMARKS[name](), min_time, repeat)
+    return {
+        "python": platform.python_version(),
+        "silenced": silence,
+        "results": results,
+    }
+
+
+def compare(report, baseline, tolerance=0.10):
+    """
+    Compare a report against a baseline report.
+
+    Returns a list of (name, baseline ops/s, current ops/s, ratio) for every
+    benchmark that got more than `tolerance` slower. Benchmarks missing
+    from either report are skipped.
+    """
+    regressions = []
+    for name, current in report["results"].items():
+        before = baseline["results"].get(name)
+        if before is None:
+            continue
+        ratio = current / before
+        if ratio < 1 - tolerance:
+            regressions.append((name, before, current, ratio))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the character classes")
+    parser.add_argument("names", nargs="*", help="benchmarks to run (default: all)")
+    parser.add_argument("--save", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="compare against this saved JSON file")
+    parser.add_argument("--tolerance", type=float, default=0.10,
+                        help="allowed slowdown before a benchmark counts as a regression")
+    parser.add_argument("--show-output", action="store_true",
+                        help="let the methods print instead of silencing stdout")
+    parser.add_argument("--min-time", type=float, default=0.2,
+                        help="approximate seconds per timing run")
+    args = parser.parse_args(argv)
+
+    report = run(args.names or None, silence=not args.show_output, min_time=args.min_time)
+    for name, ops in report["results"].items():
+        print(f"{name:<28}{ops:>16,.0f} ops/s")
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.tolerance)
+        for name, before, current, ratio in regressions:
+            print(f"REGRESSION {name}: {before:,.0f} -> {current:,.0f} ops/s ({ratio:.0%})")
+        if regressions:
+            return 1
+        print("No regressions.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,146 @@
+"""
+Opt-in instrumentation for the combat hot paths.
+
+Instrumentation.enable() swaps the chosen methods (attack, take_damage,
+the special abilities, SimpleBattle.fight, ...) for timing wrappers that
+count calls, add up time and fill a latency histogram for every
+(character class, method) pair. disable() puts the original functions
+back, so when instrumentation is off there is no wrapper left and no
+overhead at all.
+"""
+
+import json
+from time import perf_counter_ns
+
+from project2_starter import Character, SimpleBattle, Warrior, Mage, Rogue
+
+# (class that defines the method, method name) pairs instrumented by default.
+DEFAULT_TARGETS = (
+    (Character, "attack"),
+    (Character, "take_damage"),
+    (Warrior, "attack"),
+    (Warrior, "power_strike"),
+    (Mage, "attack"),
+    (Mage, "fireball"),
+    (Rogue, "attack"),
+    (Rogue, "sneak_attack"),
+    (SimpleBattle, "fight"),
+)
+
+# Histogram bucket i counts calls that took fewer than 2**i nanoseconds.
+HISTOGRAM_BUCKETS = 64
+
+
+class MethodStats:
+    """
+    Counters for one (class, method) pair.
+    """
+
+    __slots__ = ("calls", "total_ns", "max_ns", "histogram")
+
+    def __init__(self):
+        self.calls = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.histogram = [0] * HISTOGRAM_BUCKETS
+
+    def record(self, elapsed_ns):
+        self.calls += 1
+        self.total_ns += elapsed_ns
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+        self.histogram[min(elapsed_ns.bit_length(), HISTOGRAM_BUCKETS - 1)] += 1
+
+    def to_dict(self):
+        return {
+            "calls": self.calls,
+            "total_ns": self.total_ns,
+            "mean_ns": self.total_ns / self.calls if self.calls else 0.0,
+            "max_ns": self.max_ns,
+            # [upper bound in ns, count] for every bucket that has calls
+            "histogram": [[2 ** i, count] for i, count in enumerate(self.histogram) if count],
+        }
+
+
+class Instrumentation:
+    """
+    Records call counts, time and latency histograms per class and method.
+    Use enable()/disable(), or a `with` block.
+    """
+
+    def __init__(self, targets=DEFAULT_TARGETS):
+        self.targets = tuple(targets)
+        self.stats = {}
+        self._originals = []
+
+    @property
+    def enabled(self):
+        return bool(self._originals)
+
+    def enable(self):
+        """Install the timing wrappers (does nothing if already enabled)"""
+        if self.enabled:
+            return
+        for cls, method_name in self.targets:
+            original = cls.__dict__[method_name]
+            setattr(cls, method_name, self._wrap(original, method_name))
+            self._originals.append((cls, method_name, original))
+
+    def disable(self):
+        """Put the original methods back"""
+        for cls, method_name, original in reversed(self._originals):
+            setattr(cls, method_name, original)
+        self._originals = []
+
+    def __enter__(self):
+        self.enable()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.disable()
+
+    def reset(self):
+        """Forget everything recorded so far"""
+        self.stats = {}
+
+    def _wrap(self, original, method_name):
+        stats = self.stats_for
+
+        def timed(obj, *args, **kwargs):
+            start = perf_counter_ns()
+            try:
+                return original(obj, *args, **kwargs)
+            finally:
+                stats(type(obj).__name__, method_name).record(perf_counter_ns() - start)
+
+        timed.__name__ = original.__name__
+        timed.__qualname__ = original.__qualname__
+        timed.__doc__ = original.__doc__
+        timed.__wrapped__ = original
+        return timed
+
+    def stats_for(self, class_name, method_name):
+        """Return the MethodStats for a class name and method, creating it if needed"""
+        key = (class_name, method_name)
+        method_stats = self.stats.get(key)
+        if method_stats is None:
+            method_stats = self.stats[key] = MethodStats()
+        return method_stats
+
+    def snapshot(self):
+        """
+        Return everything recorded so far as plain dicts:
+        {class name: {method name: {calls, total_ns, mean_ns, max_ns, histogram}}}
+        """
+        result = {}
+        for (class_name, method_name), method_stats in sorted(self.stats.items()):
+            result.setdefault(class_name, {})[method_name] = method_stats.to_dict()
+        return result
+
+    def export_json(self, path=None):
+        """Return the snapshot as a JSON string, also writing it to path if given"""
+        text = json.dumps(self.snapshot(), indent=2)
+        if path is not None:
+            with open(path, "w") as f:
+                f.write(text)
+        return text
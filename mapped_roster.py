@@ -0,0 +1,248 @@
+"""
+Memory-mapped character roster.
+
+A MappedRoster opens a roster file written by serialization.dump() with
+mmap instead of reading it. Opening only reads the header, so it takes the
+same time for ten characters or ten million, and the operating system pages
+records in from disk as they are touched. Indexing hands out a proxy that
+IS a Warrior/Mage/Rogue (like CharacterRoster views); every stat read and
+write goes straight to the record in the mapped file, so take_damage on a
+proxy changes the file itself. Proxies are made on demand and not kept, so
+characters nobody touches cost no memory at all.
+
+The file has a fixed size: characters can be changed but not added, and
+names can't be changed because the string table is shared.
+"""
+
+import mmap
+import struct
+import sys
+from operator import attrgetter
+
+from project2_starter import Player
+from roster import SPARSE_FIELDS, RosterView, _LiveDamage, _SparseField, _Uncached
+from serialization import CLASS_TAGS, NO_WEAPON, RECORD, WEAPON, dump, read_header
+from weapon_catalog import CATALOG
+
+# Record fields in file order. Every field is one 4-byte word (the class
+# tag is a byte followed by three padding bytes).
+RECORD_FIELDS = ("tag", "name_id", "class_id", "health", "strength", "magic",
+                 "level", "experience", "weapon_id")
+assert RECORD.size == 4 * len(RECORD_FIELDS)
+
+_INT = struct.Struct("<i")
+_UINT = struct.Struct("<I")
+_STRING_BOUNDS = struct.Struct("<II")
+
+
+class _MappedField:
+    """
+    Descriptor that reads/writes one stat in the proxy's record.
+    """
+
+    def __init__(self, field):
+        self.offset = 4 * RECORD_FIELDS.index(field)
+
+    def __get__(self, proxy, owner=None):
+        if proxy is None:
+            return self
+        return _INT.unpack_from(proxy._store._map, proxy._offset + self.offset)[0]
+
+    def __set__(self, proxy, value):
+        _INT.pack_into(proxy._store._map, proxy._offset + self.offset, value)
+
+
+class _MappedString:
+    """
+    Descriptor for name and character_class (ids into the file's string table).
+    """
+
+    def __init__(self, field):
+        self.offset = 4 * RECORD_FIELDS.index(field)
+
+    def __get__(self, proxy, owner=None):
+        if proxy is None:
+            return self
+        store = proxy._store
+        return store._string(_UINT.unpack_from(store._map, proxy._offset + self.offset)[0])
+
+    def __set__(self, proxy, value):
+        raise AttributeError("names in a mapped roster can't be changed")
+
+
+class _MappedWeapon:
+    """
+    Descriptor for weapon. Only weapons already in the file's weapon table
+    (or None) can be equipped.
+    """
+
+    offset = 4 * RECORD_FIELDS.index("weapon_id")
+
+    def __get__(self, proxy, owner=None):
+        if proxy is None:
+            return self
+        store = proxy._store
+        return store._weapon(_INT.unpack_from(store._map, proxy._offset + self.offset)[0])
+
+    def __set__(self, proxy, value):
+        store = proxy._store
+        _INT.pack_into(store._map, proxy._offset + self.offset, store._weapon_id(value))
+
+
+# Position and speed aren't stored in the file, so proxies keep the values
+# that have been set in a dict on the store.
+_store = attrgetter("_store")
+
+_proxy_classes = {}
+
+
+def proxy_class(cls):
+    """
+    Return (and cache) the proxy class for one of the classes in CLASS_TAGS.
+    Like roster views, it inherits from cls so all the normal methods work.
+    """
+    proxy_cls = _proxy_classes.get(cls)
+    if proxy_cls is None:
+        namespace = {
+            "__slots__": ("_store", "_index", "_offset"),
+            "name": _MappedString("name_id"),
+            "health": _MappedField("health"),
+            "strength": _MappedField("strength"),
+            "magic": _MappedField("magic"),
+            "x": _SparseField("x", 0.0, _store),
+            "y": _SparseField("y", 0.0, _store),
+            "speed": _SparseField("speed", cls.BASE_SPEED, _store),
+            "_stats_cache": _Uncached(),
+        }
+        if issubclass(cls, Player):
+            namespace["character_class"] = _MappedString("class_id")
+            namespace["level"] = _MappedField("level")
+            namespace["experience"] = _MappedField("experience")
+            namespace["weapon"] = _MappedWeapon()
+            namespace["attack_damage"] = _LiveDamage(0)
+            namespace["special_damage"] = _LiveDamage(1)
+        proxy_cls = type(f"{cls.__name__}MappedView", (RosterView, cls), namespace)
+        _proxy_classes[cls] = proxy_cls
+    return proxy_cls
+
+
+class MappedRoster:
+    """
+    A roster file opened with mmap. Use it as a context manager, or call
+    close() when done. With writable=False the file is mapped read-only and
+    any write raises TypeError.
+    """
+
+    def __init__(self, path, writable=True, catalog=CATALOG):
+        self.path = path
+        self.writable = writable
+        self.catalog = catalog
+        self._file = open(path, "r+b" if writable else "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0,
+                                  access=mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ)
+        except BaseException:
+            self._file.close()
+            raise
+        (self._count, self._string_count, self._weapon_count, self._strings_offset,
+         self._weapons_offset, self._records_offset) = read_header(self._map)
+        self._blob_offset = self._strings_offset + 4 * (self._string_count + 1)
+        self._weapons = None
+        self._weapon_ids = None
+        self._sparse = {field: {} for field in SPARSE_FIELDS}
+
+    @classmethod
+    def create(cls, path, characters, catalog=CATALOG):
+        """Write characters to a new roster file and open it"""
+        dump(characters, path)
+        return cls(path, catalog=catalog)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def flush(self):
+        """Write changed pages back to the file"""
+        if self.writable:
+            self._map.flush()
+
+    def close(self):
+        """Flush and unmap the file. Proxies must not be used afterwards"""
+        if not self._map.closed:
+            self.flush()
+            self._map.close()
+            self._file.close()
+
+    # ------------------------------------------------------------------
+    # Proxies
+    # ------------------------------------------------------------------
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, index):
+        """Return a proxy for the character at index (negative indexes work too)"""
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("roster index out of range")
+        offset = self._records_offset + index * RECORD.size
+        proxy = object.__new__(proxy_class(CLASS_TAGS[self._map[offset]]))
+        proxy._store = self
+        proxy._index = index
+        proxy._offset = offset
+        return proxy
+
+    def __iter__(self):
+        for index in range(self._count):
+            yield self[index]
+
+    def class_of(self, index):
+        """Return the class stored at index without making a proxy"""
+        return CLASS_TAGS[self._map[self._records_offset + index * RECORD.size]]
+
+    def total(self, field):
+        """Sum a numeric stat over every record without making any proxies"""
+        start = self._records_offset + 4 * RECORD_FIELDS.index(field)
+        end = self._records_offset + self._count * RECORD.size
+        if sys.byteorder == "little":
+            # Records are 8-byte aligned runs of 32-bit words, so one field
+            # is every ninth word of the mapped buffer.
+            with memoryview(self._map) as buffer, buffer[start:end].cast("i") as words:
+                return sum(words[::len(RECORD_FIELDS)])
+        return sum(_INT.unpack_from(self._map, offset)[0] for offset in range(start, end, RECORD.size))
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _string(self, string_id):
+        start, end = _STRING_BOUNDS.unpack_from(self._map, self._strings_offset + 4 * string_id)
+        return self._map[self._blob_offset + start:self._blob_offset + end].decode("utf-8")
+
+    def _load_weapons(self):
+        weapons = []
+        for index in range(self._weapon_count):
+            name_id, bonus = WEAPON.unpack_from(self._map, self._weapons_offset + index * WEAPON.size)
+            weapons.append(self.catalog.get(self._string(name_id), bonus))
+        self._weapons = weapons
+        self._weapon_ids = {weapon: index for index, weapon in enumerate(weapons)}
+
+    def _weapon(self, weapon_id):
+        if weapon_id == NO_WEAPON:
+            return None
+        if self._weapons is None:
+            self._load_weapons()
+        return self._weapons[weapon_id]
+
+    def _weapon_id(self, weapon):
+        if weapon is None:
+            return NO_WEAPON
+        if self._weapon_ids is None:
+            self._load_weapons()
+        try:
+            return self._weapon_ids[weapon]
+        except KeyError:
+            raise ValueError(f"{weapon!r} is not in this roster file's weapon table") from None
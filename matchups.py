@@ -0,0 +1,151 @@
+"""
+Monte Carlo matchup runner.
+
+Runs many multi-round battles for every pairing of character classes and
+collects the results into a win/loss/tie table with confidence intervals.
+Battles are split into fixed-size chunks, and each chunk gets its own RNG
+seeded from (seed, pairing, chunk number). That way the chunks can be
+spread over a process pool and the answer is the same no matter how many
+workers run them or in which order they finish.
+"""
+
+import math
+import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from project2_starter import Warrior, Mage, Rogue
+from battle_engine import MultiRoundBattle
+from rng import BlockRNG
+
+DEFAULT_CLASSES = (Warrior, Mage, Rogue)
+
+
+class MatchupResult(namedtuple("MatchupResult", "wins losses ties")):
+    """
+    Totals for one pairing, counted from the first class's point of view.
+    """
+
+    __slots__ = ()
+
+    @property
+    def battles(self):
+        return self.wins + self.losses + self.ties
+
+    @property
+    def win_rate(self):
+        return self.wins / self.battles if self.battles else 0.0
+
+    def confidence_interval(self, z=1.96):
+        """
+        Wilson score interval for the win rate (z=1.96 gives 95%).
+        Returns (low, high).
+        """
+        n = self.battles
+        if n == 0:
+            return (0.0, 1.0)
+        p = self.wins / n
+        denominator = 1 + z * z / n
+        centre = (p + z * z / (2 * n)) / denominator
+        spread = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denominator
+        return (max(0.0, centre - spread), min(1.0, centre + spread))
+
+    def __add__(self, other):
+        return MatchupResult(self.wins + other.wins, self.losses + other.losses,
+                             self.ties + other.ties)
+
+
+def chunk_rng(seed, first, second, chunk):
+    """Build the independent, reproducible RNG for one chunk of one pairing"""
+    return BlockRNG(f"{seed}:{first}:{second}:{chunk}")
+
+
+def run_chunk(first, second, battles, seed, chunk, max_rounds=100):
+    """
+    Fight `battles` fresh first-vs-second battles with this chunk's RNG.
+    first/second are Character classes that take just a name.
+    Returns a MatchupResult.
+    """
+    rng = chunk_rng(seed, first.__name__, second.__name__, chunk)
+    wins = losses = ties = 0
+    # Build the two characters once and reset them between battles.
+    char1, char2 = first("A"), second("B")
+    start1, start2 = char1.snapshot(), char2.snapshot()
+    battle = MultiRoundBattle(char1, char2, None, rng, max_rounds)
+    for _ in range(battles):
+        char1.restore(start1)
+        char2.restore(start2)
+        winner = battle.fight()
+        if winner is char1:
+            wins += 1
+        elif winner is char2:
+            losses += 1
+        else:
+            ties += 1
+    return MatchupResult(wins, losses, ties)
+
+
+def _run_chunk_job(job):
+    return run_chunk(*job)
+
+
+def plan_chunks(battles, chunk_size):
+    """Split a number of battles into chunk sizes (the last one may be smaller)"""
+    sizes = [chunk_size] * (battles // chunk_size)
+    if battles % chunk_size:
+        sizes.append(battles % chunk_size)
+    return sizes
+
+
+def run_matchups(battles, classes=DEFAULT_CLASSES, seed=0, workers=None,
+                 chunk_size=1000, max_rounds=100):
+    """
+    Run `battles` battles for every (first, second) pairing of classes.
+
+    With workers=1 everything runs in this process; otherwise the chunks
+    are shared out over a ProcessPoolExecutor (workers=None uses one
+    process per CPU). Returns {(first name, second name): MatchupResult}.
+    """
+    pairings = [(first, second) for first in classes for second in classes]
+    jobs = []
+    for first, second in pairings:
+        for chunk, size in enumerate(plan_chunks(battles, chunk_size)):
+            jobs.append((first, second, size, seed, chunk, max_rounds))
+
+    if workers == 1:
+        results = map(_run_chunk_job, jobs)
+        return _merge(pairings, jobs, results)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    # A few chunks per task keeps the inter-process overhead small.
+    chunksize = max(1, len(jobs) // (4 * workers))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return _merge(pairings, jobs, pool.map(_run_chunk_job, jobs, chunksize=chunksize))
+
+
+def _merge(pairings, jobs, results):
+    table = {(first.__name__, second.__name__): MatchupResult(0, 0, 0)
+             for first, second in pairings}
+    for job, result in zip(jobs, results):
+        key = (job[0].__name__, job[1].__name__)
+        table[key] = table[key] + result
+    return table
+
+
+def format_table(table):
+    """Turn a run_matchups() result into printable lines of win rates"""
+    names = sorted({first for first, _ in table})
+    lines = ["".ljust(10) + "".join(name.rjust(22) for name in names)]
+    for first in names:
+        row = first.ljust(10)
+        for second in names:
+            result = table[(first, second)]
+            low, high = result.confidence_interval()
+            row += f"{result.win_rate:.3f} [{low:.3f},{high:.3f}]".rjust(22)
+        lines.append(row)
+    return lines
+
+
+if __name__ == "__main__":
+    for line in format_table(run_matchups(10000)):
+        print(line)
@@ -0,0 +1,155 @@
+"""
+Experience and levels.
+
+Players earn experience from battles and level up when their total passes
+the next threshold in LEVEL_THRESHOLDS. Both tables are worked out once
+when the module loads: the thresholds are a sorted tuple, so finding the
+level for an experience total is a bisect, and each class has a growth
+row (health, strength, magic gained per level). Levelling up from level a
+to b adds growth * (b - a) to the stats.
+
+grant() and award_battle() work on single players. grant_roster() gives
+experience to every character in a CharacterRoster in one pass over its
+columns, which is how a whole tournament's worth of experience is handed
+out without building any objects.
+"""
+
+from array import array
+from bisect import bisect_right
+from functools import partial
+from operator import add, mul, sub
+
+from project2_starter import Player, Warrior, Mage, Rogue
+from roster import STAT_TYPECODE
+
+MAX_LEVEL = 100
+
+# LEVEL_THRESHOLDS[n] is the experience needed for level n + 1: level 2
+# takes 100, level 3 takes 300, level 4 takes 600, ...
+LEVEL_THRESHOLDS = tuple(50 * level * (level - 1) for level in range(1, MAX_LEVEL + 1))
+
+# (health, strength, magic) gained per level.
+GROWTH = {
+    Player: (8, 1, 1),
+    Warrior: (12, 2, 0),
+    Mage: (6, 0, 3),
+    Rogue: (9, 1, 1),
+}
+
+# Experience for a battle: a win earns WIN_XP plus LEVEL_XP per level of
+# the opponent, a tie TIE_XP and a loss LOSS_XP.
+WIN_XP = 50
+LEVEL_XP = 10
+TIE_XP = 20
+LOSS_XP = 10
+
+
+def level_for(experience):
+    """Return the level (1 to MAX_LEVEL) an experience total has reached"""
+    return bisect_right(LEVEL_THRESHOLDS, experience)
+
+
+def growth_of(cls):
+    """Return the (health, strength, magic) growth row for a Player class (roster views included)"""
+    for base in cls.__mro__:
+        growth = GROWTH.get(base)
+        if growth is not None:
+            return growth
+    raise TypeError(f"{cls.__name__} is not a Player class")
+
+
+def grant(player, experience):
+    """
+    Give a player experience and apply any level-ups.
+    Returns the number of levels gained.
+    """
+    player.experience += experience
+    new_level = max(player.level, level_for(player.experience))
+    gained = new_level - player.level
+    if gained:
+        health, strength, magic = growth_of(type(player))
+        player.level = new_level
+        player.health += health * gained
+        player.strength += strength * gained
+        player.magic += magic * gained
+    return gained
+
+
+def battle_experience(player, opponent, result):
+    """Experience a player earns for a "win", "tie" or "loss" against opponent"""
+    if result == "win":
+        return WIN_XP + LEVEL_XP * getattr(opponent, "level", 0)
+    if result == "tie":
+        return TIE_XP
+    return LOSS_XP
+
+
+def award_battle(char1, char2):
+    """
+    Award experience after SimpleBattle(char1, char2).fight(), deciding the
+    result the same way it does (by remaining health). Characters that
+    aren't Players get nothing. Returns (levels gained by char1, by char2).
+    """
+    if char1.health > char2.health:
+        results = ("win", "loss")
+    elif char2.health > char1.health:
+        results = ("loss", "win")
+    else:
+        results = ("tie", "tie")
+    gained = []
+    for player, opponent, result in ((char1, char2, results[0]), (char2, char1, results[1])):
+        if isinstance(player, Player):
+            gained.append(grant(player, battle_experience(player, opponent, result)))
+        else:
+            gained.append(0)
+    return tuple(gained)
+
+
+def grant_roster(roster, experience):
+    """
+    Give experience to every character in a CharacterRoster at once.
+
+    `experience` is one number for everyone or a sequence with one entry
+    per character. Non-player characters are skipped. Every column is
+    rebuilt in one pass when many characters level up; when only a few
+    do, just their stats are touched. Returns how many characters
+    levelled up.
+    """
+    count = len(roster)
+    if isinstance(experience, int):
+        experience = [experience] * count
+    elif len(experience) != count:
+        raise ValueError("experience must have one entry per character")
+
+    growths = [growth_of(cls) if issubclass(cls, Player) else None for cls in roster._classes]
+    is_player = [growth is not None for growth in growths]
+    kinds = roster._kinds
+    columns = roster._columns
+    old_levels = columns["level"]
+
+    gained_xp = [xp if is_player[kind] else 0 for kind, xp in zip(kinds, experience)]
+    totals = array(STAT_TYPECODE, map(add, columns["experience"], gained_xp))
+    # partial() keeps the bisect in C for the whole column.
+    reached = map(partial(bisect_right, LEVEL_THRESHOLDS), totals)
+    levels = array(STAT_TYPECODE, [max(old, new) if is_player[kind] else old
+                                   for kind, old, new in zip(kinds, old_levels, reached)])
+    deltas = array(STAT_TYPECODE, map(sub, levels, old_levels))
+    changed = count - deltas.count(0)
+
+    if changed * 8 > count:
+        # Many level-ups: rebuild each stat column in one pass.
+        for stat, column in enumerate(("health", "strength", "magic")):
+            per_kind = [growth[stat] if growth is not None else 0 for growth in growths]
+            bonus = map(mul, [per_kind[kind] for kind in kinds], deltas)
+            columns[column][:] = array(STAT_TYPECODE, map(add, columns[column], bonus))
+    elif changed:
+        health, strength, magic = columns["health"], columns["strength"], columns["magic"]
+        for i, gained in enumerate(deltas):
+            if gained:
+                growth = growths[kinds[i]]
+                health[i] += growth[0] * gained
+                strength[i] += growth[1] * gained
+                magic[i] += growth[2] * gained
+    old_levels[:] = levels
+    columns["experience"][:] = totals
+    return changed
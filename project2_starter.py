@@ -7,6 +7,8 @@ AI Usage: [Document any AI assistance used]
 Example: AI helped with inheritance structure and method overriding concepts
 """
 
+import random
+
 # ============================================================================
 # PROVIDED BATTLE SYSTEM (DO NOT MODIFY)
 # ============================================================================
@@ -53,17 +55,74 @@ class SimpleBattle:
 # YOUR CLASSES TO IMPLEMENT (6 CLASSES TOTAL)
 # ============================================================================
 
+# The display_stats lines, shared with anything else that prints stats
+# (battle_engine.PrintSink) so the format only lives here.
+def stats_line(name, health, strength, magic):
+    """The line display_stats prints for every character"""
+    return f"{name}: Health={health}, Strength={strength}, Magic={magic}"
+
+def player_stats_line(character_class, level, experience):
+    """The extra line display_stats prints for players"""
+    return f"  Class: {character_class}, Level: {level}, Experience: {experience}"
+
+class _Sparse:
+    """
+    Attribute that most characters never change (position, speed). Reading
+    it gives the default until the character sets its own value; only then
+    is a small _overrides dict created to hold it, like the sparse fields
+    of roster.CharacterRoster. Writes replace the dict instead of changing
+    it, so copies that share it (copy.copy, fork) stay independent.
+    The default is `default`, or the class attribute named class_default.
+    """
+
+    def __init__(self, name, default=None, class_default=None):
+        self.name = name
+        self.default = default
+        self.class_default = class_default
+
+    def __get__(self, character, owner=None):
+        if character is None:
+            return self
+        overrides = character._overrides
+        if overrides is not None and self.name in overrides:
+            return overrides[self.name]
+        if self.class_default is not None:
+            return getattr(owner, self.class_default)
+        return self.default
+
+    def __set__(self, character, value):
+        character._overrides = {**(character._overrides or {}), self.name: value}
+
 class Character:
     """
     Base class for all characters.
     This is the top of our inheritance hierarchy.
     """
+
+    # __slots__ stores attributes in fixed slots instead of a per-instance
+    # __dict__, which makes every character much smaller in memory.
+    # Subclasses list only the attributes they add. Values that most
+    # characters never change share one _overrides slot (see _Sparse).
+    __slots__ = ("name", "health", "strength", "magic", "_overrides", "_stats_cache")
+
+    # Starting speed; faster characters act more often on a timeline.
+    BASE_SPEED = 10
+
+    x = _Sparse("x", 0.0)
+    y = _Sparse("y", 0.0)
+    speed = _Sparse("speed", class_default="BASE_SPEED")
     
-    def __init__(self, name, health, strength, magic):
-        """Initialize basic character attributes"""
-        # TODO: Set the character's name, health, strength, and magic
-        # These should be stored as instance variables
-        pass
+    def __init__(self, name, health, strength, magic, x=0.0, y=0.0):
+        """Initialize basic character attributes (and a battlefield position)"""
+        self.name = name
+        self.health = health
+        self.strength = strength
+        self.magic = magic
+        self._overrides = None
+        self._stats_cache = None
+        if x or y:
+            self.x = x
+            self.y = y
         
     def attack(self, target):
         """
@@ -73,171 +132,411 @@ class Character:
         2. Apply damage to the target
         3. Print what happened
         """
-        # TODO: Implement basic attack
-        # Damage should be based on self.strength
-        # Use target.take_damage(damage) to apply damage
-        pass
+        damage = self.attack_damage
+        print(f"{self.name} attacks {target.name} for {damage} damage!")
+        target.take_damage(damage)
+
+    @property
+    def attack_damage(self):
+        """Damage this character's basic attack deals (before any critical hit)"""
+        return self.strength
         
     def take_damage(self, damage):
         """
         Reduces this character's health by the damage amount.
         Health should never go below 0.
         """
-        # TODO: Implement taking damage
-        # Reduce self.health by damage amount
-        # Make sure health doesn't go below 0
-        pass
+        self.health -= damage
+        if self.health < 0:
+            self.health = 0
         
     def display_stats(self):
         """
         Prints the character's current stats in a nice format.
         """
-        # TODO: Print character's name, health, strength, and magic
-        # Make it look nice with formatting
-        pass
+        print(self._stats()[1][0])
+
+    def stats_text(self):
+        """Return the text display_stats prints"""
+        return self._stats()[2]
+
+    def _stats(self):
+        """
+        (values shown, display lines, full text) for display_stats.
+
+        The lines are cached together with the values they show, and only
+        formatted again once one of those values has changed, so redrawing
+        an unchanged character is a tuple comparison instead of a format.
+        """
+        key = self._stats_key()
+        cache = self._stats_cache
+        if cache is None or cache[0] != key:
+            lines = self._render_stats()
+            cache = self._stats_cache = (key, lines, "\n".join(lines))
+        return cache
+
+    def _stats_key(self):
+        """The values shown by display_stats"""
+        return (self.name, self.health, self.strength, self.magic)
+
+    def _render_stats(self):
+        """The display_stats lines, as a tuple"""
+        return (stats_line(self.name, self.health, self.strength, self.magic),)
+
+    def snapshot(self):
+        """
+        Capture this character's changeable stats as a tuple.
+        Pass it to restore() later to reset the character without rebuilding it.
+        """
+        return (self.health, self.strength, self.magic)
+
+    def restore(self, snapshot):
+        """Put back the stats captured by snapshot()"""
+        self.health, self.strength, self.magic = snapshot
+
+    def fork(self):
+        """
+        Return an independent copy of this character without calling __init__.
+
+        Every stat is an immutable value (numbers, strings, shared Weapons),
+        so the copy just points at the same values; changing the copy (for
+        example with take_damage) rebinds its own attribute and never
+        touches the original.
+        """
+        clone = object.__new__(type(self))
+        self._copy_into(clone)
+        return clone
+
+    def _copy_into(self, clone):
+        clone.name = self.name
+        clone.health = self.health
+        clone.strength = self.strength
+        clone.magic = self.magic
+        clone._overrides = None
+        clone._stats_cache = self._stats_cache
+        # Only copy what was set on this character; the rest keeps its default.
+        if self.x or self.y:
+            clone.x = self.x
+            clone.y = self.y
+        if self.speed != self.BASE_SPEED:
+            clone.speed = self.speed
+
+def _damage_stat(slot):
+    """
+    Property over a slot that Player damage is worked out from. Reads use
+    the slot's own getter; writes also work the stored damage out again,
+    unless it is None because the player is still being filled in.
+    """
+    set_slot = slot.__set__
+
+    def set_stat(player, value):
+        set_slot(player, value)
+        if player.attack_damage is not None:
+            player.refresh_damage()
+    return property(slot.__get__, set_stat)
 
 class Player(Character):
     """
     Base class for player characters.
     Inherits from Character and adds player-specific features.
     """
+
+    # attack_damage and special_damage hold the finished damage (stats, class
+    # bonus and weapon) so an attack just reads a slot. Writing strength,
+    # magic, level or weapon works them out again. level and weapon live in
+    # the _level and _weapon slots (their properties are added after the
+    # class body).
+    __slots__ = ("character_class", "_level", "experience", "_weapon",
+                 "attack_damage", "special_damage")
+
+    strength = _damage_stat(Character.strength)
+    magic = _damage_stat(Character.magic)
     
     def __init__(self, name, character_class, health, strength, magic):
         """
         Initialize a player character.
         Should call the parent constructor and add player-specific attributes.
         """
-        # TODO: Call super().__init__() with the basic character info
-        # TODO: Store the character_class (like "Warrior", "Mage", etc.)
-        # TODO: Add any other player-specific attributes (level, experience, etc.)
-        pass
+        # No damage until every stat is set (see _damage_stat).
+        self.attack_damage = self.special_damage = None
+        super().__init__(name, health, strength, magic)
+        self.character_class = character_class
+        self._level = 1
+        self.experience = 0
+        self._weapon = None
+        self.refresh_damage()
+
+    def equip(self, weapon):
+        """
+        Equip a Weapon, replacing any weapon already held.
+        Its damage_bonus is added to attacks and special abilities.
+        """
+        self.weapon = weapon
+
+    def unequip(self):
+        """Remove the equipped weapon and return it (None if there wasn't one)"""
+        weapon = self.weapon
+        self.weapon = None
+        return weapon
+
+    def base_attack_damage(self):
+        """Attack damage from stats and class bonuses alone (subclasses override)"""
+        return self.strength
+
+    def base_special_damage(self):
+        """Special ability damage from stats and class bonuses alone"""
+        return self.base_attack_damage()
+
+    def _compute_damage(self):
+        """(attack damage, special damage) with the weapon bonus added"""
+        bonus = self.weapon.damage_bonus if self.weapon is not None else 0
+        return (self.base_attack_damage() + bonus,
+                self.base_special_damage() + bonus)
+
+    def refresh_damage(self):
+        """
+        Work out attack_damage and special_damage again. Writing strength,
+        magic, level or weapon already calls this.
+        """
+        self.attack_damage, self.special_damage = self._compute_damage()
+
+    def snapshot(self):
+        """Capture stats, level, experience and the equipped weapon"""
+        return (self.health, self.strength, self.magic,
+                self.level, self.experience, self.weapon)
+
+    def restore(self, snapshot):
+        """
+        Put back the state captured by snapshot().
+        Damage is only worked out again when the damage stats changed.
+        """
+        health, strength, magic, level, experience, weapon = snapshot
+        if (strength, magic, level, weapon) != (self.strength, self.magic, self.level, self.weapon):
+            self.strength = strength
+            self.magic = magic
+            self.level = level
+            self.weapon = weapon
+        self.health = health
+        self.experience = experience
+
+    def __setstate__(self, state):
+        # pickle and copy write the slots one by one, so hold the damage
+        # back until every stat is in.
+        self.attack_damage = None
+        for name, value in state[1].items():
+            if name != "attack_damage" and name != "special_damage":
+                setattr(self, name, value)
+        self.refresh_damage()
+
+    def _copy_into(self, clone):
+        clone.attack_damage = clone.special_damage = None
+        super()._copy_into(clone)
+        clone.character_class = self.character_class
+        clone.level = self.level
+        clone.experience = self.experience
+        clone.weapon = self.weapon
+        clone.attack_damage = self.attack_damage
+        clone.special_damage = self.special_damage
         
     def display_stats(self):
         """
         Override the parent's display_stats to show additional player info.
         Should show everything the parent shows PLUS player-specific info.
         """
-        # TODO: Call the parent's display_stats method using super()
-        # TODO: Then print additional player info like class and level
-        pass
+        super().display_stats()
+        # super() has just checked the cached lines, so reuse them as they are
+        # (views keep no cache and work them out again).
+        print((self._stats_cache or self._stats())[1][1])
+
+    def _stats_key(self):
+        return (self.name, self.health, self.strength, self.magic,
+                self.character_class, self.level, self.experience)
+
+    def _render_stats(self):
+        return super()._render_stats() + (
+            player_stats_line(self.character_class, self.level, self.experience),)
+
+Player.level = _damage_stat(Player._level)
+Player.weapon = _damage_stat(Player._weapon)
 
 class Warrior(Player):
     """
     Warrior class - strong physical fighter.
     Inherits from Player.
     """
+
+    __slots__ = ()
+    BASE_SPEED = 8
     
     def __init__(self, name):
         """
         Create a warrior with appropriate stats.
         Warriors should have: high health, high strength, low magic
         """
-        # TODO: Call super().__init__() with warrior-appropriate stats
-        # Suggested stats: health=120, strength=15, magic=5
-        pass
+        super().__init__(name, "Warrior", 120, 15, 5)
+
+    def base_attack_damage(self):
+        """Warriors hit for strength + 5; Power Strike doubles strength"""
+        return self.strength + 5
+
+    def base_special_damage(self):
+        return self.strength * 2
         
     def attack(self, target):
         """
         Override the basic attack to make it warrior-specific.
         Warriors should do extra physical damage.
         """
-        # TODO: Implement warrior attack
-        # Should do more damage than basic attack
-        # Maybe strength + 5 bonus damage?
-        pass
+        damage = self.attack_damage
+        print(f"{self.name} swings at {target.name} for {damage} damage!")
+        target.take_damage(damage)
         
     def power_strike(self, target):
         """
         Special warrior ability - a powerful attack that does extra damage.
         """
-        # TODO: Implement power strike
-        # Should do significantly more damage than regular attack
-        pass
+        damage = self.special_damage
+        print(f"💥 {self.name} uses Power Strike on {target.name} for {damage} damage!")
+        target.take_damage(damage)
 
 class Mage(Player):
     """
     Mage class - magical spellcaster.
     Inherits from Player.
     """
+
+    __slots__ = ()
+    BASE_SPEED = 10
     
     def __init__(self, name):
         """
         Create a mage with appropriate stats.
         Mages should have: low health, low strength, high magic
         """
-        # TODO: Call super().__init__() with mage-appropriate stats
-        # Suggested stats: health=80, strength=8, magic=20
-        pass
+        super().__init__(name, "Mage", 80, 8, 20)
+
+    def base_attack_damage(self):
+        """Mages hit with magic; Fireball adds 10"""
+        return self.magic
+
+    def base_special_damage(self):
+        return self.magic + 10
         
     def attack(self, target):
         """
         Override the basic attack to make it magic-based.
         Mages should use magic for damage instead of strength.
         """
-        # TODO: Implement mage attack
-        # Should use self.magic for damage calculation instead of strength
-        pass
+        damage = self.attack_damage
+        print(f"{self.name} casts a spell at {target.name} for {damage} damage!")
+        target.take_damage(damage)
         
     def fireball(self, target):
         """
         Special mage ability - a powerful magical attack.
         """
-        # TODO: Implement fireball spell
-        # Should do magic-based damage with bonus
-        pass
+        damage = self.special_damage
+        print(f"🔥 {self.name} casts Fireball on {target.name} for {damage} damage!")
+        target.take_damage(damage)
 
 class Rogue(Player):
     """
     Rogue class - quick and sneaky fighter.
     Inherits from Player.
     """
+
+    __slots__ = ()
+    BASE_SPEED = 14
     
     def __init__(self, name):
         """
         Create a rogue with appropriate stats.
         Rogues should have: medium health, medium strength, medium magic
         """
-        # TODO: Call super().__init__() with rogue-appropriate stats
-        # Suggested stats: health=90, strength=12, magic=10
-        pass
+        super().__init__(name, "Rogue", 90, 12, 10)
+
+    def base_attack_damage(self):
+        """Rogues hit with strength; Sneak Attack is a guaranteed crit"""
+        return self.strength
+
+    def base_special_damage(self):
+        return self.strength * 2
+
+    def _compute_damage(self):
+        # Sneak Attack is a critical hit, and a crit doubles the whole hit,
+        # weapon bonus included (see attack below).
+        attack_damage = super()._compute_damage()[0]
+        return (attack_damage, attack_damage * 2)
         
-    def attack(self, target):
+    def attack(self, target, rng=random):
         """
         Override the basic attack to make it rogue-specific.
         Rogues should have a chance for extra damage (critical hits).
+        The crit roll comes from rng (the random module unless another
+        provider, like rng.BlockRNG, is passed in).
         """
-        # TODO: Implement rogue attack
-        # Could add a chance for critical hit (double damage)
-        # Hint: use random.randint(1, 10) and if result <= 3, it's a crit
-        pass
+        damage = self.attack_damage
+        if rng.randint(1, 10) <= 3:
+            damage *= 2
+            print(f"🎯 Critical hit! {self.name} strikes {target.name} for {damage} damage!")
+        else:
+            print(f"{self.name} strikes {target.name} for {damage} damage!")
+        target.take_damage(damage)
         
     def sneak_attack(self, target):
         """
         Special rogue ability - guaranteed critical hit.
         """
-        # TODO: Implement sneak attack
-        # Should always do critical damage
-        pass
+        damage = self.special_damage
+        print(f"🗡️ {self.name} uses Sneak Attack on {target.name} for {damage} damage!")
+        target.take_damage(damage)
 
 class Weapon:
     """
     Weapon class to demonstrate composition.
     Characters can HAVE weapons (composition, not inheritance).
+
+    Weapons can't be changed after they are created, so one Weapon object
+    can safely be shared by every character holding that weapon (see
+    weapon_catalog.py).
     """
+
+    __slots__ = ("name", "damage_bonus")
     
     def __init__(self, name, damage_bonus):
         """
         Create a weapon with a name and damage bonus.
         """
-        # TODO: Store weapon name and damage bonus
-        pass
+        object.__setattr__(self, "name", name)
+        object.__setattr__(self, "damage_bonus", damage_bonus)
+
+    def __setattr__(self, attribute, value):
+        raise AttributeError("weapons can't be changed once created")
+
+    def __delattr__(self, attribute):
+        raise AttributeError("weapons can't be changed once created")
+
+    def __reduce__(self):
+        # __setattr__ above would stop pickle and copy from filling in the
+        # slots, so rebuild through __init__ instead.
+        return (type(self), (self.name, self.damage_bonus))
+
+    def __eq__(self, other):
+        if not isinstance(other, Weapon):
+            return NotImplemented
+        return (self.name, self.damage_bonus) == (other.name, other.damage_bonus)
+
+    def __hash__(self):
+        return hash((self.name, self.damage_bonus))
+
+    def __repr__(self):
+        return f"Weapon({self.name!r}, {self.damage_bonus!r})"
         
     def display_info(self):
         """
         Display information about this weapon.
         """
-        # TODO: Print weapon name and damage bonus
-        pass
+        print(f"{self.name}: +{self.damage_bonus} damage")
 
 # ============================================================================
 # MAIN PROGRAM FOR TESTING (YOU CAN MODIFY THIS FOR TESTING)
@@ -248,49 +547,50 @@ if __name__ == "__main__":
     print("Testing inheritance, polymorphism, and method overriding")
     print("=" * 50)
     
-    # TODO: Create one of each character type
-    # warrior = Warrior("Sir Galahad")
-    # mage = Mage("Merlin")
-    # rogue = Rogue("Robin Hood")
+    # Create one of each character type
+    warrior = Warrior("Sir Galahad")
+    mage = Mage("Merlin")
+    rogue = Rogue("Robin Hood")
+    
+    # Display their stats
+    print("\n📊 Character Stats:")
+    warrior.display_stats()
+    mage.display_stats()
+    rogue.display_stats()
+    
+    # Test polymorphism - same method call, different behavior
+    print("\n⚔️ Testing Polymorphism (same attack method, different behavior):")
+    dummy_target = Character("Target Dummy", 100, 0, 0)
+    dummy_state = dummy_target.snapshot()
+    
+    for character in [warrior, mage, rogue]:
+        print(f"\n{character.name} attacks the dummy:")
+        character.attack(dummy_target)
+        dummy_target.restore(dummy_state)  # Reset dummy health
     
-    # TODO: Display their stats
-    # print("\n📊 Character Stats:")
-    # warrior.display_stats()
-    # mage.display_stats()
-    # rogue.display_stats()
+    # Test special abilities
+    print("\n✨ Testing Special Abilities:")
+    target1 = Character("Enemy1", 50, 0, 0)
+    target2 = Character("Enemy2", 50, 0, 0)
+    target3 = Character("Enemy3", 50, 0, 0)
     
-    # TODO: Test polymorphism - same method call, different behavior
-    # print("\n⚔️ Testing Polymorphism (same attack method, different behavior):")
-    # dummy_target = Character("Target Dummy", 100, 0, 0)
-    # 
-    # for character in [warrior, mage, rogue]:
-    #     print(f"\n{character.name} attacks the dummy:")
-    #     character.attack(dummy_target)
-    #     dummy_target.health = 100  # Reset dummy health
+    warrior.power_strike(target1)
+    mage.fireball(target2)
+    rogue.sneak_attack(target3)
     
-    # TODO: Test special abilities
-    # print("\n✨ Testing Special Abilities:")
-    # target1 = Character("Enemy1", 50, 0, 0)
-    # target2 = Character("Enemy2", 50, 0, 0)
-    # target3 = Character("Enemy3", 50, 0, 0)
-    # 
-    # warrior.power_strike(target1)
-    # mage.fireball(target2)
-    # rogue.sneak_attack(target3)
+    # Test composition with weapons
+    print("\n🗡️ Testing Weapon Composition:")
+    sword = Weapon("Iron Sword", 10)
+    staff = Weapon("Magic Staff", 15)
+    dagger = Weapon("Steel Dagger", 8)
     
-    # TODO: Test composition with weapons
-    # print("\n🗡️ Testing Weapon Composition:")
-    # sword = Weapon("Iron Sword", 10)
-    # staff = Weapon("Magic Staff", 15)
-    # dagger = Weapon("Steel Dagger", 8)
-    # 
-    # sword.display_info()
-    # staff.display_info()
-    # dagger.display_info()
+    sword.display_info()
+    staff.display_info()
+    dagger.display_info()
     
-    # TODO: Test the battle system
-    # print("\n⚔️ Testing Battle System:")
-    # battle = SimpleBattle(warrior, mage)
-    # battle.fight()
+    # Test the battle system
+    print("\n⚔️ Testing Battle System:")
+    battle = SimpleBattle(warrior, mage)
+    battle.fight()
     
     print("\n✅ Testing complete!")
@@ -0,0 +1,192 @@
+"""
+Deterministic battle replay.
+
+record_battle() runs a battle (one round, exactly like SimpleBattle.fight,
+or up to max_rounds) through a RecordingRNG that remembers every random
+outcome, and returns a Recording holding everything needed to run the
+fight again:
+
+    setup        both characters at the start, in the serialization format
+    max_rounds   the round cap the battle ran with
+    rolls        every randint outcome, in order, one byte each
+    checkpoints  (rolls used, char1 health, char2 health) after every round
+
+replay_battle() rebuilds the characters and feeds the recorded rolls back
+in, so the fight happens exactly as it did the first time, with events
+sent to any sink (PrintSink prints it as text). Only health
+changes during a fight, so the checkpoints let state_at() and
+replay_battle(start_round=N) jump straight to any round without playing
+the ones before it.
+"""
+
+import base64
+import json
+import random
+from array import array
+from collections import namedtuple
+
+from battle_engine import BattleReport, MultiRoundBattle
+from serialization import decode, encode
+
+Recording = namedtuple("Recording", "setup max_rounds rolls checkpoints")
+
+
+class RecordingRNG:
+    """
+    Wraps an rng and remembers every randint outcome it hands out.
+    """
+
+    def __init__(self, rng=random):
+        self.rng = rng
+        self.rolls = bytearray()
+
+    def randint(self, a, b):
+        roll = self.rng.randint(a, b)
+        # Combat only rolls d10s, so every outcome fits in a byte.
+        self.rolls.append(roll)
+        return roll
+
+    @property
+    def position(self):
+        """Number of rolls handed out so far"""
+        return len(self.rolls)
+
+
+class ReplayRNG:
+    """
+    Hands out recorded randint outcomes in order, starting at `position`.
+    """
+
+    def __init__(self, rolls, position=0):
+        self.rolls = rolls
+        self.position = position
+
+    def randint(self, a, b):
+        if self.position >= len(self.rolls):
+            raise ValueError("replay used more rolls than were recorded")
+        roll = self.rolls[self.position]
+        if not a <= roll <= b:
+            raise ValueError(f"recorded roll {roll} is outside randint({a}, {b}); the replay has diverged")
+        self.position += 1
+        return roll
+
+
+def _fight(battle, rng, emit, first_round, damage1, damage2, checkpoints=None):
+    """
+    Play rounds from first_round on with MultiRoundBattle.play_rounds,
+    taking a checkpoint after each one. Returns the round count.
+    """
+    char1, char2 = battle.char1, battle.char2
+    rounds = first_round - 1
+    for rounds in battle.play_rounds(emit, damage1, damage2, first_round):
+        if checkpoints is not None:
+            checkpoints.extend((rng.position, char1.health, char2.health))
+    return rounds
+
+
+def record_battle(char1, char2, rng=random, max_rounds=1, sink=None):
+    """
+    Run a battle between char1 and char2 while recording it.
+    max_rounds=1 plays the single round of SimpleBattle.fight.
+    Returns (BattleReport, Recording).
+    """
+    setup = encode([char1, char2])
+    recorder = RecordingRNG(rng)
+    battle = MultiRoundBattle(char1, char2, sink, recorder, max_rounds)
+    emit = sink.emit if sink is not None else None
+    damage1 = array("i")
+    damage2 = array("i")
+    checkpoints = array("i")
+    rounds = _fight(battle, recorder, emit, 1, damage1, damage2, checkpoints)
+    report = BattleReport(rounds, battle.report_result(emit), damage1, damage2)
+    return report, Recording(setup, max_rounds, bytes(recorder.rolls), checkpoints)
+
+
+def rounds_recorded(recording):
+    """Number of rounds the recorded battle lasted"""
+    return len(recording.checkpoints) // 3
+
+
+def state_at(recording, round_number):
+    """
+    Return fresh (char1, char2) as they were after round_number rounds
+    (0 is the start), without playing any rounds.
+    """
+    char1, char2 = decode(recording.setup)
+    if round_number:
+        if not 0 < round_number <= rounds_recorded(recording):
+            raise ValueError(f"the recorded battle has no round {round_number}")
+        base = 3 * (round_number - 1)
+        char1.health = recording.checkpoints[base + 1]
+        char2.health = recording.checkpoints[base + 2]
+    return char1, char2
+
+
+def replay_battle(recording, sink=None, start_round=1):
+    """
+    Re-run a recorded battle exactly. With start_round > 1 the earlier
+    rounds are skipped (no events, no work) and play starts from the state
+    recorded at that point; the damage arrays of the returned BattleReport
+    still cover the whole fight. Returns (BattleReport, char1, char2).
+    """
+    char1, char2 = state_at(recording, start_round - 1)
+    checkpoints = recording.checkpoints
+    position = checkpoints[3 * (start_round - 2)] if start_round > 1 else 0
+    rng = ReplayRNG(recording.rolls, position)
+    battle = MultiRoundBattle(char1, char2, sink, rng, recording.max_rounds)
+
+    # Damage in the skipped rounds is the health lost between checkpoints.
+    first1, first2 = decode(recording.setup)
+    health1, health2 = first1.health, first2.health
+    damage1 = array("i")
+    damage2 = array("i")
+    for base in range(0, 3 * (start_round - 1), 3):
+        damage1.append(health2 - checkpoints[base + 2])
+        damage2.append(health1 - checkpoints[base + 1])
+        health1, health2 = checkpoints[base + 1], checkpoints[base + 2]
+
+    emit = sink.emit if sink is not None else None
+    rounds = _fight(battle, rng, emit, start_round, damage1, damage2)
+    return BattleReport(rounds, battle.report_result(emit), damage1, damage2), char1, char2
+
+
+def verify(recording):
+    """Replay silently and check every round ends where the recording says it did"""
+    char1, char2 = decode(recording.setup)
+    rng = ReplayRNG(recording.rolls)
+    battle = MultiRoundBattle(char1, char2, None, rng, recording.max_rounds)
+    checkpoints = array("i")
+    try:
+        _fight(battle, rng, None, 1, array("i"), array("i"), checkpoints)
+    except ValueError:
+        return False
+    return checkpoints == recording.checkpoints and rng.position == len(recording.rolls)
+
+
+def verify_all(recordings):
+    """Verify many recordings; returns the indexes of those that don't replay identically"""
+    return [index for index, recording in enumerate(recordings) if not verify(recording)]
+
+
+# ----------------------------------------------------------------------
+# Saving recordings
+# ----------------------------------------------------------------------
+
+def save_recordings(recordings, path):
+    """Append recordings to a newline-delimited JSON file"""
+    b64 = base64.b64encode
+    with open(path, "a", encoding="utf-8") as f:
+        for recording in recordings:
+            f.write(json.dumps([b64(recording.setup).decode("ascii"), recording.max_rounds,
+                                b64(recording.rolls).decode("ascii"),
+                                recording.checkpoints.tolist()], separators=(",", ":")) + "\n")
+
+
+def load_recordings(path):
+    """Yield the recordings in a file written by save_recordings(), one line at a time"""
+    b64 = base64.b64decode
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                setup, max_rounds, rolls, checkpoints = json.loads(line)
+                yield Recording(b64(setup), max_rounds, b64(rolls), array("i", checkpoints))
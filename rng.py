@@ -0,0 +1,96 @@
+"""
+Seedable, block-based random numbers for crit rolls.
+
+BlockRNG can be passed anywhere this project takes an `rng` (Rogue.attack,
+the battle engines, batch resolution). It has its own random.Random, so
+separate streams never share the global generator, and it generates d10
+rolls a block at a time into a bytes buffer, so most randint(1, 10) calls
+are just an index into that buffer. The same seed always replays exactly
+the same rolls.
+"""
+
+import random
+
+# Bytes 0-249 map evenly onto rolls 1-10; 250-255 are thrown away so every
+# roll is equally likely.
+_D10_TABLE = bytes((b % 10) + 1 for b in range(250)) + bytes(6)
+_D10_REJECT = bytes(range(250, 256))
+
+
+class BlockRNG:
+    """
+    Random number provider with block-generated d10 rolls.
+    """
+
+    def __init__(self, seed=None, block_size=4096):
+        """
+        Create a stream; the same seed gives the same rolls every time.
+        Without a seed one is drawn from the OS once and kept in self.seed,
+        so spawn() and replay() still work on an unseeded stream.
+        """
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(64)
+        self.seed = seed
+        self.block_size = block_size
+        self._random = random.Random(seed)
+        self._block = b""
+        self._pos = 0
+        self.rolls_used = 0
+
+    def _refill(self):
+        raw = self._random.randbytes(self.block_size)
+        self._block = raw.translate(_D10_TABLE, _D10_REJECT)
+        self._pos = 0
+
+    def roll_d10(self):
+        """Return the next roll from 1 to 10"""
+        if self._pos >= len(self._block):
+            self._refill()
+            while not self._block:
+                self._refill()
+        roll = self._block[self._pos]
+        self._pos += 1
+        self.rolls_used += 1
+        return roll
+
+    def randint(self, a, b):
+        """
+        Drop-in for random.randint. randint(1, 10) (the crit roll) comes
+        from the pre-generated block; other ranges use the stream's Random.
+        """
+        if a == 1 and b == 10:
+            return self.roll_d10()
+        return self._random.randint(a, b)
+
+    def crit(self, chance):
+        """Roll one crit: True with probability chance/10"""
+        return self.roll_d10() <= chance
+
+    def rolls(self, count):
+        """Return the next `count` d10 rolls at once, as bytes"""
+        parts = []
+        needed = count
+        while needed:
+            if self._pos >= len(self._block):
+                self._refill()
+            take = min(needed, len(self._block) - self._pos)
+            parts.append(self._block[self._pos:self._pos + take])
+            self._pos += take
+            needed -= take
+        self.rolls_used += count
+        return b"".join(parts)
+
+    def crits(self, count, chance):
+        """Roll `count` crits at once; returns a list of bools"""
+        return [roll <= chance for roll in self.rolls(count)]
+
+    def spawn(self, stream_id):
+        """
+        Return an independent child stream, e.g. one per worker process.
+        The child only depends on this stream's seed and stream_id.
+        """
+        return BlockRNG(f"{self.seed}/{stream_id}", self.block_size)
+
+    def replay(self):
+        """Return a fresh stream that will repeat this one's rolls from the start"""
+        return BlockRNG(self.seed, self.block_size)
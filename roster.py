@@ -0,0 +1,398 @@
+"""
+Columnar character roster.
+
+A CharacterRoster keeps every character's stats in contiguous typed arrays
+(one array per field) instead of one Python object per character. Indexing
+the roster hands out a lightweight view that still IS a Warrior/Mage/Rogue
+(so isinstance checks and all the normal methods keep working), but every
+read and write of a stat goes straight through to the arrays.
+"""
+
+from array import array
+from operator import attrgetter
+
+from project2_starter import Character, Player
+
+# Stats stored for every character, and the extra ones only players have.
+CHARACTER_FIELDS = ("health", "strength", "magic")
+PLAYER_FIELDS = ("level", "experience")
+NUMERIC_FIELDS = CHARACTER_FIELDS + PLAYER_FIELDS
+
+# 'i' is a signed 32-bit int: plenty for stats, and 4 bytes per character.
+STAT_TYPECODE = "i"
+
+# Fields kept sparsely (see _SparseField) rather than as columns.
+SPARSE_FIELDS = ("x", "y", "speed")
+
+
+class _ColumnField:
+    """
+    Descriptor that reads/writes one numeric column of the view's roster.
+    """
+
+    def __init__(self, field):
+        self.field = field
+
+    def __get__(self, view, owner=None):
+        if view is None:
+            return self
+        return view._roster._columns[self.field][view._index]
+
+    def __set__(self, view, value):
+        view._roster._columns[self.field][view._index] = value
+
+
+class _NameField:
+    """
+    Descriptor for the name column (names live in one shared UTF-8 buffer).
+    """
+
+    def __get__(self, view, owner=None):
+        if view is None:
+            return self
+        return view._roster._get_name(view._index)
+
+    def __set__(self, view, value):
+        view._roster._set_name(view._index, value)
+
+
+class _ClassNameField:
+    """
+    Descriptor for character_class (an index into the roster's class-name table).
+    """
+
+    def __get__(self, view, owner=None):
+        if view is None:
+            return self
+        roster = view._roster
+        return roster._class_names[roster._class_name_ids[view._index]]
+
+    def __set__(self, view, value):
+        roster = view._roster
+        roster._class_name_ids[view._index] = roster._intern_class_name(value)
+
+
+class _SparseField:
+    """
+    Descriptor for a field most characters leave at its default (position,
+    speed). Values are kept in a dict on the storage object, only for
+    characters where the field was set. `storage` returns that object for
+    a view: the roster by default (mapped_roster passes the file store).
+    """
+
+    def __init__(self, field, default, storage=attrgetter("_roster")):
+        self.field = field
+        self.default = default
+        self.storage = storage
+
+    def __get__(self, view, owner=None):
+        if view is None:
+            return self
+        return self.storage(view)._sparse[self.field].get(view._index, self.default)
+
+    def __set__(self, view, value):
+        self.storage(view)._sparse[self.field][view._index] = value
+
+
+class _Uncached:
+    """
+    Descriptor that switches off a per-object cache (the display_stats
+    text) for views and mapped-roster proxies. Their storage can be
+    written directly, so they always recompute.
+    """
+
+    def __get__(self, view, owner=None):
+        return None
+
+    def __set__(self, view, value):
+        pass
+
+
+class _LiveDamage:
+    """
+    Descriptor for attack_damage and special_damage on views. Columns can
+    be written directly, so the damage is worked out from the current stats
+    on every read, and refresh_damage()'s writes are ignored.
+    """
+
+    def __init__(self, position):
+        self.position = position
+
+    def __get__(self, view, owner=None):
+        if view is None:
+            return self
+        return view._compute_damage()[self.position]
+
+    def __set__(self, view, value):
+        pass
+
+
+class _NoWeapon:
+    """
+    Descriptor for weapon on views: roster characters don't hold weapons.
+    """
+
+    def __get__(self, view, owner=None):
+        return None
+
+    def __set__(self, view, value):
+        if value is not None:
+            raise TypeError("characters stored in a roster can't equip weapons")
+
+
+class RosterView:
+    """
+    Mixin for the view classes a roster hands out.
+    A view only remembers which roster it belongs to and its row number.
+    """
+
+    __slots__ = ()
+
+    def fork(self):
+        """Copy this character out of the roster into a standalone object"""
+        clone = object.__new__(type(self).__mro__[2])  # (XView, RosterView, X, ...) -> X
+        self._copy_into(clone)
+        return clone
+
+    def __repr__(self):
+        return f"<{type(self).__name__} #{self._index} {self.name!r}>"
+
+
+_view_classes = {}
+
+
+def view_class(cls):
+    """
+    Return (and cache) the view class for a Character subclass.
+
+    The view class inherits from cls, so a Warrior view passes
+    isinstance(view, Warrior) and uses Warrior.attack, Warrior.power_strike
+    and so on without any changes to those methods.
+    """
+    view_cls = _view_classes.get(cls)
+    if view_cls is None:
+        namespace = {
+            "__slots__": ("_roster", "_index"),
+            "name": _NameField(),
+            "x": _SparseField("x", 0.0),
+            "y": _SparseField("y", 0.0),
+            "speed": _SparseField("speed", cls.BASE_SPEED),
+            "_stats_cache": _Uncached(),
+        }
+        for field in CHARACTER_FIELDS:
+            namespace[field] = _ColumnField(field)
+        if issubclass(cls, Player):
+            namespace["character_class"] = _ClassNameField()
+            namespace["attack_damage"] = _LiveDamage(0)
+            namespace["special_damage"] = _LiveDamage(1)
+            namespace["weapon"] = _NoWeapon()
+            for field in PLAYER_FIELDS:
+                namespace[field] = _ColumnField(field)
+        view_cls = type(f"{cls.__name__}View", (RosterView, cls), namespace)
+        _view_classes[cls] = view_cls
+    return view_cls
+
+
+class CharacterRoster:
+    """
+    Stores many characters as columns of typed arrays.
+
+    Per character the roster keeps five 32-bit stats, a one-byte class tag,
+    a class-name id and the name's position in a shared UTF-8 buffer, so
+    memory per character is a few dozen bytes instead of a whole object
+    plus its __dict__.
+    """
+
+    def __init__(self, characters=()):
+        """Create an empty roster, optionally filled from existing characters"""
+        self._columns = {field: array(STAT_TYPECODE) for field in NUMERIC_FIELDS}
+        self._kinds = array("B")             # index into self._classes
+        self._classes = []                   # Character subclasses in this roster
+        self._class_name_ids = array("H")    # index into self._class_names
+        self._class_names = [""]             # id 0 means "not a player"
+        self._name_data = bytearray()
+        self._name_start = array("I")
+        self._name_end = array("I")
+        self._sparse = {field: {} for field in SPARSE_FIELDS}  # field -> {index: value}
+        self.extend(characters)
+
+    # ------------------------------------------------------------------
+    # Adding characters
+    # ------------------------------------------------------------------
+
+    def add(self, cls, name, health, strength, magic,
+            character_class=None, level=1, experience=0):
+        """
+        Add a character of class cls with the given stats.
+        Returns the new character's index.
+        """
+        index = len(self._kinds)
+        self._kinds.append(self._class_id(cls))
+        self._append_name(name)
+        self._columns["health"].append(health)
+        self._columns["strength"].append(strength)
+        self._columns["magic"].append(magic)
+        self._columns["level"].append(level)
+        self._columns["experience"].append(experience)
+        if issubclass(cls, Player):
+            if character_class is None:
+                character_class = cls.__name__
+            self._class_name_ids.append(self._intern_class_name(character_class))
+        else:
+            self._class_name_ids.append(0)
+        return index
+
+    def append(self, character):
+        """
+        Copy an existing Character (or Player) into the roster.
+        Returns the new character's index.
+        """
+        if isinstance(character, Player):
+            return self.add(type(character), character.name, character.health,
+                            character.strength, character.magic,
+                            character.character_class, character.level,
+                            character.experience)
+        return self.add(type(character), character.name, character.health,
+                        character.strength, character.magic)
+
+    def extend(self, characters):
+        """Copy every character in an iterable into the roster"""
+        for character in characters:
+            self.append(character)
+
+    def extend_columns(self, classes, names, health, strength, magic,
+                       class_names, level, experience):
+        """
+        Add many characters at once from parallel sequences (entry i of
+        every sequence belongs to the same character). The numeric columns
+        are extended in bulk, which is much faster than calling add() in a
+        loop. class_names entries are ignored for non-player classes.
+        """
+        class_ids = {}
+        kinds = array("B")
+        for cls in classes:
+            class_id = class_ids.get(cls)
+            if class_id is None:
+                class_id = class_ids[cls] = self._class_id(cls)
+            kinds.append(class_id)
+        player_kinds = {class_id for cls, class_id in class_ids.items() if issubclass(cls, Player)}
+        is_player = [kind in player_kinds for kind in kinds]
+
+        encoded = [name.encode("utf-8") for name in names]
+        if not (len(encoded) == len(kinds) == len(health) == len(strength) == len(magic)
+                == len(class_names) == len(level) == len(experience)):
+            raise ValueError("every column must have one entry per character")
+
+        start = len(self._name_data)
+        starts = array("I")
+        ends = array("I")
+        for blob in encoded:
+            starts.append(start)
+            start += len(blob)
+            ends.append(start)
+        self._name_data += b"".join(encoded)
+        self._name_start.extend(starts)
+        self._name_end.extend(ends)
+
+        intern = self._intern_class_name
+        self._class_name_ids.extend(intern(name) if player else 0
+                                    for name, player in zip(class_names, is_player))
+        self._kinds.extend(kinds)
+        self._columns["health"].extend(health)
+        self._columns["strength"].extend(strength)
+        self._columns["magic"].extend(magic)
+        self._columns["level"].extend(level)
+        self._columns["experience"].extend(experience)
+
+    # ------------------------------------------------------------------
+    # Views
+    # ------------------------------------------------------------------
+
+    def __len__(self):
+        return len(self._kinds)
+
+    def __getitem__(self, index):
+        """Return a view of the character at index (negative indexes work too)"""
+        size = len(self._kinds)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("roster index out of range")
+        view = object.__new__(view_class(self._classes[self._kinds[index]]))
+        view._roster = self
+        view._index = index
+        return view
+
+    def __iter__(self):
+        for index in range(len(self._kinds)):
+            yield self[index]
+
+    def class_of(self, index):
+        """Return the Character subclass stored at index"""
+        return self._classes[self._kinds[index]]
+
+    def indices_of(self, cls):
+        """Return the indexes of every character that is an instance of cls"""
+        wanted = {i for i, stored in enumerate(self._classes) if issubclass(stored, cls)}
+        return [i for i, kind in enumerate(self._kinds) if kind in wanted]
+
+    # ------------------------------------------------------------------
+    # Whole-roster operations
+    # ------------------------------------------------------------------
+
+    def column(self, field):
+        """
+        Return the typed array holding one numeric stat for every character.
+        Writing into it changes the characters directly.
+        """
+        return self._columns[field]
+
+    def total(self, field):
+        """Sum a numeric stat over the whole roster without building any views"""
+        return sum(self._columns[field])
+
+    def nbytes(self):
+        """Approximate number of bytes used by the roster's column storage"""
+        arrays = list(self._columns.values()) + [
+            self._kinds, self._class_name_ids, self._name_start, self._name_end]
+        return sum(a.itemsize * len(a) for a in arrays) + len(self._name_data)
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _class_id(self, cls):
+        if not (isinstance(cls, type) and issubclass(cls, Character)):
+            raise TypeError(f"{cls!r} is not a Character class")
+        if issubclass(cls, RosterView):
+            cls = cls.__mro__[2]  # (XView, RosterView, X, ...) -> X
+        try:
+            return self._classes.index(cls)
+        except ValueError:
+            if len(self._classes) == 256:
+                raise ValueError("a roster can hold at most 256 character classes")
+            self._classes.append(cls)
+            return len(self._classes) - 1
+
+    def _intern_class_name(self, class_name):
+        try:
+            return self._class_names.index(class_name)
+        except ValueError:
+            self._class_names.append(class_name)
+            return len(self._class_names) - 1
+
+    def _append_name(self, name):
+        encoded = name.encode("utf-8")
+        self._name_start.append(len(self._name_data))
+        self._name_data += encoded
+        self._name_end.append(len(self._name_data))
+
+    def _get_name(self, index):
+        return self._name_data[self._name_start[index]:self._name_end[index]].decode("utf-8")
+
+    def _set_name(self, index, name):
+        # Renames are rare, so the new name is simply appended to the buffer.
+        encoded = name.encode("utf-8")
+        self._name_start[index] = len(self._name_data)
+        self._name_data += encoded
+        self._name_end[index] = len(self._name_data)
@@ -0,0 +1,245 @@
+"""
+Compact binary format for character rosters.
+
+A file is one buffer with four parts:
+
+    header       magic, version, counts and the offset of each section
+    strings      every distinct string (names, class names, weapon names),
+                 stored once as an offset table plus one UTF-8 blob
+    weapons      one fixed-width record per distinct weapon
+    characters   one fixed-width record per character
+
+Character records refer to strings and weapons by number, so a roster of a
+million characters is a single read followed by struct.iter_unpack over
+fixed-width records instead of a million separate unpickles.
+"""
+
+import struct
+import sys
+from array import array
+
+from project2_starter import Character, Player, Warrior, Mage, Rogue
+from roster import CharacterRoster, RosterView
+from weapon_catalog import CATALOG
+
+MAGIC = b"CRST"
+VERSION = 1
+
+# Class tags stored in each record. Only these classes can be saved.
+CLASS_TAGS = (Character, Player, Warrior, Mage, Rogue)
+_TAG_OF = {cls: tag for tag, cls in enumerate(CLASS_TAGS)}
+
+# magic, version, record count, string count, weapon count,
+# strings offset, weapons offset, characters offset
+HEADER = struct.Struct("<4sHxxIIIQQQ")
+# weapon name id, damage bonus
+WEAPON = struct.Struct("<Ii")
+# class tag, name id, class name id, health, strength, magic, level,
+# experience, weapon id (-1 for no weapon)
+RECORD = struct.Struct("<B3xIIiiiiii")
+
+NO_WEAPON = -1
+
+
+def class_tag(cls):
+    """
+    Return the record tag for a character class. Roster views are saved as
+    their base class; other subclasses can't be saved without losing what
+    makes them different, so they are rejected.
+    """
+    if issubclass(cls, RosterView):
+        cls = cls.__mro__[2]  # (XView, RosterView, X, ...) -> X
+    try:
+        return _TAG_OF[cls]
+    except KeyError:
+        raise ValueError(f"{cls.__name__} has no class tag in the binary format") from None
+
+
+class _StringTable:
+    def __init__(self):
+        self.ids = {}
+        self.strings = []
+
+    def id_of(self, text):
+        string_id = self.ids.get(text)
+        if string_id is None:
+            string_id = self.ids[text] = len(self.strings)
+            self.strings.append(text)
+        return string_id
+
+    def to_bytes(self):
+        blobs = [text.encode("utf-8") for text in self.strings]
+        offsets = array("I", [0])
+        position = 0
+        for blob in blobs:
+            position += len(blob)
+            offsets.append(position)
+        return offsets.tobytes() + b"".join(blobs)
+
+
+def encode(characters):
+    """Encode an iterable of characters (or roster views) into one bytes object"""
+    strings = _StringTable()
+    weapon_ids = {}
+    weapon_records = []
+    records = []
+    for character in characters:
+        if isinstance(character, Player):
+            weapon = character.weapon
+            if weapon is None:
+                weapon_id = NO_WEAPON
+            else:
+                weapon_id = weapon_ids.get(weapon)
+                if weapon_id is None:
+                    weapon_id = weapon_ids[weapon] = len(weapon_records)
+                    weapon_records.append(WEAPON.pack(strings.id_of(weapon.name), weapon.damage_bonus))
+            records.append(RECORD.pack(
+                class_tag(type(character)), strings.id_of(character.name),
+                strings.id_of(character.character_class), character.health,
+                character.strength, character.magic, character.level,
+                character.experience, weapon_id))
+        else:
+            records.append(RECORD.pack(
+                class_tag(type(character)), strings.id_of(character.name), 0,  # no class name
+                character.health, character.strength, character.magic, 0, 0, NO_WEAPON))
+
+    string_bytes = strings.to_bytes()
+    strings_offset = HEADER.size
+    # Pad after the strings so the weapon and character records are 8-byte
+    # aligned in the file (and in memory when the file is mapped).
+    string_bytes += bytes(-(strings_offset + len(string_bytes)) % 8)
+    weapons_offset = strings_offset + len(string_bytes)
+    records_offset = weapons_offset + WEAPON.size * len(weapon_records)
+    header = HEADER.pack(MAGIC, VERSION, len(records), len(strings.strings), len(weapon_records),
+                         strings_offset, weapons_offset, records_offset)
+    return b"".join([header, string_bytes, *weapon_records, *records])
+
+
+def read_header(buffer):
+    """
+    Unpack and check the header. Returns (record count, string count,
+    weapon count, strings offset, weapons offset, records offset).
+    """
+    magic, version, *rest = HEADER.unpack_from(buffer, 0)
+    if magic != MAGIC:
+        raise ValueError("not a character roster file")
+    if version != VERSION:
+        raise ValueError(f"unsupported roster format version {version}")
+    return tuple(rest)
+
+
+def read_strings(buffer, count, offset):
+    """Decode the string table into a list"""
+    offsets = array("I")
+    offsets.frombytes(bytes(buffer[offset:offset + 4 * (count + 1)]))
+    blob_start = offset + 4 * (count + 1)
+    blob = bytes(buffer[blob_start:blob_start + offsets[-1]]) if count else b""
+    text = blob.decode("utf-8")
+    if len(text) == len(blob):
+        # Pure ASCII: byte offsets are character offsets, so slice the text directly.
+        return [text[offsets[i]:offsets[i + 1]] for i in range(count)]
+    return [blob[offsets[i]:offsets[i + 1]].decode("utf-8") for i in range(count)]
+
+
+def read_weapons(buffer, count, offset, strings, catalog=CATALOG):
+    """Decode the weapon table into shared Weapons from the catalog"""
+    end = offset + WEAPON.size * count
+    return [catalog.get(strings[name_id], bonus)
+            for name_id, bonus in WEAPON.iter_unpack(buffer[offset:end])]
+
+
+def _build_character(cls, name, class_name, health, strength, magic, level, experience, weapon):
+    """Create a real (non-player) character from record fields without running __init__"""
+    character = object.__new__(cls)
+    character.name = name
+    character.health = health
+    character.strength = strength
+    character.magic = magic
+    # Position and speed aren't part of the format, so they keep their defaults.
+    character._overrides = None
+    character._stats_cache = None
+    return character
+
+
+def _build_player(cls, name, class_name, health, strength, magic, level, experience, weapon):
+    """Create a real player from record fields without running __init__"""
+    player = object.__new__(cls)
+    player.attack_damage = player.special_damage = None
+    player.name = name
+    player.health = health
+    player.strength = strength
+    player.magic = magic
+    player._overrides = None
+    player._stats_cache = None
+    player.character_class = class_name
+    player.level = level
+    player.experience = experience
+    player.weapon = weapon
+    player.refresh_damage()
+    return player
+
+
+_BUILDERS = [(cls, _build_player if issubclass(cls, Player) else _build_character)
+             for cls in CLASS_TAGS]
+
+
+def decode(data, catalog=CATALOG):
+    """Decode bytes (or any buffer) from encode() back into real character instances"""
+    buffer = memoryview(data)
+    count, string_count, weapon_count, strings_offset, weapons_offset, records_offset = read_header(buffer)
+    strings = read_strings(buffer, string_count, strings_offset)
+    weapons = read_weapons(buffer, weapon_count, weapons_offset, strings, catalog) + [None]
+    builders = _BUILDERS
+    end = records_offset + RECORD.size * count
+    characters = []
+    append = characters.append
+    # weapons[-1] is None, so NO_WEAPON (-1) needs no special case.
+    for tag, name_id, class_id, health, strength, magic, level, experience, weapon_id \
+            in RECORD.iter_unpack(buffer[records_offset:end]):
+        cls, build = builders[tag]
+        append(build(cls, strings[name_id], strings[class_id], health, strength,
+                     magic, level, experience, weapons[weapon_id]))
+    return characters
+
+
+def decode_roster(data):
+    """
+    Decode straight into a CharacterRoster, without creating any character
+    objects at all. Weapons are dropped because rosters don't hold them.
+    """
+    buffer = memoryview(data)
+    count, string_count, weapon_count, strings_offset, weapons_offset, records_offset = read_header(buffer)
+    strings = read_strings(buffer, string_count, strings_offset)
+    end = records_offset + RECORD.size * count
+    roster = CharacterRoster()
+    if count == 0:
+        return roster
+    records = buffer[records_offset:end]
+    if sys.byteorder == "little":
+        # Every record is nine little-endian 32-bit words, so on a
+        # little-endian machine each field is a strided view of the buffer.
+        # (The tag byte is followed by three zero bytes, so word 0 is the tag.)
+        words = records.cast("i")
+        fields = [words[i::9].tolist() for i in range(8)]
+    else:
+        fields = list(zip(*RECORD.iter_unpack(records)))[:8]
+    tags, name_ids, class_ids, health, strength, magic, level, experience = fields
+    roster.extend_columns(
+        [CLASS_TAGS[tag] for tag in tags],
+        [strings[name_id] for name_id in name_ids],
+        health, strength, magic,
+        [strings[class_id] for class_id in class_ids],
+        level, experience)
+    return roster
+
+
+def dump(characters, path):
+    """Write characters to a file in the binary format"""
+    with open(path, "wb") as f:
+        f.write(encode(characters))
+
+
+def load(path, catalog=CATALOG):
+    """Read a whole roster file with one read and decode it"""
+    with open(path, "rb") as f:
+        return decode(f.read(), catalog)
@@ -0,0 +1,253 @@
+"""
+Spatial index for a 2D battlefield.
+
+SpatialGrid buckets characters into square cells by their x/y position.
+A radius query only looks at the cells the circle overlaps, and a nearest
+query searches outward ring by ring from the query point, so neither
+touches units on the far side of the map. Rings are clipped to the
+occupied cells, and once a ring would cover more cells than are occupied
+the occupied cells are scanned instead, so an empty map costs nothing.
+Moving a unit only does work when it crosses into another cell, and units
+that die can be removed in constant time.
+
+area_fireball() and area_power_strike() are multi-target versions of the
+Mage and Warrior special abilities built on the index.
+"""
+
+import math
+
+from project2_starter import Mage, Warrior
+
+
+class SpatialGrid:
+    """
+    Uniform grid of cells, each holding the units whose position falls in it.
+
+    cell_size should be about the radius of the typical query: much smaller
+    means visiting many empty cells, much larger means checking many units
+    that are out of range.
+    """
+
+    def __init__(self, cell_size=10.0, units=()):
+        if cell_size <= 0:
+            raise ValueError("cell_size must be positive")
+        self.cell_size = cell_size
+        self._cells = {}      # (cell x, cell y) -> {unit: None} (insertion ordered)
+        self._cell_of = {}    # unit -> its cell key
+        # (min x, min y, max x, max y) of the occupied cells, or None when it
+        # has to be worked out again (see _occupied_bounds).
+        self._bounds = None
+        for unit in units:
+            self.add(unit)
+
+    def _key(self, x, y):
+        size = self.cell_size
+        return (math.floor(x / size), math.floor(y / size))
+
+    def __len__(self):
+        return len(self._cell_of)
+
+    def __contains__(self, unit):
+        return unit in self._cell_of
+
+    def __iter__(self):
+        return iter(self._cell_of)
+
+    def add(self, unit):
+        """Index a unit at its current (x, y)"""
+        if unit in self._cell_of:
+            raise ValueError(f"{unit.name} is already in the grid")
+        key = self._key(unit.x, unit.y)
+        self._insert(unit, key)
+
+    def _insert(self, unit, key):
+        cell = self._cells.get(key)
+        if cell is None:
+            if not self._cells:
+                self._bounds = (key[0], key[1], key[0], key[1])
+            elif self._bounds is not None:
+                min_x, min_y, max_x, max_y = self._bounds
+                self._bounds = (min(min_x, key[0]), min(min_y, key[1]),
+                                max(max_x, key[0]), max(max_y, key[1]))
+            cell = self._cells[key] = {}
+        cell[unit] = None
+        self._cell_of[unit] = key
+
+    def _take_out(self, unit, key):
+        cell = self._cells[key]
+        del cell[unit]
+        if not cell:
+            del self._cells[key]
+            bounds = self._bounds
+            if bounds is not None and (key[0] in (bounds[0], bounds[2]) or key[1] in (bounds[1], bounds[3])):
+                self._bounds = None  # an edge cell emptied; the bounds may shrink
+
+    def _occupied_bounds(self):
+        bounds = self._bounds
+        if bounds is None:
+            xs = [key[0] for key in self._cells]
+            ys = [key[1] for key in self._cells]
+            bounds = self._bounds = (min(xs), min(ys), max(xs), max(ys))
+        return bounds
+
+    def remove(self, unit):
+        """Take a unit out of the grid (for example when it dies)"""
+        self._take_out(unit, self._cell_of.pop(unit))
+
+    def discard(self, unit):
+        """Remove a unit if it is in the grid"""
+        if unit in self._cell_of:
+            self.remove(unit)
+
+    def move(self, unit, x, y):
+        """Move a unit to (x, y), updating its position and its cell"""
+        unit.x = x
+        unit.y = y
+        key = self._key(x, y)
+        old_key = self._cell_of[unit]
+        if key != old_key:
+            self._take_out(unit, old_key)
+            self._insert(unit, key)
+
+    def within(self, x, y, radius, where=None):
+        """
+        Return every unit within `radius` of (x, y) (distance <= radius),
+        optionally only those for which where(unit) is true.
+        """
+        min_x, min_y = self._key(x - radius, y - radius)
+        max_x, max_y = self._key(x + radius, y + radius)
+        limit = radius * radius
+        cells = self._cells
+        found = []
+        if (max_x - min_x + 1) * (max_y - min_y + 1) > len(cells):
+            # The circle covers more cells than exist: walk the occupied ones.
+            keys = [key for key in cells if min_x <= key[0] <= max_x and min_y <= key[1] <= max_y]
+        else:
+            keys = [(cx, cy) for cx in range(min_x, max_x + 1) for cy in range(min_y, max_y + 1)]
+        for key in keys:
+            cell = cells.get(key)
+            if cell is None:
+                continue
+            for unit in cell:
+                dx = unit.x - x
+                dy = unit.y - y
+                if dx * dx + dy * dy <= limit and (where is None or where(unit)):
+                    found.append(unit)
+        return found
+
+    def nearest(self, x, y, where=None, max_radius=math.inf):
+        """
+        Return the unit closest to (x, y) for which where(unit) is true
+        (any unit if where is None), or None if there is none within
+        max_radius.
+        """
+        cells = self._cells
+        if not cells:
+            return None
+        size = self.cell_size
+        center_x, center_y = self._key(x, y)
+        min_x, min_y, max_x, max_y = self._occupied_bounds()
+        # Rings closer than the occupied cells are empty, and rings past
+        # them don't exist.
+        first_ring = max(min_x - center_x, center_x - max_x, min_y - center_y, center_y - max_y, 0)
+        last_ring = max(center_x - min_x, max_x - center_x, center_y - min_y, max_y - center_y)
+        limit = max_radius * max_radius
+        best = None
+        best_distance = math.inf
+        visited = 0
+        for ring in range(first_ring, last_ring + 1):
+            # Units in this ring are at least (ring - 1) * cell_size away.
+            reach = max(ring - 1, 0) * size
+            if reach * reach > min(best_distance, limit):
+                break
+            keys = _Ring(center_x, center_y, ring, min_x, min_y, max_x, max_y)
+            visited += len(keys)
+            last = visited > len(cells)
+            if last:
+                # More cells to walk than are occupied: check every occupied
+                # cell from this ring outward instead, and stop there.
+                keys = [key for key in cells
+                        if max(abs(key[0] - center_x), abs(key[1] - center_y)) >= ring]
+            for key in keys:
+                cell = cells.get(key)
+                if cell is None:
+                    continue
+                for unit in cell:
+                    dx = unit.x - x
+                    dy = unit.y - y
+                    distance = dx * dx + dy * dy
+                    if distance < best_distance and distance <= limit \
+                            and (where is None or where(unit)):
+                        best, best_distance = unit, distance
+            if last:
+                break
+        return best
+
+
+class _Ring:
+    """
+    Cell keys exactly `ring` cells from a center (Chebyshev distance),
+    clipped to a bounding box. len() is known before any key is made.
+    """
+
+    __slots__ = ("_rows", "_xs", "_columns", "_ys")
+
+    def __init__(self, center_x, center_y, ring, min_x, min_y, max_x, max_y):
+        low_x, high_x = center_x - ring, center_x + ring
+        low_y, high_y = center_y - ring, center_y + ring
+        # Top and bottom rows take the corners; the side columns skip them.
+        self._rows = [cy for cy in dict.fromkeys((low_y, high_y)) if min_y <= cy <= max_y]
+        self._xs = range(max(low_x, min_x), min(high_x, max_x) + 1)
+        self._columns = [cx for cx in dict.fromkeys((low_x, high_x)) if min_x <= cx <= max_x]
+        self._ys = range(max(low_y + 1, min_y), min(high_y - 1, max_y) + 1)
+
+    def __len__(self):
+        return len(self._rows) * len(self._xs) + len(self._columns) * len(self._ys)
+
+    def __iter__(self):
+        for cy in self._rows:
+            for cx in self._xs:
+                yield (cx, cy)
+        for cx in self._columns:
+            for cy in self._ys:
+                yield (cx, cy)
+
+
+def _area_special(caster, grid, x, y, radius, where):
+    """Hit every unit in range except the caster; units that die leave the grid"""
+    damage = caster.special_damage
+    targets = [unit for unit in grid.within(x, y, radius, where) if unit is not caster]
+    for target in targets:
+        target.take_damage(damage)
+        if target.health <= 0:
+            grid.remove(target)
+    return targets, damage
+
+
+def area_fireball(mage, grid, radius, x=None, y=None, where=None):
+    """
+    Fireball that hits every unit within radius of (x, y). A coordinate
+    that isn't given defaults to the mage's own. Each target takes the
+    normal Fireball damage. Returns the list of units hit.
+    """
+    if not isinstance(mage, Mage):
+        raise TypeError("only a Mage can cast Fireball")
+    if x is None:
+        x = mage.x
+    if y is None:
+        y = mage.y
+    targets, damage = _area_special(mage, grid, x, y, radius, where)
+    print(f"🔥 {mage.name} casts Fireball, hitting {len(targets)} targets for {damage} damage each!")
+    return targets
+
+
+def area_power_strike(warrior, grid, radius, where=None):
+    """
+    Power Strike swung in a circle: hits every unit within radius of the
+    warrior for the normal Power Strike damage. Returns the list of units hit.
+    """
+    if not isinstance(warrior, Warrior):
+        raise TypeError("only a Warrior can use Power Strike")
+    targets, damage = _area_special(warrior, grid, warrior.x, warrior.y, radius, where)
+    print(f"💥 {warrior.name} uses Power Strike, hitting {len(targets)} targets for {damage} damage each!")
+    return targets
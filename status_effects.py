@@ -0,0 +1,110 @@
+"""
+Status effects: burn, bleed and stun.
+
+Every active effect is one row in a set of parallel arrays (target, kind,
+damage per tick, ticks left) instead of an object or callback per effect.
+StatusEffects.tick() goes over the whole table once: it adds up the
+damage each target takes from all of its effects, applies the total with
+a single take_damage call per target (so health clamps at 0 exactly as it
+does for attacks), counts every effect down and drops the rows that have
+run out or whose target has died.
+
+Burn doesn't stack: burning a target that is already burning refreshes
+the burn (keeping the stronger damage and the longer duration). Bleeds
+stack, one row per application. Stun does no damage; a stunned target
+should skip its turns until the stun wears off (see TimelineBattle).
+"""
+
+from array import array
+
+# Effect kinds stored in the table.
+BURN = 0
+BLEED = 1
+STUN = 2
+EFFECT_NAMES = ("burn", "bleed", "stun")
+
+
+class StatusEffects:
+    """
+    Table of every active effect in a battle.
+    """
+
+    def __init__(self):
+        self._targets = []              # character for each row
+        self._kinds = array("B")
+        self._damage = array("i")       # damage per tick
+        self._remaining = array("i")    # ticks left
+        self._burn_row = {}             # target -> its burn row
+        self._stunned = set()           # targets with at least one stun
+
+    def __len__(self):
+        return len(self._targets)
+
+    def apply(self, target, kind, duration, damage=0):
+        """Attach an effect lasting `duration` ticks to a target"""
+        if kind not in (BURN, BLEED, STUN):
+            raise ValueError(f"unknown effect kind {kind!r}")
+        if duration <= 0:
+            return
+        if kind == BURN:
+            row = self._burn_row.get(target)
+            if row is not None:
+                self._damage[row] = max(self._damage[row], damage)
+                self._remaining[row] = max(self._remaining[row], duration)
+                return
+            self._burn_row[target] = len(self._targets)
+        elif kind == STUN:
+            damage = 0
+            self._stunned.add(target)
+        self._targets.append(target)
+        self._kinds.append(kind)
+        self._damage.append(damage)
+        self._remaining.append(duration)
+
+    def is_stunned(self, target):
+        """True while a stun on the target hasn't worn off"""
+        return target in self._stunned
+
+    def effects_on(self, target):
+        """Return (effect name, damage per tick, ticks left) for every effect on a target"""
+        return [(EFFECT_NAMES[self._kinds[row]], self._damage[row], self._remaining[row])
+                for row, other in enumerate(self._targets) if other is target]
+
+    def tick(self):
+        """
+        Process one tick of every effect.
+        Returns a list of (target, health lost) for each target that took damage.
+        """
+        targets = self._targets
+        totals = {}
+        for target, damage in zip(targets, self._damage):
+            if damage:
+                totals[target] = totals.get(target, 0) + damage
+
+        hits = []
+        for target, total in totals.items():
+            before = target.health
+            target.take_damage(total)
+            hits.append((target, before - target.health))
+
+        # Count down and keep the rows that are still running on living targets.
+        keep = [row for row, remaining in enumerate(self._remaining)
+                if remaining > 1 and targets[row].health > 0]
+        if len(keep) != len(targets):
+            self._targets = [targets[row] for row in keep]
+            self._kinds = array("B", [self._kinds[row] for row in keep])
+            self._damage = array("i", [self._damage[row] for row in keep])
+            self._remaining = array("i", [self._remaining[row] - 1 for row in keep])
+            self._reindex()
+        else:
+            self._remaining = array("i", [remaining - 1 for remaining in self._remaining])
+        return hits
+
+    def _reindex(self):
+        self._burn_row = {}
+        self._stunned = set()
+        for row, (target, kind) in enumerate(zip(self._targets, self._kinds)):
+            if kind == BURN:
+                self._burn_row[target] = row
+            elif kind == STUN:
+                self._stunned.add(target)
@@ -0,0 +1,188 @@
+"""
+Team battles.
+
+TeamBattle generalizes SimpleBattle to two parties of any size. Every
+round each living member of team 1 attacks once, then each living member
+of team 2, until one side is wiped out or the round cap is hit. Attacks
+go through battle_engine.strike, so damage, crits and events are exactly
+those of the headless engines.
+
+Who gets attacked is decided by a targeting policy per team. The heap
+policies never scan the opposing team: entries are (key, index) pairs,
+and instead of searching the heap when a unit's health changes, the battle
+calls update(unit), which pushes a fresh entry if the unit's key actually
+changed. Old entries are spotted and thrown away when they reach the top
+of the heap (their key no longer matches the unit, or the unit is dead).
+Picking a target is O(log n).
+"""
+
+import heapq
+import random
+from collections import namedtuple
+
+from battle_engine import ResultEvent, stats_event, strike
+
+# winner is 1 or 2 (None for a tie); survivors are lists of living units.
+TeamReport = namedtuple("TeamReport", "rounds winner survivors1 survivors2")
+
+
+class LowestHealth:
+    """
+    Targets the living enemy with the lowest health (lowest index on ties).
+    """
+
+    def __init__(self, units):
+        self.units = list(units)
+        self._index = {unit: i for i, unit in enumerate(self.units)}
+        self._pushed = [self._key(unit) for unit in self.units]  # newest key pushed per index
+        self._heap = [(key, i) for i, key in enumerate(self._pushed) if self.units[i].health > 0]
+        heapq.heapify(self._heap)
+
+    def _key(self, unit):
+        """Heap key: the smallest key is the preferred target"""
+        return unit.health
+
+    def update(self, unit):
+        """Tell the policy that unit's stats changed"""
+        if unit.health > 0:
+            i = self._index[unit]
+            key = self._key(unit)
+            if key != self._pushed[i]:
+                self._pushed[i] = key
+                heapq.heappush(self._heap, (key, i))
+
+    def pick(self, attacker, rng):
+        """Return the target for attacker, or None when every enemy is down"""
+        heap = self._heap
+        units = self.units
+        pushed = self._pushed
+        while heap:
+            key, i = heap[0]
+            unit = units[i]
+            alive = unit.health > 0
+            if alive:
+                live = self._key(unit)
+                if key == live:
+                    return unit
+            heapq.heappop(heap)
+            if alive and key == pushed[i]:
+                # Newest entry, but the unit changed without an update():
+                # put it back with the right key.
+                pushed[i] = live
+                heapq.heappush(heap, (live, i))
+        return None
+
+
+class HighestThreat(LowestHealth):
+    """
+    Targets the living enemy that hits hardest (highest attack_damage).
+    """
+
+    def _key(self, unit):
+        return -unit.attack_damage
+
+
+class RandomTarget:
+    """
+    Targets a uniformly random living enemy. The living enemies are kept in
+    a list, and dead ones are swapped out, so both picking and removing are O(1).
+    """
+
+    def __init__(self, units):
+        self._alive = [unit for unit in units if unit.health > 0]
+        self._position = {unit: i for i, unit in enumerate(self._alive)}
+
+    def update(self, unit):
+        """Tell the policy that unit's stats changed"""
+        if unit.health <= 0 and unit in self._position:
+            position = self._position.pop(unit)
+            last = self._alive.pop()
+            if last is not unit:
+                self._alive[position] = last
+                self._position[last] = position
+
+    def pick(self, attacker, rng):
+        """Return the target for attacker, or None when every enemy is down"""
+        if not self._alive:
+            return None
+        return self._alive[rng.randint(0, len(self._alive) - 1)]
+
+
+class TeamBattle:
+    """
+    A battle between two teams (lists of characters).
+
+    target1 and target2 are the policy classes team 1 and team 2 use to
+    choose whom to attack. Units are never copied, so the teams are left
+    damaged just like the characters after SimpleBattle.fight.
+    """
+
+    def __init__(self, team1, team2, target1=LowestHealth, target2=LowestHealth,
+                 sink=None, rng=random, max_rounds=100, team_names=("Team 1", "Team 2")):
+        self.team1 = list(team1)
+        self.team2 = list(team2)
+        self.target1 = target1
+        self.target2 = target2
+        self.sink = sink
+        self.rng = rng
+        self.max_rounds = max_rounds
+        self.team_names = team_names
+
+    def run(self):
+        """Fight until one team is wiped out or the round cap is hit. Returns a TeamReport"""
+        emit = self.sink.emit if self.sink is not None else None
+        rng = self.rng
+        # Team 1 picks its targets from team 2 and the other way round.
+        targets_of_1 = self.target1(self.team2)
+        targets_of_2 = self.target2(self.team1)
+        alive1 = [unit for unit in self.team1 if unit.health > 0]
+        alive2 = [unit for unit in self.team2 if unit.health > 0]
+
+        if emit is not None:
+            for unit in self.team1 + self.team2:
+                emit(stats_event("start", unit))
+
+        rounds = 0
+        while alive1 and alive2 and rounds < self.max_rounds:
+            rounds += 1
+            for attackers, targets in ((alive1, targets_of_1), (alive2, targets_of_2)):
+                for attacker in attackers:
+                    if attacker.health <= 0:
+                        continue  # fell earlier this round
+                    target = targets.pick(attacker, rng)
+                    if target is None:
+                        break
+                    strike(attacker, target, rounds, emit, rng)
+                    targets.update(target)
+            alive1 = [unit for unit in alive1 if unit.health > 0]
+            alive2 = [unit for unit in alive2 if unit.health > 0]
+
+        if emit is not None:
+            for unit in self.team1 + self.team2:
+                emit(stats_event("end", unit))
+        winner = self.report_result(alive1, alive2, emit)
+        return TeamReport(rounds, winner, alive1, alive2)
+
+    def report_result(self, alive1, alive2, emit):
+        """
+        Decide the winner like SimpleBattle does, by remaining health (the
+        team's total). Returns 1, 2 or None for a tie.
+        """
+        health1 = sum(unit.health for unit in alive1)
+        health2 = sum(unit.health for unit in alive2)
+        if health1 > health2:
+            winner = 1
+        elif health2 > health1:
+            winner = 2
+        else:
+            winner = None
+        if emit is not None:
+            if winner is None:
+                emit(ResultEvent(None, None, True))
+            else:
+                emit(ResultEvent(self.team_names[winner - 1], self.team_names[2 - winner], False))
+        return winner
+
+    def fight(self):
+        """Run the whole battle and return the winning team (1, 2 or None)"""
+        return self.run().winner
@@ -0,0 +1,51 @@
+import pytest
+from project2_starter import Character, Warrior, Mage, Rogue
+from analysis import MatchupOdds, matchup_odds, outcome_odds
+from matchups import run_matchups
+
+class TestExactOdds:
+    """Test the dynamic-programming matchup engine"""
+
+    def test_deterministic_matchup(self):
+        """Test a matchup with no randomness at all"""
+        assert matchup_odds(Warrior("W"), Mage("M")) == MatchupOdds(1.0, 0.0, 0.0), "Warrior always beats Mage"
+
+    def test_probabilities_sum_to_one(self):
+        """Test that win, tie and loss cover every outcome"""
+        odds = matchup_odds(Rogue("R1"), Rogue("R2"))
+
+        assert sum(odds) == pytest.approx(1.0), "Probabilities should sum to 1"
+
+    def test_hand_worked_example(self):
+        """Test a small case worked out by hand"""
+        # Rogue needs a crit (24 damage) to finish a 20 health dummy in one round;
+        # otherwise the dummy hits back for 90 and wins.
+        rogue = Rogue("R")
+        dummy = Character("Dummy", 20, 90, 0)
+
+        odds = matchup_odds(rogue, dummy)
+
+        assert odds.win == pytest.approx(0.3), "Rogue wins only on a crit"
+        assert odds.loss == pytest.approx(0.7), "Otherwise the dummy wins"
+
+    def test_round_cap_uses_health(self):
+        """Test that hitting the round cap is decided by remaining health"""
+        odds = outcome_odds(100, 0, 0, 100, 0, 0, max_rounds=3)
+
+        assert odds == MatchupOdds(0.0, 1.0, 0.0), "Nobody takes damage, so it's a tie"
+
+    def test_matches_monte_carlo(self):
+        """Test that sampling agrees with the exact answer"""
+        exact = matchup_odds(Rogue("R"), Mage("M"))
+        sampled = run_matchups(2000, classes=(Rogue, Mage), seed=1, workers=1)[("Rogue", "Mage")]
+
+        low, high = sampled.confidence_interval(z=3.5)
+        assert low <= exact.win <= high, "Exact odds should fall inside the sampled interval"
+
+    def test_results_are_cached(self):
+        """Test that the same stat tuple is only computed once"""
+        outcome_odds.cache_clear()
+        matchup_odds(Rogue("A"), Warrior("B"))
+        matchup_odds(Rogue("C"), Warrior("D"))
+
+        assert outcome_odds.cache_info().hits == 1, "Second lookup should hit the cache"
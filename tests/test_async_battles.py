@@ -0,0 +1,104 @@
+import asyncio
+
+import pytest
+from project2_starter import Character, Warrior, Mage, Rogue
+from battle_engine import MultiRoundBattle, ListSink, AttackEvent, ResultEvent
+from async_battles import BattleScheduler
+from rng import BlockRNG
+
+class TestBattleScheduler:
+    """Test the asyncio battle scheduler"""
+
+    def test_results_match_sync_runner(self):
+        """Test that async fights give the same reports as MultiRoundBattle.run"""
+        async def main():
+            scheduler = BattleScheduler()
+            return await scheduler.run_all([
+                MultiRoundBattle(Rogue("A"), Mage("B"), rng=BlockRNG(i)) for i in range(20)])
+
+        reports = asyncio.run(main())
+        expected = [MultiRoundBattle(Rogue("A"), Mage("B"), rng=BlockRNG(i)).run() for i in range(20)]
+
+        assert [r.rounds for r in reports] == [r.rounds for r in expected], "Rounds should match"
+        assert [list(r.damage1) for r in reports] == [list(r.damage1) for r in expected], "Damage should match"
+
+    def test_battle_sink_still_gets_events(self):
+        """Test that a battle's own sink sees the same events as a synchronous run"""
+        sink = ListSink()
+        expected = ListSink()
+        MultiRoundBattle(Rogue("A"), Mage("B"), expected, BlockRNG(4)).run()
+
+        async def main():
+            scheduler = BattleScheduler()
+            subscription = scheduler.subscribe()
+            await scheduler.fight(MultiRoundBattle(Rogue("A"), Mage("B"), sink, BlockRNG(4)))
+            await scheduler.close()
+            return [event async for _, event in subscription]
+
+        published = asyncio.run(main())
+
+        assert sink.events == expected.events, "The battle's sink should get every event"
+        assert published == expected.events, "Subscribers should get them too"
+
+    def test_active_fights_are_capped(self):
+        """Test that no more than max_active fights run at once"""
+        active = 0
+        peak = 0
+
+        class CountingBattle(MultiRoundBattle):
+            def play_round(self, *args):
+                nonlocal active, peak
+                if args[0] == 1:
+                    active += 1
+                    peak = max(peak, active)
+                decided = super().play_round(*args)
+                if decided:
+                    active -= 1
+                return decided
+
+        async def main():
+            scheduler = BattleScheduler(max_active=5)
+            await scheduler.run_all([CountingBattle(Warrior("W"), Mage("M")) for _ in range(50)])
+
+        asyncio.run(main())
+        assert peak == 5, "At most five fights should be active at once"
+
+    def test_fights_interleave(self):
+        """Test that fights yield to each other between rounds"""
+        order = []
+
+        async def main():
+            scheduler = BattleScheduler()
+            consumer_events = scheduler.subscribe()
+
+            async def consume():
+                async for battle_id, event in consumer_events:
+                    if type(event) is AttackEvent:
+                        order.append(battle_id)
+
+            consumer = asyncio.ensure_future(consume())
+            await scheduler.run_all([MultiRoundBattle(Warrior("W"), Mage("M")) for _ in range(2)])
+            await scheduler.close()
+            await consumer
+
+        asyncio.run(main())
+        assert order[:4] == [1, 1, 2, 2], "Second fight should start before the first one ends"
+        assert len(order) == 14, "Both fights' attacks should be streamed"
+
+    def test_many_subscribers(self):
+        """Test that every subscriber sees every event"""
+        async def main():
+            scheduler = BattleScheduler(queue_size=2)
+            subscriptions = [scheduler.subscribe(), scheduler.subscribe()]
+
+            async def collect(subscription):
+                return [event async for _, event in subscription]
+
+            consumers = [asyncio.ensure_future(collect(s)) for s in subscriptions]
+            await scheduler.fight(MultiRoundBattle(Warrior("W"), Character("Dummy", 30, 1, 0)))
+            await scheduler.close()
+            return await asyncio.gather(*consumers)
+
+        first, second = asyncio.run(main())
+        assert first == second, "Both subscribers should get the same events"
+        assert first[-1] == ResultEvent("W", "Dummy", False), "Result should be the last event"
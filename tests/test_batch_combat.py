@@ -0,0 +1,117 @@
+import random
+
+import pytest
+from project2_starter import Character, Warrior, Mage, Rogue, Weapon
+from roster import CharacterRoster
+from batch_combat import attack_rule, resolve_attacks, resolve_roster_attacks
+
+def make_party():
+    """Build one of each class plus a plain Character"""
+    return [Warrior("W"), Mage("M"), Rogue("R"), Character("C", 60, 7, 3)]
+
+class Armoured(Character):
+    """Character whose armour soaks 5 damage from every hit"""
+    __slots__ = ()
+
+    def take_damage(self, damage):
+        super().take_damage(max(0, damage - 5))
+
+class TestBatchMatchesPerObject:
+    """Test that batch resolution gives the same results as attack()"""
+
+    def test_same_health_as_sequential_attacks(self):
+        """Test that a batch matches calling attack() pair by pair"""
+        attackers_a, targets_a = make_party(), make_party()[::-1]
+        attackers_b, targets_b = make_party(), make_party()[::-1]
+
+        random.seed(1234)
+        for attacker, target in zip(attackers_a, targets_a):
+            attacker.attack(target)
+
+        random.seed(1234)
+        resolve_attacks(attackers_b, targets_b)
+
+        assert [t.health for t in targets_a] == [t.health for t in targets_b], "Batch should match per-object attacks"
+
+    def test_repeated_hits_on_one_target_clamp(self):
+        """Test that many hits on one target still clamp at zero"""
+        target = Character("Dummy", 50, 0, 0)
+
+        damages = resolve_attacks([Warrior("W1"), Warrior("W2"), Warrior("W3")], [target] * 3)
+
+        assert damages == [20, 20, 20], "Each warrior should deal strength + 5"
+        assert target.health == 0, "Health should not go below 0"
+
+    def test_rogue_crits_use_rng(self):
+        """Test that rogue crits come from the given rng"""
+        rogues = [Rogue(f"R{i}") for i in range(200)]
+        targets = [Character(f"T{i}", 100, 0, 0) for i in range(200)]
+
+        damages = resolve_attacks(rogues, targets, random.Random(7))
+
+        assert set(damages) == {12, 24}, "Rogues should hit for 12 or crit for 24"
+        assert damages == resolve_attacks(rogues, targets, random.Random(7)), "Same seed should give same crits"
+
+    def test_mismatched_lengths(self):
+        """Test that attackers and targets must line up"""
+        with pytest.raises(ValueError):
+            resolve_attacks([Warrior("W")], [])
+
+class TestAttackRules:
+    """Test the per-class rule lookup"""
+
+    def test_overridden_attack_is_rejected(self):
+        """Test that a class with its own attack() can't be batched"""
+        class Berserker(Warrior):
+            def attack(self, target):
+                target.take_damage(99)
+
+        with pytest.raises(TypeError):
+            attack_rule(Berserker)
+
+    def test_overridden_take_damage_is_used(self):
+        """Test that a target with its own take_damage gets every hit through it"""
+        scalar, batch = Armoured("A", 100, 0, 0), Armoured("A", 100, 0, 0)
+        for _ in range(3):
+            Warrior("W").attack(scalar)
+
+        resolve_attacks([Warrior("W1"), Warrior("W2"), Warrior("W3")], [batch] * 3)
+
+        assert batch.health == scalar.health == 55, "Armour should soak 5 from each hit"
+
+class TestRosterBatch:
+    """Test batch resolution straight on roster columns"""
+
+    def test_roster_batch_matches_objects(self):
+        """Test that the roster path deals the same damage"""
+        roster = CharacterRoster(make_party())
+
+        damages = resolve_roster_attacks(roster, [0, 1, 3], [1, 0, 0])
+
+        assert damages == [20, 20, 7], "Damage should follow each class's rule"
+        assert roster[0].health == 120 - 27, "Warrior should take both hits"
+        assert roster[1].health == 60, "Mage should take the warrior's hit"
+
+    def test_roster_overridden_take_damage(self):
+        """Test that the roster path also respects an overridden take_damage"""
+        roster = CharacterRoster([Warrior("W"), Armoured("A", 100, 0, 0)])
+
+        resolve_roster_attacks(roster, [0, 0], [1, 1])
+
+        assert roster[1].health == 100 - 2 * 15, "Each hit should go through the armour"
+
+class TestDamageSources:
+    """Test where batch damage numbers come from"""
+
+    def test_rules_match_base_damage(self):
+        """Test that the rule table agrees with each class's base damage"""
+        for character in make_party():
+            stat, bonus, crit = attack_rule(type(character))
+            assert getattr(character, stat) + bonus == character.attack_damage, f"{type(character).__name__} rule should match"
+
+    def test_weapon_bonus_included(self):
+        """Test that batch resolution counts equipped weapons"""
+        warrior = Warrior("Armed")
+        warrior.equip(Weapon("War Hammer", 20))
+
+        assert resolve_attacks([warrior], [Character("T", 100, 0, 0)]) == [40], "Weapon bonus should be added"
@@ -0,0 +1,114 @@
+import random
+
+import pytest
+from project2_starter import Character, SimpleBattle, Warrior, Mage, Rogue
+from battle_engine import (HeadlessBattle, MultiRoundBattle, ListSink, PrintSink,
+                           AttackEvent, DamageEvent, StatsEvent, ResultEvent, stats_event)
+
+class TestHeadlessBattle:
+    """Test that the headless engine matches SimpleBattle"""
+
+    def test_same_outcome_as_simple_battle(self):
+        """Test that both engines leave the characters in the same state"""
+        warrior1, mage1 = Warrior("W"), Mage("M")
+        warrior2, mage2 = Warrior("W"), Mage("M")
+
+        SimpleBattle(warrior1, mage1).fight()
+        winner = HeadlessBattle(warrior2, mage2).fight()
+
+        assert (warrior1.health, mage1.health) == (warrior2.health, mage2.health), "Health should match SimpleBattle"
+        assert winner is warrior2, "Warrior should win"
+
+    def test_silent_without_sink(self, capsys):
+        """Test that nothing is printed when there is no sink"""
+        HeadlessBattle(Warrior("W"), Rogue("R")).fight()
+
+        assert capsys.readouterr().out == "", "Headless battle should not print"
+
+    def test_second_attack_skipped_when_defender_dies(self):
+        """Test that a defeated character does not strike back"""
+        sink = ListSink()
+        attacker = Warrior("W")
+        HeadlessBattle(attacker, Character("Weak", 10, 50, 0), sink).fight()
+
+        attacks = [event for event in sink.events if type(event) is AttackEvent]
+        assert len(attacks) == 1, "Only one attack should happen"
+        assert attacker.health == 120, "Defeated character should not attack"
+
+class TestEvents:
+    """Test the event records"""
+
+    def test_event_sequence(self):
+        """Test the order and contents of emitted events"""
+        sink = ListSink()
+        HeadlessBattle(Warrior("W"), Mage("M"), sink).fight()
+
+        kinds = [type(event) for event in sink.events]
+        assert kinds == [StatsEvent, StatsEvent, AttackEvent, DamageEvent,
+                         AttackEvent, DamageEvent, StatsEvent, StatsEvent, ResultEvent], "Events should follow the fight"
+        assert sink.events[3] == DamageEvent(1, "M", 20, 60), "Damage event should record health after the hit"
+        assert sink.events[-1] == ResultEvent("W", "M", False), "Result should name the winner"
+
+    def test_rogue_critical_flag(self):
+        """Test that crits are marked on the attack event"""
+        sink = ListSink()
+        HeadlessBattle(Rogue("R"), Character("Dummy", 500, 0, 0), sink, random.Random(3)).fight()
+
+        attack = sink.events[2]
+        assert attack.damage == (24 if attack.critical else 12), "Crit flag should match the damage"
+
+    def test_print_sink(self):
+        """Test that PrintSink writes text only when asked"""
+        lines = []
+        HeadlessBattle(Warrior("W"), Mage("M"), PrintSink(lines.append)).fight()
+
+        assert lines[-1] == "🏆 W wins!", "Print sink should announce the winner"
+        assert any("attacks M for 20" in line for line in lines), "Print sink should describe attacks"
+
+    def test_print_sink_stats_match_display_stats(self, capsys):
+        """Test that PrintSink prints stats exactly like display_stats"""
+        warrior, dummy = Warrior("W"), Character("Dummy", 50, 3, 1)
+        lines = []
+        sink = PrintSink(lines.append)
+        sink.emit(stats_event("start", warrior))
+        sink.emit(stats_event("start", dummy))
+
+        warrior.display_stats()
+        dummy.display_stats()
+
+        assert lines == capsys.readouterr().out.splitlines(), "Stats lines should match display_stats"
+
+class TestMultiRoundBattle:
+    """Test the multi-round battle runner"""
+
+    def test_fights_until_someone_falls(self):
+        """Test that the battle runs until a character reaches 0 health"""
+        warrior, mage = Warrior("W"), Mage("M")
+
+        report = MultiRoundBattle(warrior, mage).run()
+
+        # Warrior deals 20 per round to 80 health, mage deals 20 to 120 health
+        assert report.rounds == 4, "Mage should fall in round 4"
+        assert report.winner is warrior, "Warrior should win"
+        assert mage.health == 0, "Loser should be at 0 health"
+        assert list(report.damage1) == [20, 20, 20, 20], "Warrior damage per round"
+        assert list(report.damage2) == [20, 20, 20, 0], "Mage should not answer once defeated"
+
+    def test_round_cap(self):
+        """Test that the round cap stops a fight nobody can finish"""
+        tank1 = Character("Tank1", 100, 0, 0)
+        tank2 = Character("Tank2", 100, 0, 0)
+
+        report = MultiRoundBattle(tank1, tank2, max_rounds=5).run()
+
+        assert report.rounds == 5, "Battle should stop at the cap"
+        assert report.winner is None, "Equal health should be a tie"
+
+    def test_events_per_round(self):
+        """Test that every round's attacks are emitted"""
+        sink = ListSink()
+        MultiRoundBattle(Warrior("W"), Mage("M"), sink).run()
+
+        attacks = [event for event in sink.events if type(event) is AttackEvent]
+        assert [event.round for event in attacks] == [1, 1, 2, 2, 3, 3, 4], "Attacks should be tagged with their round"
+        assert sink.events[-1] == ResultEvent("W", "M", False), "Result should come last"
@@ -0,0 +1,61 @@
+import io
+
+from project2_starter import Warrior, Mage, Rogue
+from battle_engine import MultiRoundBattle, ListSink, AttackEvent, ResultEvent
+from battle_log import BattleLogWriter, read_log, replay
+from rng import BlockRNG
+
+def log_battles(path, count):
+    """Log `count` seeded battles into one file, returning the events of each"""
+    expected = {}
+    with BattleLogWriter(path) as writer:
+        for battle_id in range(count):
+            sink = ListSink()
+            MultiRoundBattle(Warrior("W"), Rogue("R"), sink, BlockRNG(battle_id)).run()
+            MultiRoundBattle(Warrior("W"), Rogue("R"), writer.for_battle(battle_id), BlockRNG(battle_id)).run()
+            expected[battle_id] = sink.events
+    return expected
+
+class TestBattleLog:
+    """Test writing and reading battle logs"""
+
+    def test_round_trip(self, tmp_path):
+        """Test that the reader gives back exactly the events that were logged"""
+        path = tmp_path / "battles.ndjson"
+        expected = log_battles(path, 3)
+
+        events = list(read_log(path))
+
+        assert [event for _, event in events] == expected[0] + expected[1] + expected[2], "Events should round trip"
+        assert {battle_id for battle_id, _ in events} == {0, 1, 2}, "Battle ids should be kept"
+
+    def test_filters(self, tmp_path):
+        """Test filtering by battle, event type and condition"""
+        path = tmp_path / "battles.ndjson"
+        expected = log_battles(path, 3)
+
+        results = list(read_log(path, battles=[1], types=[ResultEvent]))
+        crits = list(read_log(path, types=[AttackEvent], where=lambda battle_id, event: event.critical))
+
+        assert results == [(1, expected[1][-1])], "Only battle 1's result should be read"
+        assert all(event.critical for _, event in crits), "Only critical hits should be read"
+
+    def test_buffered_writes(self):
+        """Test that lines are held in memory until the buffer fills or is flushed"""
+        out = io.StringIO()
+        writer = BattleLogWriter(out, battle_id=5, buffer_size=10 ** 6)
+        MultiRoundBattle(Warrior("W"), Mage("M"), writer, BlockRNG(1)).run()
+
+        assert out.getvalue() == "", "Nothing should be written before a flush"
+        writer.flush()
+        assert out.getvalue().count("\n") > 0, "Flush should write every buffered line"
+
+    def test_replay_into_sink(self, tmp_path):
+        """Test replaying one battle into another sink"""
+        path = tmp_path / "battles.ndjson"
+        expected = log_battles(path, 2)
+        sink = ListSink()
+
+        count = replay(path, sink, battle_id=1)
+
+        assert sink.events == expected[1] and count == len(expected[1]), "Replay should send battle 1's events"
@@ -0,0 +1,36 @@
+import json
+
+import pytest
+from benchmarks.bench_suite import BENCHMARKS, compare, main, run
+
+class TestBenchmarkSuite:
+    """Test the benchmark harness itself (with tiny timings)"""
+
+    def test_every_benchmark_runs_silently(self, capsys):
+        """Test that all benchmarks run and nothing reaches stdout"""
+        report = run(min_time=0.001, repeat=1)
+
+        assert set(report["results"]) == set(BENCHMARKS), "Every benchmark should report"
+        assert all(ops > 0 for ops in report["results"].values()), "Rates should be positive"
+        assert capsys.readouterr().out == "", "Silenced mode should not print"
+
+    def test_compare_flags_slowdowns(self):
+        """Test regression detection against a baseline"""
+        baseline = {"results": {"a": 100.0, "b": 100.0, "gone": 5.0}}
+        report = {"results": {"a": 95.0, "b": 50.0, "new": 1.0}}
+
+        regressions = compare(report, baseline, tolerance=0.10)
+
+        assert [r[0] for r in regressions] == ["b"], "Only the big slowdown should count"
+
+    def test_save_and_compare_round_trip(self, tmp_path, capsys):
+        """Test saving JSON and comparing a run against it"""
+        path = tmp_path / "bench.json"
+
+        assert main(["take_damage", "--min-time", "0.001", "--save", str(path)]) == 0, "Saving should succeed"
+        saved = json.loads(path.read_text())
+        assert list(saved["results"]) == ["take_damage"], "Only the selected benchmark should be saved"
+
+        saved["results"]["take_damage"] = 1.0
+        path.write_text(json.dumps(saved))
+        assert main(["take_damage", "--min-time", "0.001", "--baseline", str(path)]) == 0, "Faster than baseline is fine"
@@ -0,0 +1,101 @@
+import pytest
+from project2_starter import Character, Warrior, Mage, Rogue, Weapon
+
+class TestEquip:
+    """Test equipping weapons on players"""
+
+    def test_weapon_adds_to_attack_and_special(self):
+        """Test that the weapon bonus is added to both kinds of damage"""
+        warrior = Warrior("Armed")
+        warrior.equip(Weapon("Iron Sword", 10))
+
+        target1 = Character("T1", 100, 0, 0)
+        target2 = Character("T2", 100, 0, 0)
+        warrior.attack(target1)
+        warrior.power_strike(target2)
+
+        assert 100 - target1.health == 15 + 5 + 10, "Attack should be strength + 5 + weapon"
+        assert 100 - target2.health == 15 * 2 + 10, "Power strike should be strength * 2 + weapon"
+
+    def test_unequip_returns_weapon(self):
+        """Test that unequipping removes the bonus and hands back the weapon"""
+        mage = Mage("Caster")
+        staff = Weapon("Magic Staff", 15)
+        mage.equip(staff)
+
+        assert mage.attack_damage == 35, "Staff should add to magic damage"
+        assert mage.unequip() is staff, "Unequip should return the weapon"
+        assert mage.attack_damage == 20, "Damage should drop back without the weapon"
+        assert mage.unequip() is None, "Nothing left to unequip"
+
+    def test_sneak_attack_matches_a_crit(self):
+        """Test that Sneak Attack doubles the weapon bonus too, like a critical hit"""
+        rogue = Rogue("Armed")
+        rogue.equip(Weapon("Long Dagger", 20))
+
+        class AlwaysCrit:
+            def randint(self, a, b):
+                return 1
+
+        crit_target = Character("T1", 200, 0, 0)
+        sneak_target = Character("T2", 200, 0, 0)
+        rogue.attack(crit_target, AlwaysCrit())
+        rogue.sneak_attack(sneak_target)
+
+        assert 200 - sneak_target.health == 2 * (12 + 20), "Sneak Attack should be 2 * (strength + weapon)"
+        assert crit_target.health == sneak_target.health, "Sneak Attack should hit as hard as a crit"
+
+class TestDamageCache:
+    """Test that damage is worked out ahead of time and only again when it has to be"""
+
+    def test_damage_reused_between_hits(self, monkeypatch):
+        """Test that attacking and taking damage don't recompute damage"""
+        rogue = Rogue("Cached")
+        rogue.equip(Weapon("Steel Dagger", 8))
+        calls = []
+        monkeypatch.setattr(Rogue, "_compute_damage", lambda self: calls.append(self))
+
+        rogue.sneak_attack(Character("T", 100, 0, 0))
+        rogue.attack(Character("T", 100, 0, 0))
+        rogue.take_damage(10)
+
+        assert not calls, "Attacking or taking damage should not recompute damage"
+        assert rogue.attack_damage == 20, "Damage should be the precomputed value"
+
+    def test_equip_and_level_up_refresh(self):
+        """Test that equipping, unequipping and levelling up update damage"""
+        from progression import grant
+
+        warrior = Warrior("Growing")
+        warrior.equip(Weapon("Iron Sword", 10))
+        assert warrior.attack_damage == 30, "Equip should add the bonus"
+        warrior.unequip()
+        assert warrior.attack_damage == 20, "Unequip should remove the bonus"
+
+        grant(warrior, 100)
+
+        assert warrior.attack_damage == 22 and warrior.special_damage == 34, "Level-up should use the new strength"
+
+    @pytest.mark.parametrize("stat", ["strength", "magic", "level"])
+    def test_stat_changes_invalidate(self, stat, monkeypatch):
+        """Test that changing a damage stat makes the next read work damage out again"""
+        warrior = Warrior("Growing")
+        calls = []
+        compute = Warrior._compute_damage
+        monkeypatch.setattr(Warrior, "_compute_damage", lambda self: calls.append(self) or compute(self))
+
+        setattr(warrior, stat, getattr(warrior, stat) + 1)
+        warrior.attack_damage
+        warrior.special_damage
+
+        assert len(calls) == 1, f"Changing {stat} should recompute damage once"
+
+    def test_new_strength_is_used(self):
+        """Test that damage follows direct stat changes"""
+        warrior = Warrior("Stronger")
+        assert warrior.attack_damage == 20, "Starting damage"
+
+        warrior.strength = 20
+
+        assert warrior.attack_damage == 25, "Damage should use the new strength"
+        assert warrior.special_damage == 40, "Special should use the new strength"
@@ -0,0 +1,65 @@
+import json
+
+import pytest
+from project2_starter import Character, SimpleBattle, Warrior, Mage, Rogue
+from instrumentation import Instrumentation
+
+class TestInstrumentation:
+    """Test the opt-in timing wrappers"""
+
+    def test_counts_calls_per_class(self, capsys):
+        """Test that calls are counted per character class and method"""
+        with Instrumentation() as probe:
+            target = Character("Dummy", 1000, 0, 0)
+            Warrior("W").attack(target)
+            Warrior("W2").attack(target)
+            Mage("M").fireball(target)
+
+        snapshot = probe.snapshot()
+        assert snapshot["Warrior"]["attack"]["calls"] == 2, "Both warrior attacks should be counted"
+        assert snapshot["Mage"]["fireball"]["calls"] == 1, "Fireball should be counted"
+        assert snapshot["Character"]["take_damage"]["calls"] == 3, "Each hit calls take_damage on the target"
+
+    def test_histogram_and_timing(self):
+        """Test that time and latency buckets are recorded"""
+        with Instrumentation() as probe:
+            target = Character("Dummy", 1000, 0, 0)
+            for _ in range(10):
+                target.take_damage(1)
+
+        stats = probe.snapshot()["Character"]["take_damage"]
+        assert stats["total_ns"] > 0, "Time should be recorded"
+        assert sum(count for _, count in stats["histogram"]) == 10, "Every call should land in a bucket"
+
+    def test_battle_is_instrumented(self, capsys):
+        """Test that SimpleBattle.fight is timed end to end"""
+        with Instrumentation() as probe:
+            SimpleBattle(Warrior("W"), Rogue("R")).fight()
+
+        assert probe.snapshot()["SimpleBattle"]["fight"]["calls"] == 1, "Fight should be counted"
+
+    def test_disable_restores_originals(self):
+        """Test that turning it off leaves the original methods in place"""
+        original_attack = Warrior.__dict__["attack"]
+        original_take_damage = Character.__dict__["take_damage"]
+
+        probe = Instrumentation()
+        probe.enable()
+        assert Warrior.__dict__["attack"] is not original_attack, "Enabled should install a wrapper"
+        probe.disable()
+
+        assert Warrior.__dict__["attack"] is original_attack, "Disable should restore attack"
+        assert Character.__dict__["take_damage"] is original_take_damage, "Disable should restore take_damage"
+        Character("Dummy", 10, 0, 0).take_damage(1)
+        assert probe.snapshot() == {}, "Nothing should be recorded while disabled"
+
+    def test_export_json(self, tmp_path):
+        """Test the machine-readable export"""
+        with Instrumentation() as probe:
+            Character("Dummy", 10, 0, 0).take_damage(1)
+
+        path = tmp_path / "profile.json"
+        text = probe.export_json(path)
+
+        assert json.loads(path.read_text()) == json.loads(text), "File and return value should match"
+        assert json.loads(text)["Character"]["take_damage"]["calls"] == 1, "Export should hold the counts"
@@ -0,0 +1,76 @@
+import pytest
+from project2_starter import Character, Player, Warrior, Mage, Rogue, Weapon
+from mapped_roster import MappedRoster
+from serialization import load
+
+def make_party():
+    """Build a mixed party to save"""
+    warrior = Warrior("Marcus")
+    warrior.equip(Weapon("Iron Sword", 10))
+    return [warrior, Mage("Aria"), Rogue("Shadow"), Character("Dummy", 50, 1, 2)]
+
+class TestMappedProxies:
+    """Test proxies read from and write to the mapped file"""
+
+    def test_proxies_are_real_classes(self, tmp_path):
+        """Test that proxies pass isinstance checks and read every field"""
+        with MappedRoster.create(tmp_path / "party.bin", make_party()) as roster:
+            warrior, mage, rogue, dummy = roster
+
+            assert isinstance(warrior, Warrior) and isinstance(mage, Mage) and isinstance(rogue, Rogue), \
+                "Proxies should be Warriors, Mages and Rogues"
+            assert not isinstance(dummy, Player), "Plain characters should not be players"
+            assert (warrior.name, warrior.health, warrior.strength) == ("Marcus", 120, 15), "Stats should be read"
+            assert warrior.character_class == "Warrior" and warrior.level == 1, "Player fields should be read"
+            assert warrior.weapon == Weapon("Iron Sword", 10), "Weapons should be read"
+            assert warrior.attack_damage == 30, "Damage should include the weapon"
+            assert len(roster) == 4, "Length should come from the header"
+
+    def test_writes_reach_the_file(self, tmp_path):
+        """Test that take_damage on a proxy changes the file"""
+        path = tmp_path / "party.bin"
+        with MappedRoster.create(path, make_party()) as roster:
+            roster[1].attack(roster[0])
+            roster[3].take_damage(500)
+            roster[1].level = 3
+            roster[0].unequip()
+
+        reloaded = load(path)
+        assert reloaded[0].health == 100, "Mage attack should be saved"
+        assert reloaded[3].health == 0, "Health should clamp at 0 in the file"
+        assert reloaded[1].level == 3, "Level change should be saved"
+        assert reloaded[0].weapon is None, "Unequipping should be saved"
+
+    def test_total_and_fork(self, tmp_path):
+        """Test whole-file sums and copying a proxy out of the file"""
+        with MappedRoster.create(tmp_path / "party.bin", make_party()) as roster:
+            copy = roster[0].fork()
+            roster[0].take_damage(20)
+
+            assert roster.total("health") == 100 + 80 + 90 + 50, "Total should see the write"
+            assert type(copy) is Warrior and copy.health == 120, "Fork should be a standalone Warrior"
+
+class TestMappedLimits:
+    """Test what a mapped roster can't do"""
+
+    def test_read_only(self, tmp_path):
+        """Test that a read-only roster refuses writes"""
+        path = tmp_path / "party.bin"
+        MappedRoster.create(path, make_party()).close()
+
+        with MappedRoster(path, writable=False) as roster:
+            assert roster[0].health == 120, "Reads should work"
+            with pytest.raises(TypeError):
+                roster[0].take_damage(5)
+
+    def test_names_and_unknown_weapons(self, tmp_path):
+        """Test that names are fixed and only known weapons can be equipped"""
+        with MappedRoster.create(tmp_path / "party.bin", make_party()) as roster:
+            with pytest.raises(AttributeError):
+                roster[0].name = "Renamed"
+            with pytest.raises(ValueError):
+                roster[1].equip(Weapon("Unknown Staff", 3))
+            roster[2].equip(Weapon("Iron Sword", 10))
+            assert roster[2].weapon.name == "Iron Sword", "Weapons in the table can be equipped"
+            with pytest.raises(IndexError):
+                roster[4]
@@ -0,0 +1,57 @@
+import pytest
+from project2_starter import Warrior, Mage, Rogue
+from matchups import MatchupResult, run_matchups, plan_chunks, format_table
+
+class TestMatchupRunner:
+    """Test the Monte Carlo matchup runner"""
+
+    def test_every_pairing_is_counted(self):
+        """Test that every class pairing gets the requested number of battles"""
+        table = run_matchups(50, workers=1, chunk_size=20)
+
+        assert len(table) == 9, "Three classes should give nine pairings"
+        for result in table.values():
+            assert result.battles == 50, "Each pairing should run every battle"
+
+    def test_deterministic_pairings(self):
+        """Test pairings with no randomness"""
+        table = run_matchups(10, classes=(Warrior, Mage), workers=1)
+
+        assert table[("Warrior", "Mage")] == MatchupResult(10, 0, 0), "Warrior always beats Mage"
+        assert table[("Mage", "Warrior")] == MatchupResult(0, 10, 0), "Mage always loses to Warrior"
+
+    def test_reproducible_with_seed(self):
+        """Test that the same seed gives the same table"""
+        first = run_matchups(200, classes=(Rogue, Mage), seed=5, workers=1, chunk_size=50)
+        second = run_matchups(200, classes=(Rogue, Mage), seed=5, workers=1, chunk_size=50)
+
+        assert first == second, "Same seed should give identical results"
+
+    def test_process_pool_matches_single_process(self):
+        """Test that spreading chunks over processes does not change the answer"""
+        serial = run_matchups(100, classes=(Rogue, Warrior), seed=9, workers=1, chunk_size=25)
+        parallel = run_matchups(100, classes=(Rogue, Warrior), seed=9, workers=2, chunk_size=25)
+
+        assert serial == parallel, "Worker count should not change results"
+
+class TestMatchupResult:
+    """Test the result record"""
+
+    def test_confidence_interval_contains_rate(self):
+        """Test the Wilson interval"""
+        result = MatchupResult(60, 30, 10)
+        low, high = result.confidence_interval()
+
+        assert result.win_rate == 0.6, "Win rate should be wins / battles"
+        assert low < 0.6 < high, "Interval should contain the observed rate"
+        assert 0.0 <= low and high <= 1.0, "Interval should stay in [0, 1]"
+
+    def test_chunk_plan(self):
+        """Test splitting battles into chunks"""
+        assert plan_chunks(25, 10) == [10, 10, 5], "Last chunk should hold the remainder"
+
+    def test_format_table(self):
+        """Test the printable table"""
+        lines = format_table(run_matchups(5, classes=(Warrior, Mage), workers=1))
+
+        assert len(lines) == 3, "Header plus one row per class"
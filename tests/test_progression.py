@@ -0,0 +1,68 @@
+import pytest
+from project2_starter import Character, SimpleBattle, Warrior, Mage, Rogue
+from roster import CharacterRoster
+from progression import (LEVEL_THRESHOLDS, MAX_LEVEL, level_for, grant, award_battle,
+                         grant_roster, WIN_XP, LEVEL_XP, LOSS_XP)
+
+class TestLevelTable:
+    """Test the threshold table"""
+
+    def test_level_for(self):
+        """Test levels at and around the thresholds"""
+        assert level_for(0) == 1, "No experience is level 1"
+        assert level_for(99) == 1 and level_for(100) == 2, "Level 2 starts at 100"
+        assert level_for(LEVEL_THRESHOLDS[9]) == 10, "Each threshold starts its level"
+        assert level_for(10 ** 9) == MAX_LEVEL, "Levels stop at MAX_LEVEL"
+
+class TestGrant:
+    """Test levelling up single players"""
+
+    def test_level_up_grows_stats(self):
+        """Test that crossing thresholds raises level and stats"""
+        warrior = Warrior("W")
+
+        gained = grant(warrior, 300)
+
+        assert gained == 2 and warrior.level == 3, "300 experience reaches level 3"
+        assert (warrior.health, warrior.strength, warrior.magic) == (144, 19, 5), "Warrior grows 12/2/0 per level"
+        assert warrior.attack_damage == 24, "Damage cache should see the new strength"
+
+    def test_award_battle(self, capsys):
+        """Test experience from a SimpleBattle outcome"""
+        warrior, mage = Warrior("W"), Mage("M")
+        SimpleBattle(warrior, mage).fight()
+
+        award_battle(warrior, mage)
+
+        assert warrior.experience == WIN_XP + LEVEL_XP, "Winner earns experience for the opponent's level"
+        assert mage.experience == LOSS_XP, "Loser earns a little"
+        assert award_battle(Character("C", 5, 1, 1), Rogue("R")) == (0, 0), "Plain characters earn nothing"
+
+class TestGrantRoster:
+    """Test bulk experience on a roster"""
+
+    def test_bulk_matches_single(self):
+        """Test that the roster path gives the same result as grant()"""
+        roster = CharacterRoster([Warrior("W"), Mage("M"), Rogue("R"), Character("C", 50, 5, 5)])
+        players = [Warrior("W"), Mage("M"), Rogue("R")]
+        experience = [650, 100, 99, 5000]
+
+        levelled = grant_roster(roster, experience)
+        for player, xp in zip(players, experience):
+            grant(player, xp)
+
+        assert levelled == 2, "Warrior and mage should level up"
+        for view, player in zip(roster, players):
+            assert (view.level, view.experience, view.health, view.strength, view.magic) == \
+                (player.level, player.experience, player.health, player.strength, player.magic), \
+                f"{player.name} should match the single-player result"
+        assert (roster.column("experience")[3], roster[3].strength) == (0, 5), "Plain characters are skipped"
+
+    def test_many_level_ups(self):
+        """Test the whole-column path with every player levelling"""
+        roster = CharacterRoster([Warrior(f"W{i}") for i in range(100)])
+
+        assert grant_roster(roster, 100) == 100, "Everyone should reach level 2"
+        assert roster.total("strength") == 100 * 17, "Strength should grow for everyone"
+        with pytest.raises(ValueError):
+            grant_roster(roster, [1, 2])
@@ -0,0 +1,71 @@
+import pytest
+from project2_starter import Warrior, Mage, Rogue, Weapon
+from battle_engine import ListSink, AttackEvent
+from replay import (record_battle, replay_battle, state_at, verify, verify_all,
+                    rounds_recorded, save_recordings, load_recordings)
+from rng import BlockRNG
+
+def record(seed=3, max_rounds=100):
+    """Record a long Rogue vs Warrior fight with crits"""
+    sink = ListSink()
+    rogue = Rogue("Shadow")
+    rogue.equip(Weapon("Dagger", 4))
+    report, recording = record_battle(rogue, Warrior("Marcus"), BlockRNG(seed), max_rounds, sink)
+    return report, recording, sink.events
+
+class TestReplay:
+    """Test recording and replaying battles"""
+
+    def test_replay_matches_original(self):
+        """Test that a replay produces exactly the same events and result"""
+        report, recording, events = record()
+        sink = ListSink()
+
+        replayed, rogue, warrior = replay_battle(recording, sink)
+
+        assert sink.events == events, "Replay should emit the same events"
+        assert replayed.rounds == report.rounds and replayed.winner.name == report.winner.name, "Same outcome"
+        assert list(replayed.damage1) == list(report.damage1), "Same damage every round"
+        assert rogue.weapon == Weapon("Dagger", 4), "Inputs should include the weapon"
+
+    def test_single_round_like_simple_battle(self):
+        """Test that the default records one SimpleBattle-style round"""
+        report, recording = record_battle(Rogue("R"), Mage("M"), BlockRNG(1))
+
+        assert report.rounds == 1 and rounds_recorded(recording) == 1, "Default should be one round"
+        assert verify(recording), "Recording should replay identically"
+
+    def test_fast_forward(self):
+        """Test jumping to a round without replaying the earlier ones"""
+        report, recording, events = record()
+        middle = report.rounds // 2
+        sink = ListSink()
+
+        replayed, _, _ = replay_battle(recording, sink, start_round=middle + 1)
+        attacks = [event for event in sink.events if type(event) is AttackEvent]
+        original = [event for event in events if type(event) is AttackEvent and event.round > middle]
+
+        assert attacks == original, "Only the later rounds should be played, identically"
+        assert list(replayed.damage2) == list(report.damage2), "Damage arrays should cover the whole fight"
+        rogue, warrior = state_at(recording, middle)
+        assert warrior.health == 120 - sum(report.damage1[:middle]), "State should match the checkpoint"
+
+    def test_tampered_recording_detected(self):
+        """Test that a recording that no longer matches is reported"""
+        _, good, _ = record(seed=5)
+        _, bad, _ = record(seed=6)
+        bad = bad._replace(rolls=bytes(10 if roll <= 3 else 1 for roll in bad.rolls))
+
+        assert verify_all([good, bad]) == [1], "Only the changed recording should fail"
+        with pytest.raises(ValueError):
+            state_at(good, rounds_recorded(good) + 1)
+
+    def test_save_and_load(self, tmp_path):
+        """Test storing recordings for a nightly job"""
+        recordings = [record(seed)[1] for seed in range(5)]
+        path = tmp_path / "flagged.ndjson"
+
+        save_recordings(recordings, path)
+
+        assert list(load_recordings(path)) == recordings, "Recordings should round trip"
+        assert verify_all(load_recordings(path)) == [], "Loaded recordings should replay"
@@ -0,0 +1,93 @@
+import threading
+
+import pytest
+from project2_starter import Character, Rogue
+from rng import BlockRNG
+from batch_combat import resolve_attacks
+from battle_engine import MultiRoundBattle
+
+class TestBlockRNG:
+    """Test the block-based random number provider"""
+
+    def test_rolls_are_in_range(self):
+        """Test that d10 rolls cover 1 to 10 and nothing else"""
+        rng = BlockRNG(1)
+        rolls = [rng.randint(1, 10) for _ in range(5000)]
+
+        assert set(rolls) == set(range(1, 11)), "Every face should come up"
+        assert 0.25 < sum(roll <= 3 for roll in rolls) / len(rolls) < 0.35, "Crit rate should be about 30%"
+
+    def test_same_seed_replays_exactly(self):
+        """Test that a seed always gives the same rolls"""
+        rng = BlockRNG("fight-42", block_size=64)
+        first = [rng.randint(1, 10) for _ in range(500)]
+        replay = rng.replay()
+        second = [replay.randint(1, 10) for _ in range(500)]
+
+        assert first == second, "Replaying should give identical rolls"
+        assert rng.rolls_used == 500, "Roll counter should track usage"
+
+    def test_bulk_matches_single_rolls(self):
+        """Test that rolls() and crits() read the same stream as randint()"""
+        rng = BlockRNG(3, block_size=16)
+        singles = [rng.randint(1, 10) for _ in range(100)]
+
+        assert list(BlockRNG(3, block_size=16).rolls(100)) == singles, "Bulk rolls should match"
+        assert BlockRNG(3, block_size=16).crits(100, 3) == [roll <= 3 for roll in singles], "Bulk crits should match"
+
+    def test_spawned_streams_are_independent(self):
+        """Test that child streams differ from each other but replay exactly"""
+        parent = BlockRNG(7)
+
+        assert parent.spawn(0).rolls(50) != parent.spawn(1).rolls(50), "Different workers should get different rolls"
+        assert parent.spawn(1).rolls(50) == BlockRNG(7).spawn(1).rolls(50), "A worker's stream should replay"
+
+    def test_unseeded_streams_replay_and_spawn(self):
+        """Test that an unseeded stream gets its own seed, so replay and spawn still work"""
+        first, second = BlockRNG(), BlockRNG()
+        rolls = first.rolls(200)
+
+        assert first.seed is not None and first.seed != second.seed, "Each stream should draw its own seed"
+        assert first.replay().rolls(200) == rolls, "Replay should repeat an unseeded stream"
+        assert first.spawn(0).rolls(50) != second.spawn(0).rolls(50), "Unseeded parents should spawn different children"
+
+    def test_streams_per_thread(self):
+        """Test that threads with their own streams get reproducible results"""
+        results = {}
+
+        def work(worker):
+            results[worker] = BlockRNG(99).spawn(worker).rolls(1000)
+
+        threads = [threading.Thread(target=work, args=(i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert all(results[i] == BlockRNG(99).spawn(i).rolls(1000) for i in range(4)), "Each thread's rolls should replay"
+
+class TestRNGParameter:
+    """Test passing the provider to characters and battles"""
+
+    def test_rogue_attack_takes_rng(self):
+        """Test that Rogue.attack uses the given provider"""
+        damages = []
+        rng = BlockRNG(5)
+        for _ in range(50):
+            target = Character("Dummy", 100, 0, 0)
+            Rogue("R").attack(target, rng)
+            damages.append(100 - target.health)
+
+        expected = [24 if crit else 12 for crit in BlockRNG(5).crits(50, 3)]
+        assert damages == expected, "Crits should follow the provider's rolls"
+
+    def test_batch_and_battle_accept_provider(self):
+        """Test that batch resolution and battles replay with the same seed"""
+        rogues = [Rogue(f"R{i}") for i in range(100)]
+        first = resolve_attacks(rogues, [Character("T", 10000, 0, 0)] * 100, BlockRNG(11))
+        second = resolve_attacks(rogues, [Character("T", 10000, 0, 0)] * 100, BlockRNG(11))
+        assert first == second, "Batch results should replay"
+
+        report1 = MultiRoundBattle(Rogue("A"), Rogue("B"), rng=BlockRNG(2)).run()
+        report2 = MultiRoundBattle(Rogue("A"), Rogue("B"), rng=BlockRNG(2)).run()
+        assert list(report1.damage1) == list(report2.damage1), "Battles should replay"
@@ -0,0 +1,100 @@
+import sys
+
+import pytest
+from project2_starter import Character, Player, Warrior, Mage, Rogue
+from roster import CharacterRoster
+
+class TestRosterViews:
+    """Test that roster views behave like the real characters"""
+
+    def test_views_pass_isinstance_checks(self):
+        """Test that views are still Warriors, Mages and Rogues"""
+        roster = CharacterRoster([Warrior("W"), Mage("M"), Rogue("R"), Character("C", 50, 5, 5)])
+
+        assert isinstance(roster[0], Warrior), "Warrior view should be a Warrior"
+        assert isinstance(roster[1], Mage), "Mage view should be a Mage"
+        assert isinstance(roster[2], Rogue), "Rogue view should be a Rogue"
+        assert isinstance(roster[0], Player), "Warrior view should be a Player"
+        assert not isinstance(roster[3], Player), "Character view should not be a Player"
+        assert all(isinstance(view, Character) for view in roster), "All views should be Characters"
+
+    def test_views_copy_stats(self):
+        """Test that stats are copied into the roster correctly"""
+        roster = CharacterRoster([Warrior("Marcus"), Player("Pat", "Bard", 70, 6, 9)])
+        warrior, bard = roster[0], roster[1]
+
+        assert warrior.name == "Marcus", "Name should be stored"
+        assert (warrior.health, warrior.strength, warrior.magic) == (120, 15, 5), "Stats should be stored"
+        assert warrior.character_class == "Warrior", "Class name should be stored"
+        assert (warrior.level, warrior.experience) == (1, 0), "Level and experience should be stored"
+        assert bard.character_class == "Bard", "Custom class names should be stored"
+
+    def test_writes_go_through_to_columns(self):
+        """Test that take_damage and attribute writes change the roster"""
+        roster = CharacterRoster([Warrior("Tank"), Mage("Caster")])
+
+        roster[1].attack(roster[0])
+
+        assert roster[0].health == 100, "Mage attack should reduce the stored health"
+        assert roster.column("health")[0] == 100, "Column should see the write"
+
+        roster[0].name = "Renamed Tank"
+        roster[0].character_class = "Paladin"
+        assert roster[0].name == "Renamed Tank", "Renames should be stored"
+        assert roster[0].character_class == "Paladin", "Class name changes should be stored"
+
+    def test_health_clamps_at_zero(self):
+        """Test that take_damage keeps its clamp through a view"""
+        roster = CharacterRoster([Character("Dummy", 10, 0, 0)])
+
+        roster[0].take_damage(50)
+
+        assert roster[0].health == 0, "Health should not go below 0"
+
+    def test_index_errors(self):
+        """Test that out of range indexes raise IndexError"""
+        roster = CharacterRoster([Warrior("Only")])
+
+        assert roster[-1].name == "Only", "Negative indexes should work"
+        with pytest.raises(IndexError):
+            roster[1]
+
+class TestRosterBulkOperations:
+    """Test whole-roster operations"""
+
+    def test_total_health(self):
+        """Test summing a column"""
+        roster = CharacterRoster([Warrior("W"), Mage("M"), Rogue("R")])
+
+        assert roster.total("health") == 120 + 80 + 90, "Total should sum every character"
+
+    def test_indices_of_class(self):
+        """Test finding every character of a class"""
+        roster = CharacterRoster([Warrior("W1"), Mage("M"), Warrior("W2")])
+
+        assert roster.indices_of(Warrior) == [0, 2], "Should find both warriors"
+        assert roster.indices_of(Player) == [0, 1, 2], "Should find every player"
+
+    def test_add_without_object(self):
+        """Test adding characters straight into the columns"""
+        roster = CharacterRoster()
+        index = roster.add(Rogue, "Shadow", 90, 12, 10, level=3, experience=250)
+
+        assert index == 0, "First character should get index 0"
+        assert roster[0].level == 3, "Level should be stored"
+        assert roster[0].character_class == "Rogue", "Class name should default to the class"
+
+    def test_memory_per_character_is_small(self):
+        """Test that the roster uses far less memory than real objects"""
+        roster = CharacterRoster()
+        for i in range(1000):
+            roster.add(Warrior, f"Warrior{i}", 120, 15, 5)
+
+        warrior = Warrior("Warrior0")
+        object_bytes = sys.getsizeof(warrior) + sys.getsizeof(warrior.name)
+
+        # About 43 bytes a character: five int32 stat columns, the class
+        # bytes, two name offsets and the name text itself. That bounds the
+        # saving at about 4x against a slotted Warrior (about 5x against a
+        # dict-backed one), not 10x.
+        assert roster.nbytes() / len(roster) * 4 < object_bytes, "Roster should be at least 4x smaller per character"
@@ -0,0 +1,94 @@
+import pytest
+from project2_starter import Character, Player, Warrior, Mage, Rogue, Weapon
+from roster import CharacterRoster
+from serialization import RECORD, decode, decode_roster, dump, encode, load
+
+def make_party():
+    """Build a mixed party with weapons and progress"""
+    warrior = Warrior("Marcus")
+    warrior.equip(Weapon("Iron Sword", 10))
+    mage = Mage("Aria")
+    mage.level = 4
+    mage.experience = 1234
+    rogue = Rogue("Shadow")
+    rogue.equip(Weapon("Iron Sword", 10))
+    rogue.take_damage(25)
+    return [warrior, mage, rogue, Character("Dummy", 50, 1, 2), Player("Pat", "Bard", 70, 6, 9)]
+
+def state(character):
+    """Everything that should survive a round trip"""
+    fields = [type(character), character.name, character.health, character.strength, character.magic]
+    if isinstance(character, Player):
+        fields += [character.character_class, character.level, character.experience, character.weapon]
+    return fields
+
+class TestRoundTrip:
+    """Test encoding and decoding characters"""
+
+    def test_round_trip_real_instances(self):
+        """Test that decoding gives back equal, real class instances"""
+        party = make_party()
+
+        decoded = decode(encode(party))
+
+        assert [state(c) for c in decoded] == [state(c) for c in party], "Every field should survive"
+        assert isinstance(decoded[0], Warrior) and decoded[0].attack_damage == 30, "Decoded warrior should work normally"
+
+    def test_shared_weapons_and_strings(self):
+        """Test that repeated weapons and names are stored once"""
+        party = [Warrior("Same Name") for _ in range(100)]
+        for warrior in party:
+            warrior.equip(Weapon("Iron Sword", 10))
+
+        data = encode(party)
+        decoded = decode(data)
+
+        assert len(data) < 100 * RECORD.size + 200, "Records should be fixed width with one string table"
+        assert decoded[0].weapon is decoded[99].weapon, "Weapons should be shared after decoding"
+
+    def test_file_round_trip(self, tmp_path):
+        """Test dump and load"""
+        path = tmp_path / "roster.bin"
+        dump(make_party(), path)
+
+        assert [state(c) for c in load(path)] == [state(c) for c in make_party()], "File round trip should match"
+
+    def test_roster_views_encode(self):
+        """Test that characters stored in a roster can be saved too"""
+        roster = CharacterRoster(make_party())
+
+        decoded = decode(encode(roster))
+
+        assert type(decoded[1]) is Mage and decoded[1].level == 4, "Views should save as their base class"
+
+class TestErrors:
+    """Test bad input"""
+
+    def test_unknown_subclass_rejected(self):
+        """Test that custom subclasses are not silently saved as their parent"""
+        class Paladin(Warrior):
+            pass
+
+        with pytest.raises(ValueError):
+            encode([Paladin("P")])
+
+    def test_bad_magic(self):
+        """Test that other data is rejected"""
+        with pytest.raises(ValueError):
+            decode(b"NOPE" + bytes(60))
+
+class TestRosterDecode:
+    """Test decoding into a CharacterRoster"""
+
+    def test_decode_into_roster(self):
+        """Test decoding straight into columns"""
+        roster = decode_roster(encode(make_party()))
+
+        assert len(roster) == 5, "Every record should be loaded"
+        assert roster.total("health") == 120 + 80 + 65 + 50 + 70, "Columns should hold the saved health"
+        assert roster[4].character_class == "Bard", "Class names should be restored"
+        assert type(roster[2]).__name__ == "RogueView" and roster[2].name == "Shadow", "Classes and names should match"
+
+    def test_empty(self):
+        """Test an empty roster file"""
+        assert len(decode_roster(encode([]))) == 0, "No records should give an empty roster"
@@ -0,0 +1,32 @@
+import pytest
+from project2_starter import Character, Player, Warrior, Mage, Rogue, Weapon
+
+class TestSlots:
+    """Test that the hierarchy stores attributes in __slots__"""
+
+    def test_no_instance_dict(self):
+        """Test that instances have no per-object __dict__"""
+        for obj in [Character("C", 50, 5, 5), Player("P", "Bard", 70, 6, 9),
+                    Warrior("W"), Mage("M"), Rogue("R"), Weapon("Sword", 10)]:
+            assert not hasattr(obj, "__dict__"), f"{type(obj).__name__} should not have a __dict__"
+
+    def test_unknown_attributes_rejected(self):
+        """Test that typos in attribute names are caught"""
+        warrior = Warrior("W")
+
+        with pytest.raises(AttributeError):
+            warrior.helth = 10
+
+    def test_super_chain_sets_every_slot(self):
+        """Test that super().__init__ chaining fills both levels of slots"""
+        mage = Mage("M")
+
+        assert (mage.name, mage.health, mage.strength, mage.magic) == ("M", 80, 8, 20), "Character slots should be set"
+        assert (mage.character_class, mage.level, mage.experience) == ("Mage", 1, 0), "Player slots should be set"
+
+    def test_display_stats_still_overrides(self, capsys):
+        """Test that Player.display_stats still extends Character.display_stats"""
+        Rogue("R").display_stats()
+
+        out = capsys.readouterr().out
+        assert "Health=90" in out and "Class: Rogue" in out, "Both parts of the stats should print"
@@ -0,0 +1,88 @@
+import pytest
+from project2_starter import Character, Warrior, Mage, Rogue, Weapon
+from roster import CharacterRoster
+
+class TestSnapshotRestore:
+    """Test capturing and restoring character state"""
+
+    def test_restore_after_damage(self):
+        """Test that restore undoes take_damage"""
+        dummy = Character("Dummy", 100, 0, 0)
+        state = dummy.snapshot()
+
+        Warrior("W").attack(dummy)
+        dummy.restore(state)
+
+        assert dummy.health == 100, "Health should be back to the snapshot"
+
+    def test_player_state_round_trip(self):
+        """Test that level, experience and weapon are restored"""
+        mage = Mage("Caster")
+        state = mage.snapshot()
+
+        mage.level = 5
+        mage.experience = 900
+        mage.equip(Weapon("Magic Staff", 15))
+        mage.take_damage(30)
+        mage.restore(state)
+
+        assert (mage.health, mage.level, mage.experience, mage.weapon) == (80, 1, 0, None), "Player state should be restored"
+        assert mage.attack_damage == 20, "Damage should drop back without the staff"
+
+    def test_restore_keeps_damage_when_stats_unchanged(self, monkeypatch):
+        """Test that resetting health alone does not work damage out again"""
+        rogue = Rogue("Reused")
+        state = rogue.snapshot()
+        calls = []
+        monkeypatch.setattr(Rogue, "_compute_damage", lambda self: calls.append(self))
+
+        rogue.take_damage(50)
+        rogue.restore(state)
+
+        assert not calls and rogue.attack_damage == 12, "Damage should survive a health-only reset"
+
+    def test_restore_after_direct_stat_change(self):
+        """Test that restore never leaves damage from stats it put back"""
+        warrior = Warrior("Trained")
+        warrior.strength = 30
+        state = warrior.snapshot()
+
+        warrior.strength = 10
+        warrior.restore(state)
+
+        assert warrior.attack_damage == 35, "Damage should follow the restored strength"
+
+class TestFork:
+    """Test cheap copies that share the base character's values"""
+
+    def test_fork_is_independent(self):
+        """Test that damaging a fork leaves the original alone"""
+        base = Warrior("Template")
+        base.equip(Weapon("Iron Sword", 10))
+        fork = base.fork()
+
+        fork.take_damage(50)
+
+        assert type(fork) is Warrior, "Fork should be the same class"
+        assert fork.health == 70 and base.health == 120, "Only the fork should be damaged"
+        assert fork.weapon is base.weapon, "Immutable weapon should be shared, not copied"
+        assert fork.attack_damage == base.attack_damage == 30, "Fork should keep the weapon bonus"
+
+    def test_fork_skips_init(self, monkeypatch):
+        """Test that forking does not call __init__"""
+        base = Mage("Template")
+        monkeypatch.setattr(Mage, "__init__", lambda *args: pytest.fail("__init__ should not run"))
+
+        fork = base.fork()
+
+        assert (fork.name, fork.magic, fork.character_class) == ("Template", 20, "Mage"), "Fork should copy everything"
+
+    def test_fork_roster_character(self):
+        """Test that forking a roster view gives a standalone character"""
+        roster = CharacterRoster([Rogue("Stored")])
+        fork = roster[0].fork()
+
+        fork.take_damage(40)
+
+        assert type(fork) is Rogue, "Fork should be a plain Rogue"
+        assert roster[0].health == 90, "Roster should be untouched"
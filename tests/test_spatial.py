@@ -0,0 +1,143 @@
+import random
+
+import pytest
+from project2_starter import Character, Warrior, Mage, Rogue
+from roster import CharacterRoster
+from spatial import SpatialGrid, area_fireball, area_power_strike
+
+def scatter(count, size=500.0, seed=1):
+    """Place `count` dummies at random positions"""
+    rand = random.Random(seed)
+    return [Character(f"U{i}", 100, 1, 1, rand.uniform(0, size), rand.uniform(0, size)) for i in range(count)]
+
+def brute_within(units, x, y, radius):
+    return {unit for unit in units if (unit.x - x) ** 2 + (unit.y - y) ** 2 <= radius ** 2}
+
+class TestPositions:
+    """Test positions on characters"""
+
+    def test_default_and_copied_positions(self):
+        """Test that characters start at the origin and forks keep their position"""
+        warrior = Warrior("W")
+        assert (warrior.x, warrior.y) == (0.0, 0.0), "Characters should start at the origin"
+
+        warrior.x, warrior.y = 3.5, -2.0
+        assert (warrior.fork().x, warrior.fork().y) == (3.5, -2.0), "Forks should copy the position"
+
+    def test_roster_views_have_positions(self):
+        """Test that roster views can be placed too"""
+        roster = CharacterRoster([Warrior("W"), Mage("M")])
+        roster[1].x = 7.0
+
+        assert (roster[1].x, roster[1].y) == (7.0, 0.0), "Moved view should keep its position"
+        assert (roster[0].x, roster[0].y) == (0.0, 0.0), "Other views should stay at the origin"
+
+class TestSpatialGrid:
+    """Test radius and nearest queries against brute force"""
+
+    def test_within_matches_brute_force(self):
+        """Test radius queries, including ones larger than the map"""
+        units = scatter(2000)
+        grid = SpatialGrid(25.0, units)
+        rand = random.Random(2)
+
+        for radius in [0.0, 10.0, 60.0, 2000.0]:
+            x, y = rand.uniform(0, 500), rand.uniform(0, 500)
+            assert set(grid.within(x, y, radius)) == brute_within(units, x, y, radius), "Radius query should match"
+
+    def test_nearest_matches_brute_force(self):
+        """Test nearest queries, with a filter and a radius limit"""
+        units = scatter(2000)
+        grid = SpatialGrid(25.0, units)
+        even = lambda unit: int(unit.name[1:]) % 2 == 0
+
+        for x, y in [(250.0, 250.0), (-300.0, 40.0), (499.0, 1.0)]:
+            distance = lambda unit: (unit.x - x) ** 2 + (unit.y - y) ** 2
+            assert distance(grid.nearest(x, y)) == min(map(distance, units)), "Nearest should be closest"
+            assert grid.nearest(x, y, where=even) in units, "Filtered nearest should find a unit"
+            assert distance(grid.nearest(x, y, where=even)) == min(distance(u) for u in units if even(u)), \
+                "Filtered nearest should be the closest match"
+        assert grid.nearest(-1000.0, -1000.0, max_radius=5.0) is None, "Nothing should be within 5"
+
+    def test_moves_and_removals(self):
+        """Test that the index follows units as they move and leave"""
+        units = scatter(500)
+        grid = SpatialGrid(10.0, units)
+        rand = random.Random(3)
+
+        for unit in units[:200]:
+            grid.move(unit, rand.uniform(0, 500), rand.uniform(0, 500))
+        for unit in units[:50]:
+            grid.remove(unit)
+
+        assert len(grid) == 450 and units[0] not in grid, "Removed units should be gone"
+        assert set(grid.within(250.0, 250.0, 100.0)) == brute_within(units[50:], 250.0, 250.0, 100.0), \
+            "Queries should see the new positions"
+        with pytest.raises(ValueError):
+            grid.add(units[60])
+
+    def test_bounds_shrink_after_removals(self):
+        """Test that removing or moving the outermost unit shrinks the searched area"""
+        units = scatter(50, size=20.0)
+        grid = SpatialGrid(1.0, units)
+        bounds = grid._occupied_bounds()
+        far = Character("Far", 100, 1, 1, 5000.0, 5000.0)
+
+        grid.add(far)
+        assert grid._occupied_bounds()[2:] == (5000, 5000), "Bounds should grow to the far unit"
+        grid.remove(far)
+        assert grid._occupied_bounds() == bounds, "Bounds should shrink once it leaves"
+
+        grid.add(far)
+        grid.move(far, 10.0, 10.0)
+        assert grid._occupied_bounds() == bounds, "Moving back in should shrink the bounds too"
+        assert grid.nearest(1.0, 1.0, where=lambda unit: False) is None, "Nothing should match"
+
+    def test_sparse_map_nearest(self):
+        """Test nearest queries on a few units spread over a huge map of tiny cells"""
+        units = scatter(20, size=10000.0)
+        grid = SpatialGrid(1.0, units)
+
+        for x, y in [(3000.0, 3000.0), (-8000.0, 20000.0), (5000.0, 5000.0)]:
+            distance = lambda unit: (unit.x - x) ** 2 + (unit.y - y) ** 2
+            assert distance(grid.nearest(x, y)) == min(map(distance, units)), "Nearest should be closest"
+
+class TestAreaAbilities:
+    """Test the multi-target special abilities"""
+
+    def test_area_fireball(self):
+        """Test that Fireball hits everyone in range except the mage"""
+        mage = Mage("M")
+        near = [Character(f"N{i}", 100, 1, 1, 1.0 + i, 0.0) for i in range(3)]
+        far = Character("Far", 100, 1, 1, 50.0, 0.0)
+        grid = SpatialGrid(5.0, [mage, *near, far])
+
+        hit = area_fireball(mage, grid, radius=5.0)
+
+        assert set(hit) == set(near), "Only units in range should be hit"
+        assert all(unit.health == 70 for unit in near) and far.health == 100, "Targets take Fireball damage"
+        assert mage.health == 80, "The mage should not hit itself"
+
+    def test_area_fireball_with_one_coordinate(self):
+        """Test that a missing coordinate is taken from the mage's position"""
+        mage = Mage("M")
+        mage.x, mage.y = 0.0, 20.0
+        target = Character("T", 100, 1, 1, 20.0, 20.0)
+        grid = SpatialGrid(5.0, [mage, target])
+
+        assert area_fireball(mage, grid, radius=2.0, x=20.0) == [target], "y should come from the mage"
+        assert area_fireball(mage, grid, radius=2.0, y=0.0) == [], "x should come from the mage"
+
+    def test_area_power_strike_removes_the_dead(self):
+        """Test that units killed by an area attack leave the grid"""
+        warrior = Warrior("W")
+        weak = Character("Weak", 10, 1, 1, 2.0, 2.0)
+        strong = Character("Strong", 100, 1, 1, -2.0, 0.0)
+        grid = SpatialGrid(5.0, [warrior, weak, strong])
+
+        area_power_strike(warrior, grid, radius=4.0)
+
+        assert weak not in grid and strong in grid, "Only the dead should be removed"
+        assert strong.health == 70, "Power Strike should deal strength * 2"
+        with pytest.raises(TypeError):
+            area_fireball(Rogue("R"), grid, radius=4.0)
@@ -0,0 +1,66 @@
+from project2_starter import Character, Warrior, Mage, Rogue, Weapon
+from roster import CharacterRoster
+
+class TestStatsText:
+    """Test the cached display_stats text"""
+
+    def test_same_output_as_before(self, capsys):
+        """Test that display_stats prints the same lines as always"""
+        Character("Dummy", 50, 8, 3).display_stats()
+        Mage("Aria").display_stats()
+
+        assert capsys.readouterr().out == (
+            "Dummy: Health=50, Strength=8, Magic=3\n"
+            "Aria: Health=80, Strength=8, Magic=20\n"
+            "  Class: Mage, Level: 1, Experience: 0\n"), "Output should not change"
+
+    def test_player_display_extends_parent(self, monkeypatch, capsys):
+        """Test that Player.display_stats prints its line after calling the parent's"""
+        calls = []
+        parent = Character.display_stats
+        monkeypatch.setattr(Character, "display_stats", lambda self: (calls.append(self), parent(self)))
+        mage = Mage("Aria")
+
+        mage.display_stats()
+
+        assert calls == [mage], "Player.display_stats should call Character.display_stats"
+        assert capsys.readouterr().out.splitlines()[1] == "  Class: Mage, Level: 1, Experience: 0", \
+            "The player line should follow the parent's"
+
+    def test_unchanged_character_reuses_text(self):
+        """Test that the same string object comes back while nothing changes"""
+        warrior = Warrior("W")
+        first = warrior.stats_text()
+
+        warrior.equip(Weapon("Sword", 10))  # not shown, so no redraw needed
+
+        assert warrior.stats_text() is first, "Cached text should be reused"
+
+    def test_every_shown_field_invalidates(self):
+        """Test that changing any displayed value gives new text"""
+        rogue = Rogue("R")
+        changes = [
+            lambda: rogue.take_damage(5),
+            lambda: setattr(rogue, "strength", 20),
+            lambda: setattr(rogue, "magic", 1),
+            lambda: setattr(rogue, "level", 2),
+            lambda: setattr(rogue, "experience", 150),
+            lambda: setattr(rogue, "character_class", "Assassin"),
+            lambda: setattr(rogue, "name", "Shade"),
+        ]
+        for change in changes:
+            before = rogue.stats_text()
+            change()
+            assert rogue.stats_text() != before, "Text should change with the stats"
+
+        assert rogue.stats_text() == ("Shade: Health=85, Strength=20, Magic=1\n"
+                                      "  Class: Assassin, Level: 2, Experience: 150"), "Text should show the new values"
+
+    def test_roster_views_always_fresh(self):
+        """Test that roster views render from the columns every time"""
+        roster = CharacterRoster([Warrior("W")])
+        before = roster[0].stats_text()
+        roster.column("health")[0] = 1
+
+        assert roster[0].stats_text() != before and "Health=1," in roster[0].stats_text(), \
+            "Views should see column writes"
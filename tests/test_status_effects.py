@@ -0,0 +1,90 @@
+from project2_starter import Character, Warrior, Mage, Rogue
+from battle_engine import ListSink, AttackEvent
+from status_effects import StatusEffects, BURN, BLEED, STUN
+from timeline import TimelineBattle
+from rng import BlockRNG
+
+class TestStatusEffects:
+    """Test the effect table and its batched tick"""
+
+    def test_damage_over_time(self):
+        """Test that burn and bleed deal damage every tick until they run out"""
+        target = Character("T", 100, 0, 0)
+        effects = StatusEffects()
+        effects.apply(target, BURN, 3, 5)
+        effects.apply(target, BLEED, 2, 3)
+
+        hits = [effects.tick() for _ in range(4)]
+
+        assert hits[0] == [(target, 8)], "Both effects should hit in one combined take_damage"
+        assert target.health == 100 - 8 - 8 - 5, "Bleed lasts 2 ticks and burn 3"
+        assert hits[3] == [] and len(effects) == 0, "Finished effects should be dropped"
+
+    def test_burn_refreshes_and_bleed_stacks(self):
+        """Test stacking rules"""
+        target = Character("T", 1000, 0, 0)
+        effects = StatusEffects()
+        effects.apply(target, BURN, 2, 5)
+        effects.apply(target, BURN, 4, 3)
+        effects.apply(target, BLEED, 2, 3)
+        effects.apply(target, BLEED, 2, 3)
+
+        assert sorted(effects.effects_on(target)) == [("bleed", 3, 2), ("bleed", 3, 2), ("burn", 5, 4)], \
+            "Burn should refresh to the stronger damage and longer duration; bleeds stack"
+
+    def test_clamp_and_dead_targets(self):
+        """Test that damage clamps at 0 and dead targets lose their effects"""
+        target = Character("T", 4, 0, 0)
+        effects = StatusEffects()
+        effects.apply(target, BLEED, 5, 10)
+
+        assert effects.tick() == [(target, 4)], "Only the remaining health can be lost"
+        assert target.health == 0 and len(effects) == 0, "Effects on the dead should be removed"
+
+    def test_stun_wears_off(self):
+        """Test that a stun lasts for its duration"""
+        target = Character("T", 10, 0, 0)
+        effects = StatusEffects()
+        effects.apply(target, STUN, 2)
+
+        assert effects.is_stunned(target), "Target should be stunned"
+        effects.tick()
+        assert effects.is_stunned(target), "Still stunned after one tick"
+        effects.tick()
+        assert not effects.is_stunned(target), "Stun should wear off after two ticks"
+
+    def test_many_effects(self):
+        """Test a large table in one tick"""
+        targets = [Character(f"T{i}", 50, 0, 0) for i in range(20000)]
+        effects = StatusEffects()
+        for target in targets:
+            effects.apply(target, BLEED, 3, 2)
+            effects.apply(target, BURN, 3, 1)
+
+        effects.tick()
+
+        assert all(target.health == 47 for target in targets), "Every target should take 3 damage"
+
+class TestEffectsInBattle:
+    """Test effects on the timeline"""
+
+    def test_fireball_burns(self):
+        """Test that Fireball leaves a burn that keeps dealing damage"""
+        dummy = Character("Dummy", 10 ** 6, 0, 0)
+        effects = StatusEffects()
+
+        TimelineBattle([Mage("M")], [dummy], max_time=260, effects=effects).run()
+
+        assert effects.effects_on(dummy) == [("burn", 5, 3)], "Fireball at tick 250 should leave a burn"
+
+    def test_power_strike_stuns(self):
+        """Test that a stunned rogue loses turns"""
+        def rogue_attacks(effects):
+            sink = ListSink()
+            warrior, rogue = Warrior("W"), Rogue("R")
+            warrior.health = rogue.health = 10 ** 6
+            TimelineBattle([warrior], [rogue], sink=sink, rng=BlockRNG(2), max_time=2000,
+                           effects=effects).run()
+            return sum(1 for event in sink.events if type(event) is AttackEvent and event.attacker == "R")
+
+        assert rogue_attacks(StatusEffects()) < rogue_attacks(None), "Stuns should cost the rogue turns"
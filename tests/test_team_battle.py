@@ -0,0 +1,94 @@
+from project2_starter import Character, Warrior, Mage, Rogue
+from battle_engine import ListSink, AttackEvent, ResultEvent
+from team_battle import TeamBattle, LowestHealth, HighestThreat, RandomTarget
+from rng import BlockRNG
+
+def party(size, prefix):
+    """A mixed party of warriors, mages and rogues"""
+    classes = [Warrior, Mage, Rogue]
+    return [classes[i % 3](f"{prefix}{i}") for i in range(size)]
+
+class TestTargetPolicies:
+    """Test that policies pick the right target as health changes"""
+
+    def test_lowest_health_follows_updates(self):
+        """Test that damaged units become the target once update() is called"""
+        units = [Character(f"C{i}", 100, 1, 1) for i in range(5)]
+        policy = LowestHealth(units)
+
+        units[3].take_damage(40)
+        policy.update(units[3])
+        assert policy.pick(None, None) is units[3], "Most damaged unit should be picked"
+
+        units[3].take_damage(100)
+        policy.update(units[3])
+        assert policy.pick(None, None) is units[0], "Dead units should never be picked"
+
+    def test_highest_threat(self):
+        """Test that the hardest hitter is targeted first"""
+        units = [Rogue("R"), Warrior("W"), Mage("M")]
+        policy = HighestThreat(units)
+
+        assert policy.pick(None, None) is units[1], "Warrior hits hardest (20, ties go to the first)"
+        units[1].take_damage(200)
+        policy.update(units[1])
+        assert policy.pick(None, None) is units[2], "Mage is next (20 magic)"
+
+    def test_unchanged_keys_are_not_pushed(self):
+        """Test that update() only adds a heap entry when the unit's key changed"""
+        units = party(200, "U")
+        policy = HighestThreat(units)
+
+        for _ in range(50):
+            for unit in units:
+                unit.take_damage(1)
+                policy.update(unit)
+
+        assert len(policy._heap) == len(units), "Taking damage doesn't change threat, so nothing is pushed"
+        assert policy.pick(None, None) is units[0], "Picking should still work"
+
+    def test_random_target_skips_the_dead(self):
+        """Test that random targeting only returns living units"""
+        units = [Character(f"C{i}", 10, 1, 1) for i in range(10)]
+        policy = RandomTarget(units)
+        for unit in units[:9]:
+            unit.take_damage(10)
+            policy.update(unit)
+
+        rng = BlockRNG(1)
+        assert {policy.pick(None, rng) for _ in range(20)} == {units[9]}, "Only the survivor can be picked"
+
+class TestTeamBattle:
+    """Test N-vs-M battles"""
+
+    def test_bigger_team_wins(self):
+        """Test that a battle runs to a wipe-out and reports survivors"""
+        team1, team2 = party(30, "A"), party(10, "B")
+
+        report = TeamBattle(team1, team2, rng=BlockRNG(2)).run()
+
+        assert report.winner == 1, "Three times the units should win"
+        assert report.survivors2 == [] and report.survivors1, "Team 2 should be wiped out"
+        assert all(unit.health == 0 for unit in team2), "Every loser should be at 0 health"
+
+    def test_focus_fire_with_lowest_health(self):
+        """Test that lowest-health targeting keeps hitting the same unit"""
+        sink = ListSink()
+        team2 = [Character(f"D{i}", 1000, 0, 0) for i in range(5)]
+
+        TeamBattle([Warrior("W1"), Warrior("W2")], team2, sink=sink, max_rounds=3).run()
+
+        targets = {event.target for event in sink.events
+                   if type(event) is AttackEvent and event.attacker.startswith("W")}
+        assert targets == {"D0"}, "Both warriors should focus the same dummy"
+        assert type(sink.events[-1]) is ResultEvent and sink.events[-1].winner == "Team 2", \
+            "Dummies keep more total health"
+
+    def test_seeded_battles_repeat(self):
+        """Test that a seeded random-target battle is reproducible"""
+        def run(seed):
+            team1, team2 = party(12, "A"), party(12, "B")
+            TeamBattle(team1, team2, RandomTarget, RandomTarget, rng=BlockRNG(seed)).run()
+            return [unit.health for unit in team1 + team2]
+
+        assert run(7) == run(7), "Same seed should give the same battle"
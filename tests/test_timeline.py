@@ -0,0 +1,98 @@
+import copy
+
+from project2_starter import Character, Warrior, Mage, Rogue
+from battle_engine import ListSink, AttackEvent
+from roster import CharacterRoster
+from timeline import Timeline, TimelineBattle, TURN, turn_delay
+from rng import BlockRNG
+
+class TestSpeed:
+    """Test the speed stat"""
+
+    def test_class_speeds(self):
+        """Test that rogues are fastest and warriors slowest"""
+        assert Rogue("R").speed > Mage("M").speed > Warrior("W").speed, "Speeds should differ by class"
+        assert turn_delay(Mage("M")) == 100, "Speed 10 should act every 100 ticks"
+
+    def test_speed_is_only_stored_when_changed(self):
+        """Test that speed reads the class default until a character changes it"""
+        rogue, warrior = Rogue("R"), Warrior("W")
+        warrior.speed = 12
+
+        assert rogue.speed == Rogue.BASE_SPEED and rogue._overrides is None, "Default speed should cost nothing"
+        assert warrior.speed == 12 and warrior.fork().speed == 12, "Changed speed should be kept and copied"
+        assert Warrior("W2").speed == Warrior.BASE_SPEED, "Other warriors should keep the class speed"
+
+    def test_copies_keep_their_own_overrides(self):
+        """Test that copy.copy doesn't share speed or position changes"""
+        original = Warrior("W")
+        original.speed = 12
+        duplicate = copy.copy(original)
+
+        duplicate.speed = 15
+        duplicate.x = 3.0
+
+        assert (original.speed, original.x) == (12, 0.0), "Changing the copy should leave the original alone"
+        assert (duplicate.speed, duplicate.x) == (15, 3.0), "The copy should keep its own changes"
+
+    def test_roster_views_have_speed(self):
+        """Test that roster views default to their class speed and can change it"""
+        roster = CharacterRoster([Rogue("R"), Warrior("W")])
+        roster[1].speed = 20
+
+        assert roster[0].speed == Rogue.BASE_SPEED, "Views should default to the class speed"
+        assert roster[1].speed == 20, "Speed changes should be kept"
+
+class TestTimeline:
+    """Test the event heap"""
+
+    def test_events_come_out_in_time_order(self):
+        """Test ordering, with ties broken by scheduling order"""
+        timeline = Timeline()
+        a, b, c = Character("A", 1, 1, 1), Character("B", 1, 1, 1), Character("C", 1, 1, 1)
+        timeline.schedule(50, TURN, a)
+        timeline.schedule(10, TURN, b)
+        timeline.schedule(50, TURN, c)
+
+        order = [timeline.pop()[1] for _ in range(3)]
+
+        assert order == [b, a, c], "Earliest first, then first scheduled"
+        assert timeline.now == 50, "Clock should move to the last event"
+
+class TestTimelineBattle:
+    """Test timeline-driven battles"""
+
+    def test_faster_character_acts_more(self):
+        """Test that a fast rogue gets more turns than a slow warrior"""
+        sink = ListSink()
+        warrior, rogue = Warrior("W"), Rogue("R")
+        rogue.health = warrior.health = 10 ** 6
+
+        TimelineBattle([warrior], [rogue], sink=sink, rng=BlockRNG(1), max_time=10_000).run()
+
+        attacks = [event.attacker for event in sink.events if type(event) is AttackEvent]
+        assert attacks.count("R") > 1.5 * attacks.count("W"), "Speed 14 should act far more than speed 8"
+
+    def test_cast_time_and_cooldown(self):
+        """Test that Fireball lands after its cast time and then waits for its cooldown"""
+        sink = ListSink()
+        mage = Mage("M")
+        dummy = Character("Dummy", 10 ** 6, 0, 0)
+
+        TimelineBattle([mage], [dummy], sink=sink, max_time=1000).run()
+
+        fireballs = [event.round for event in sink.events
+                     if type(event) is AttackEvent and event.damage == 30]
+        assert fireballs[0] == 250, "First turn at 100 plus 150 ticks of casting"
+        assert fireballs[1] - fireballs[0] >= 400 - 150, "Fireball should respect its cooldown"
+
+    def test_team_fight_finishes(self):
+        """Test a large mixed battle runs to a winner"""
+        classes = [Warrior, Mage, Rogue]
+        team1 = [classes[i % 3](f"A{i}") for i in range(150)]
+        team2 = [classes[i % 3](f"B{i}") for i in range(100)]
+
+        report = TimelineBattle(team1, team2, rng=BlockRNG(4)).run()
+
+        assert report.winner == 1 and report.survivors2 == [], "The bigger team should wipe the other out"
+        assert report.actions > 250, "Everyone should have acted"
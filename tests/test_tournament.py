@@ -0,0 +1,92 @@
+import multiprocessing
+
+import pytest
+from project2_starter import Character, Warrior, Mage, Rogue, Weapon
+from tournament import Tournament, round_robin_schedule
+
+def make_entrants(count):
+    """Build a mixed field of entrants"""
+    classes = [Warrior, Mage, Rogue]
+    return [classes[i % 3](f"Entrant{i}") for i in range(count)]
+
+class TestSchedule:
+    """Test the round-robin schedule"""
+
+    @pytest.mark.parametrize("count", [2, 5, 8])
+    def test_everyone_meets_once(self, count):
+        """Test that every pair meets exactly once and nobody plays twice a round"""
+        rounds = round_robin_schedule(count)
+
+        pairs = [frozenset(pair) for matches in rounds for pair in matches]
+        assert len(pairs) == count * (count - 1) // 2, "Every pair should be scheduled"
+        assert len(set(pairs)) == len(pairs), "No pair should meet twice"
+        for matches in rounds:
+            players = [p for pair in matches for p in pair]
+            assert len(players) == len(set(players)), "Nobody should play twice in a round"
+
+class TestTournament:
+    """Test running tournaments"""
+
+    def test_entrants_are_not_damaged(self):
+        """Test that matches use fresh copies of the entrants"""
+        entrants = make_entrants(4)
+        for _ in Tournament(entrants).round_robin():
+            pass
+
+        assert [e.health for e in entrants] == [120, 80, 90, 120], "Entrants should keep full health"
+
+    def test_round_robin_standings(self):
+        """Test that standings build up round by round"""
+        entrants = [Warrior("W"), Mage("M"), Character("Dummy", 10, 0, 0)]
+        rounds = list(Tournament(entrants).round_robin())
+
+        assert len(rounds) == 3, "Three entrants need three rounds"
+        final = rounds[-1][1]
+        assert final[0].entrant == 0 and final[0].wins == 2, "Warrior should win everything"
+        assert final[-1].entrant == 2 and final[-1].losses == 2, "Dummy should lose everything"
+        played = [sum(s.wins + s.losses + s.ties for s in standings) for _, standings in rounds]
+        assert played == sorted(played), "Standings should grow every round"
+
+    def test_elimination_bracket(self):
+        """Test single elimination with a bye"""
+        entrants = [Mage("M"), Warrior("W"), Character("Dummy", 10, 0, 0)]
+        tournament = Tournament(entrants)
+        rounds = list(tournament.elimination())
+
+        assert [remaining for _, remaining in rounds] == [[1, 2], [1]], "Warrior should beat the mage, then the dummy"
+        assert tournament.champion() == 1, "Warrior should be champion"
+
+    def test_champion_of_tiny_fields(self):
+        """Test that a lone entrant wins outright and an empty field is an error"""
+        assert Tournament([Warrior("Solo")]).champion() == 0, "A single entrant should be champion"
+        with pytest.raises(ValueError):
+            Tournament([]).champion()
+
+    def test_reproducible_and_parallel(self):
+        """Test that a process pool gives the same results as running inline"""
+        entrants = make_entrants(9)
+        serial = [results for results, _ in Tournament(entrants, seed=3).round_robin()]
+        with Tournament(entrants, seed=3, workers=2) as tournament:
+            parallel = [results for results, _ in tournament.round_robin()]
+
+        assert serial == parallel, "Worker count should not change results"
+
+    @pytest.mark.skipif("forkserver" not in multiprocessing.get_all_start_methods(),
+                        reason="forkserver is not available")
+    def test_pool_with_armed_entrants_without_fork(self):
+        """Test that entrants holding weapons can be sent to forkserver workers"""
+        entrants = make_entrants(4)
+        entrants[0].equip(Weapon("Iron Sword", 10))
+        serial = [results for results, _ in Tournament(entrants, seed=4).round_robin()]
+        with Tournament(entrants, seed=4, workers=2,
+                        mp_context=multiprocessing.get_context("forkserver")) as tournament:
+            parallel = [results for results, _ in tournament.round_robin()]
+
+        assert serial == parallel, "Pickled entrants should give the same results"
+
+    def test_large_elimination(self):
+        """Test that a big bracket finishes quickly and leaves one champion"""
+        rounds = list(Tournament(make_entrants(1024)).elimination())
+
+        assert len(rounds) == 10, "1024 entrants need ten rounds"
+        assert len(rounds[-1][1]) == 1, "One champion should remain"
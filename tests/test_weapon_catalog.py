@@ -0,0 +1,92 @@
+import copy
+import pickle
+
+import pytest
+from project2_starter import Warrior, Weapon
+from weapon_catalog import WeaponCatalog, weapon
+
+class Relic(Weapon):
+    """Weapon subclass for the pickling tests (module level so pickle can find it)"""
+    __slots__ = ()
+
+class TestWeaponCatalog:
+    """Test the interned weapon catalog"""
+
+    def test_same_definition_is_shared(self):
+        """Test that equal weapons come back as one shared object"""
+        catalog = WeaponCatalog()
+
+        assert catalog.get("Iron Sword", 10) is catalog.get("Iron Sword", 10), "Same weapon should be shared"
+        assert catalog.get("Iron Sword", 10) is not catalog.get("Iron Sword", 12), "Different bonus is a different weapon"
+        assert len(catalog) == 2, "Catalog should hold one entry per distinct weapon"
+
+    def test_memory_scales_with_weapon_types(self):
+        """Test that many holders share a handful of weapons"""
+        catalog = WeaponCatalog()
+        warriors = [Warrior(f"W{i}") for i in range(1000)]
+        for i, warrior in enumerate(warriors):
+            warrior.equip(catalog.get("Iron Sword" if i % 2 else "War Hammer", 10 if i % 2 else 20))
+
+        assert len({id(w.weapon) for w in warriors}) == 2, "Only two weapon objects should exist"
+        assert len(catalog) == 2, "Catalog should only hold two weapons"
+
+    def test_intern_existing_weapon(self):
+        """Test interning weapons created elsewhere"""
+        catalog = WeaponCatalog([Weapon("Steel Dagger", 8)])
+        shared = catalog.lookup("Steel Dagger")
+
+        assert catalog.intern(Weapon("Steel Dagger", 8)) is shared, "Equal weapon should intern to the shared one"
+
+    def test_lookup_by_name(self):
+        """Test finding weapons by name"""
+        catalog = WeaponCatalog()
+        catalog.get("Magic Staff", 15)
+        catalog.get("Bow", 5)
+        catalog.get("Bow", 9)
+
+        assert catalog.lookup("Magic Staff").damage_bonus == 15, "Lookup should find the staff"
+        assert "Bow" in catalog and "Axe" not in catalog, "Membership should use names"
+        assert sorted(w.damage_bonus for w in catalog.variants("Bow")) == [5, 9], "Variants should list every bow"
+        with pytest.raises(ValueError):
+            catalog.lookup("Bow")
+        with pytest.raises(KeyError):
+            catalog.lookup("Axe")
+
+    def test_default_catalog(self):
+        """Test the module-level helper"""
+        assert weapon("Dragon Slayer", 25) is weapon("Dragon Slayer", 25), "Default catalog should share weapons"
+
+class TestImmutableWeapons:
+    """Test that shared weapons can't be changed"""
+
+    def test_weapons_are_read_only(self):
+        """Test that a weapon's fields can't be reassigned"""
+        sword = Weapon("Iron Sword", 10)
+
+        with pytest.raises(AttributeError):
+            sword.damage_bonus = 99
+        assert sword.damage_bonus == 10, "Bonus should be unchanged"
+
+    def test_weapons_compare_by_value(self):
+        """Test equality and hashing by (name, damage_bonus)"""
+        assert Weapon("Axe", 7) == Weapon("Axe", 7), "Equal weapons should compare equal"
+        assert len({Weapon("Axe", 7), Weapon("Axe", 7), Weapon("Axe", 8)}) == 2, "Hashing should follow equality"
+
+    def test_weapons_pickle_and_copy(self):
+        """Test that weapons (and players holding them) survive pickle and copy"""
+        sword = Weapon("Iron Sword", 10)
+        warrior = Warrior("W")
+        warrior.equip(sword)
+
+        assert pickle.loads(pickle.dumps(sword)) == sword, "Unpickled weapon should be equal"
+        assert copy.copy(sword) == sword and copy.deepcopy(sword) == sword, "Copies should be equal"
+        clone = pickle.loads(pickle.dumps(warrior))
+        assert clone.weapon == sword and clone.attack_damage == warrior.attack_damage, \
+            "Armed warrior should round-trip through pickle"
+
+    def test_weapon_subclasses_keep_their_type(self):
+        """Test that pickling and copying a Weapon subclass doesn't turn it into a plain Weapon"""
+        relic = Relic("Old Blade", 4)
+
+        assert type(copy.copy(relic)) is Relic, "Copies should keep the subclass"
+        assert type(pickle.loads(pickle.dumps(relic))) is Relic, "Pickling should keep the subclass"
@@ -0,0 +1,203 @@
+"""
+Initiative timeline.
+
+Instead of fixed rounds where char1 always goes first, every action is an
+event on a timeline (a heap ordered by time). A character with speed s
+acts every TURN_TICKS // s ticks, so a speed 14 Rogue gets almost twice
+as many turns as a speed 8 Warrior. Special abilities have a cooldown and
+may have a cast time; a cast is just another event on the same heap, so
+choosing who acts next is O(log n) however many units are fighting.
+
+Events for characters that have died are not removed from the heap; they
+are skipped when they come up.
+
+With a StatusEffects table, special abilities also leave an effect on
+their target (Fireball burns, Sneak Attack bleeds, Power Strike stuns),
+every effect is processed in one batched tick every EFFECT_TICKS ticks,
+and stunned characters lose their turns.
+"""
+
+import heapq
+import random
+from collections import namedtuple
+from itertools import count
+
+from project2_starter import Warrior, Mage, Rogue
+from battle_engine import AttackEvent, DamageEvent, stats_event, strike
+from status_effects import BURN, BLEED, STUN
+from team_battle import LowestHealth, TeamBattle
+
+# Ticks per turn at speed 1: a speed 10 character acts every 100 ticks.
+TURN_TICKS = 1000
+
+# Ticks between two status-effect ticks.
+EFFECT_TICKS = 100
+
+# Event kinds on the timeline.
+TURN = 0
+CAST = 1
+EFFECTS = 2
+
+# name of the ability method, ticks to cast it, ticks before it can be used
+# again, and the (effect kind, duration, damage per tick) it leaves behind
+Ability = namedtuple("Ability", "name cast_time cooldown effect")
+
+ABILITIES = {
+    Warrior: Ability("power_strike", 0, 300, (STUN, 1, 0)),
+    Mage: Ability("fireball", 150, 400, (BURN, 3, 5)),
+    Rogue: Ability("sneak_attack", 0, 500, (BLEED, 4, 3)),
+}
+
+TimelineReport = namedtuple("TimelineReport", "time actions winner survivors1 survivors2")
+
+
+def ability_of(cls):
+    """Return the Ability for a class (subclasses and roster views share it), or None"""
+    for base in cls.__mro__:
+        ability = ABILITIES.get(base)
+        if ability is not None:
+            return ability
+    return None
+
+
+def turn_delay(character):
+    """Ticks until a character acts again"""
+    return max(1, TURN_TICKS // max(1, character.speed))
+
+
+class Timeline:
+    """
+    Heap of (time, sequence, kind, character) events.
+    Events at the same time come out in the order they were scheduled.
+    """
+
+    def __init__(self):
+        self.now = 0
+        self._heap = []
+        self._sequence = count()
+
+    def __len__(self):
+        return len(self._heap)
+
+    def schedule(self, delay, kind, character):
+        """Add an event `delay` ticks from now"""
+        heapq.heappush(self._heap, (self.now + delay, next(self._sequence), kind, character))
+
+    def pop(self):
+        """Remove the next event, move the clock to it and return (kind, character)"""
+        time, _, kind, character = heapq.heappop(self._heap)
+        self.now = time
+        return kind, character
+
+
+def cast(caster, target, time, emit):
+    """
+    Resolve a special ability silently (like battle_engine.strike does for
+    attacks). Returns the health the target actually lost.
+    """
+    damage = caster.special_damage
+    before = target.health
+    target.take_damage(damage)
+    lost = before - target.health
+    if emit is not None:
+        emit(AttackEvent(time, caster.name, target.name, damage, False))
+        emit(DamageEvent(time, target.name, lost, target.health))
+    return lost
+
+
+class TimelineBattle(TeamBattle):
+    """
+    Team battle driven by the timeline instead of rounds.
+
+    Characters use their special ability whenever it is off cooldown and
+    attack normally otherwise. A 1-vs-1 fight is TimelineBattle([a], [b]).
+    Pass a StatusEffects table as `effects` to turn on status effects.
+    The `round` field of the AttackEvent/DamageEvent records holds the
+    timeline tick.
+    """
+
+    def __init__(self, team1, team2, target1=LowestHealth, target2=LowestHealth,
+                 sink=None, rng=random, max_time=100_000, team_names=("Team 1", "Team 2"),
+                 effects=None):
+        super().__init__(team1, team2, target1, target2, sink, rng, None, team_names)
+        self.max_time = max_time
+        self.effects = effects
+
+    def run(self):
+        """Play events until one team is wiped out or max_time passes. Returns a TimelineReport"""
+        emit = self.sink.emit if self.sink is not None else None
+        rng = self.rng
+        effects = self.effects
+        targets = {}          # unit -> policy that picks its targets
+        pickers = [None, None]  # team number -> policy that picks from that team
+        alive = [0, 0]        # living units per team
+        team_of = {}
+        timeline = Timeline()
+        for team_number, (team, enemies, policy) in enumerate(
+                ((self.team1, self.team2, self.target1), (self.team2, self.team1, self.target2))):
+            enemy_targets = pickers[1 - team_number] = policy(enemies)
+            for unit in team:
+                team_of[unit] = team_number
+                targets[unit] = enemy_targets
+                if unit.health > 0:
+                    alive[team_number] += 1
+                    timeline.schedule(turn_delay(unit), TURN, unit)
+        if effects is not None:
+            timeline.schedule(EFFECT_TICKS, EFFECTS, None)
+        ready_at = {}
+        actions = 0
+
+        if emit is not None:
+            for unit in self.team1 + self.team2:
+                emit(stats_event("start", unit))
+
+        while alive[0] and alive[1] and timeline:
+            kind, actor = timeline.pop()
+            if timeline.now > self.max_time:
+                break
+            if kind == EFFECTS:
+                for target, lost in effects.tick():
+                    team_number = team_of.get(target)
+                    if team_number is None:
+                        continue  # not fighting in this battle
+                    pickers[team_number].update(target)
+                    if lost and target.health <= 0:
+                        alive[team_number] -= 1
+                timeline.schedule(EFFECT_TICKS, EFFECTS, None)
+                continue
+            if actor.health <= 0:
+                continue  # died before its turn came up (or during its cast)
+            now = timeline.now
+            if kind == TURN and effects is not None and effects.is_stunned(actor):
+                timeline.schedule(turn_delay(actor), TURN, actor)
+                continue
+            ability = ability_of(type(actor)) if kind == TURN else None
+            if ability is not None and ready_at.get(actor, 0) <= now:
+                ready_at[actor] = now + ability.cooldown
+                if ability.cast_time:
+                    timeline.schedule(ability.cast_time, CAST, actor)
+                    continue
+                kind = CAST
+            target = targets[actor].pick(actor, rng)
+            if target is None:
+                break
+            if kind == CAST:
+                cast(actor, target, now, emit)
+                ability = ability_of(type(actor))
+                if effects is not None and ability.effect is not None and target.health > 0:
+                    effects.apply(target, *ability.effect)
+            else:
+                strike(actor, target, now, emit, rng)
+            actions += 1
+            targets[actor].update(target)
+            if target.health <= 0:
+                alive[team_of[target]] -= 1
+            timeline.schedule(turn_delay(actor), TURN, actor)
+
+        if emit is not None:
+            for unit in self.team1 + self.team2:
+                emit(stats_event("end", unit))
+        survivors1 = [unit for unit in self.team1 if unit.health > 0]
+        survivors2 = [unit for unit in self.team2 if unit.health > 0]
+        winner = self.report_result(survivors1, survivors2, emit)
+        return TimelineReport(timeline.now, actions, winner, survivors1, survivors2)
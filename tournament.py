@@ -0,0 +1,179 @@
+"""
+Tournament engine.
+
+Runs round-robin and single-elimination tournaments between Player
+characters. Every match is a MultiRoundBattle between fresh copies of the
+two entrants (the entrants themselves are never damaged), with its own
+RNG seeded from (seed, round, entrants) so results are reproducible. The
+matches inside a round don't depend on each other, so they can be spread
+over a process pool; standings are produced round by round as the
+tournament goes.
+"""
+
+import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from battle_engine import MultiRoundBattle
+from rng import BlockRNG
+
+MatchResult = namedtuple("MatchResult", "round first second winner")
+Standing = namedtuple("Standing", "entrant wins losses ties points")
+
+# Points for a win and a tie in round-robin standings.
+WIN_POINTS = 3
+TIE_POINTS = 1
+
+
+def fresh_copy(character):
+    """Return an undamaged copy of a character for one match (see Character.fork)"""
+    return character.fork()
+
+
+# Entrants for the current worker process, set once by _init_worker so they
+# are pickled once per worker instead of once per match.
+_worker_entrants = None
+
+
+def _init_worker(entrants):
+    global _worker_entrants
+    _worker_entrants = entrants
+
+
+def _play_indexed(job, entrants=None):
+    """
+    Play one match between entrants given by index. Returns the winner's
+    index, or None for a tie.
+    """
+    if entrants is None:
+        entrants = _worker_entrants
+    first, second, seed, round_number, max_rounds = job
+    rng = BlockRNG(f"{seed}:{round_number}:{first}:{second}")
+    char1 = fresh_copy(entrants[first])
+    char2 = fresh_copy(entrants[second])
+    winner = MultiRoundBattle(char1, char2, None, rng, max_rounds).fight()
+    if winner is char1:
+        return first
+    if winner is char2:
+        return second
+    return None
+
+
+def round_robin_schedule(count):
+    """
+    Return the rounds of a round-robin for `count` entrants (circle method).
+    Each round is a list of (first, second) index pairs; with an odd count
+    one entrant sits out each round.
+    """
+    slots = list(range(count))
+    if count % 2:
+        slots.append(None)
+    rounds = []
+    for _ in range(len(slots) - 1):
+        half = len(slots) // 2
+        pairs = [(slots[i], slots[-1 - i]) for i in range(half)]
+        rounds.append([pair for pair in pairs if None not in pair])
+        # Keep the first slot fixed and rotate the rest.
+        slots = [slots[0], slots[-1]] + slots[1:-1]
+    return rounds
+
+
+class Tournament:
+    """
+    Runs tournaments between a list of entrants (Player instances).
+
+    With workers=1 matches run in this process; otherwise each round's
+    matches are spread over a ProcessPoolExecutor with `workers`
+    processes (None means one per CPU). `mp_context` picks the
+    multiprocessing start method for the pool (the platform default if None).
+    """
+
+    def __init__(self, entrants, seed=0, max_rounds=100, workers=1, mp_context=None):
+        self.entrants = list(entrants)
+        self.seed = seed
+        self.max_rounds = max_rounds
+        self.workers = workers
+        self.mp_context = mp_context
+        self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Shut down the process pool, if one was started"""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def _play_round(self, round_number, pairs):
+        jobs = [(first, second, self.seed, round_number, self.max_rounds)
+                for first, second in pairs]
+        if self.workers == 1:
+            winners = [_play_indexed(job, self.entrants) for job in jobs]
+        else:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(self.workers, self.mp_context,
+                                                 initializer=_init_worker,
+                                                 initargs=(self.entrants,))
+            workers = self.workers or os.cpu_count() or 1
+            chunksize = max(1, len(jobs) // (4 * workers))
+            winners = list(self._pool.map(_play_indexed, jobs, chunksize=chunksize))
+        return [MatchResult(round_number, first, second, winner)
+                for (first, second), winner in zip(pairs, winners)]
+
+    def round_robin(self):
+        """
+        Play everyone against everyone, one round at a time.
+        Yields (results of the round, standings so far) after every round.
+        """
+        wins = [0] * len(self.entrants)
+        losses = [0] * len(self.entrants)
+        ties = [0] * len(self.entrants)
+        for round_number, pairs in enumerate(round_robin_schedule(len(self.entrants)), 1):
+            results = self._play_round(round_number, pairs)
+            for result in results:
+                if result.winner is None:
+                    ties[result.first] += 1
+                    ties[result.second] += 1
+                else:
+                    loser = result.second if result.winner == result.first else result.first
+                    wins[result.winner] += 1
+                    losses[loser] += 1
+            yield results, self._standings(wins, losses, ties)
+
+    def _standings(self, wins, losses, ties):
+        standings = [Standing(i, wins[i], losses[i], ties[i], WIN_POINTS * wins[i] + TIE_POINTS * ties[i])
+                     for i in range(len(self.entrants))]
+        standings.sort(key=lambda s: (-s.points, -s.wins, s.entrant))
+        return standings
+
+    def elimination(self):
+        """
+        Play a single-elimination bracket in entrant order (entrant 0 meets
+        entrant 1, 2 meets 3, ...). A tie sends the earlier entrant through,
+        and an odd entrant out gets a bye. Yields (results of the round,
+        entrants still in) after every round; the last round leaves one.
+        """
+        remaining = list(range(len(self.entrants)))
+        round_number = 0
+        while len(remaining) > 1:
+            round_number += 1
+            pairs = [(remaining[i], remaining[i + 1]) for i in range(0, len(remaining) - 1, 2)]
+            results = self._play_round(round_number, pairs)
+            advancing = [r.first if r.winner is None else r.winner for r in results]
+            if len(remaining) % 2:
+                advancing.append(remaining[-1])
+            remaining = advancing
+            yield results, list(remaining)
+
+    def champion(self):
+        """Run the elimination bracket to the end and return the winning entrant's index"""
+        if not self.entrants:
+            raise ValueError("a tournament with no entrants has no champion")
+        remaining = list(range(len(self.entrants)))
+        for _, remaining in self.elimination():
+            pass
+        return remaining[0]
@@ -0,0 +1,77 @@
+"""
+Interned weapon catalog.
+
+Weapons are immutable, so there is no reason for a thousand characters
+holding an "Iron Sword" to hold a thousand separate Iron Sword objects.
+WeaponCatalog hands out one shared Weapon per (name, damage_bonus), so
+memory grows with the number of distinct weapon types rather than the
+number of characters holding them.
+"""
+
+from project2_starter import Weapon
+
+
+class WeaponCatalog:
+    """
+    Registry of shared Weapon objects, looked up by (name, damage_bonus) or by name.
+    """
+
+    def __init__(self, weapons=()):
+        self._by_key = {}
+        self._by_name = {}
+        for weapon in weapons:
+            self.intern(weapon)
+
+    def get(self, name, damage_bonus):
+        """Return the shared Weapon for (name, damage_bonus), creating it the first time"""
+        weapon = self._by_key.get((name, damage_bonus))
+        if weapon is None:
+            weapon = self._register(Weapon(name, damage_bonus))
+        return weapon
+
+    def intern(self, weapon):
+        """
+        Return the catalog's shared copy of an equal weapon, registering
+        this one if the catalog has not seen it before.
+        """
+        shared = self._by_key.get((weapon.name, weapon.damage_bonus))
+        if shared is None:
+            shared = self._register(weapon)
+        return shared
+
+    def lookup(self, name):
+        """
+        Return the weapon called name. Raises KeyError if there is none and
+        ValueError if several weapons share the name (use variants() then).
+        """
+        variants = self._by_name[name]
+        if len(variants) > 1:
+            raise ValueError(f"{len(variants)} weapons are called {name!r}")
+        return variants[0]
+
+    def variants(self, name):
+        """Return every weapon called name (an empty list if there are none)"""
+        return list(self._by_name.get(name, ()))
+
+    def __contains__(self, name):
+        return name in self._by_name
+
+    def __len__(self):
+        return len(self._by_key)
+
+    def __iter__(self):
+        return iter(self._by_key.values())
+
+    def _register(self, weapon):
+        self._by_key[(weapon.name, weapon.damage_bonus)] = weapon
+        self._by_name.setdefault(weapon.name, []).append(weapon)
+        return weapon
+
+
+# Shared default catalog, so most code can just call weapon("Iron Sword", 10).
+CATALOG = WeaponCatalog()
+
+
+def weapon(name, damage_bonus):
+    """Return the shared Weapon for (name, damage_bonus) from the default catalog"""
+    return CATALOG.get(name, damage_bonus)